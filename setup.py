@@ -6,6 +6,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         "streamlit>=1.32.0",
-        "python-Levenshtein==0.23.0",
     ],
+    extras_require={
+        "rapido": ["python-Levenshtein==0.23.0"],
+        "colunas": ["pyarrow"],
+    },
 )
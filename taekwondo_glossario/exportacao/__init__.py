@@ -0,0 +1 @@
+"""Exportação do glossário e das faixas para outros formatos."""
@@ -0,0 +1,296 @@
+"""Exporta o glossário e os currículos das faixas para um banco SQLite.
+
+O banco é autossuficiente: outras ferramentas consultam termos, categorias, faixas, as
+técnicas de cada faixa e a sequência de termos de cada técnica com SQL comum, sem
+depender deste pacote. Uma tabela virtual FTS5 indexa o texto em coreano, português e
+as descrições. As traduções de outros idiomas ficam em ``traducoes``, uma linha por termo
+e idioma, indexadas por ``traducoes_fts``; um idioma só entra no banco quando é pedido
+(``--idioma`` ou ``indexar_idioma``), e as colunas em coreano e ``termos_fts`` não são
+reconstruídas. Uso:
+
+    python -m taekwondo_glossario.exportacao.banco glossario.sqlite --idioma en
+    python -m taekwondo_glossario.exportacao.banco glossario.sqlite --idioma es --apenas-idiomas
+
+Exemplos de consulta:
+
+    SELECT t.coreano, t.portugues FROM termos_fts f JOIN termos t ON t.id = f.rowid
+    WHERE termos_fts MATCH 'chute' ORDER BY rank;
+
+    SELECT t.coreano, r.traducao FROM traducoes_fts f JOIN traducoes r ON r.id = f.rowid
+    JOIN termos t ON t.id = r.termo_id WHERE traducoes_fts MATCH 'kick' AND r.idioma = 'en';
+"""
+
+import argparse
+import os
+import sqlite3
+from typing import Dict, Optional, Sequence, Tuple
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary.idiomas import PacoteIdioma, get_pacote
+from ..glossary.registro import IndiceGlossario, get_registro, normalizar_coreano
+from ..glossary.tecnica import analisar_tecnica
+
+ESQUEMA = """
+CREATE TABLE metadados (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+CREATE TABLE categorias (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL UNIQUE
+);
+CREATE TABLE termos (
+    id INTEGER PRIMARY KEY,
+    categoria_id INTEGER NOT NULL REFERENCES categorias (id),
+    fonte TEXT NOT NULL,
+    coreano TEXT NOT NULL,
+    portugues TEXT NOT NULL,
+    descricao TEXT NOT NULL
+);
+CREATE INDEX termos_categoria ON termos (categoria_id);
+CREATE INDEX termos_coreano ON termos (coreano COLLATE NOCASE);
+CREATE TABLE faixas (
+    id INTEGER PRIMARY KEY,
+    posicao INTEGER NOT NULL UNIQUE,
+    cor TEXT NOT NULL UNIQUE,
+    nome TEXT NOT NULL
+);
+CREATE TABLE tecnicas (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL UNIQUE
+);
+CREATE TABLE faixa_tecnicas (
+    faixa_id INTEGER NOT NULL REFERENCES faixas (id),
+    tecnica_id INTEGER NOT NULL REFERENCES tecnicas (id),
+    tipo TEXT NOT NULL CHECK (tipo IN ('braco', 'chute')),
+    ordem INTEGER NOT NULL,
+    PRIMARY KEY (faixa_id, tipo, ordem)
+);
+CREATE INDEX faixa_tecnicas_tecnica ON faixa_tecnicas (tecnica_id);
+CREATE TABLE tecnica_termos (
+    tecnica_id INTEGER NOT NULL REFERENCES tecnicas (id),
+    posicao INTEGER NOT NULL,
+    termo_id INTEGER NOT NULL REFERENCES termos (id),
+    distancia REAL NOT NULL,
+    PRIMARY KEY (tecnica_id, posicao)
+);
+CREATE INDEX tecnica_termos_termo ON tecnica_termos (termo_id);
+CREATE VIRTUAL TABLE termos_fts USING fts5 (
+    coreano, portugues, descricao,
+    content = 'termos', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Separado do esquema principal para também poder ser criado em bancos exportados sem ele
+ESQUEMA_TRADUCOES = """
+CREATE TABLE IF NOT EXISTS traducoes (
+    id INTEGER PRIMARY KEY,
+    termo_id INTEGER NOT NULL REFERENCES termos (id),
+    idioma TEXT NOT NULL,
+    traducao TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    UNIQUE (idioma, termo_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS traducoes_fts USING fts5 (
+    traducao, descricao, idioma UNINDEXED,
+    content = 'traducoes', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def _gravar_idioma(conexao: sqlite3.Connection, pacote: PacoteIdioma) -> int:
+    """Grava e indexa as traduções de um pacote, sem tocar nas demais tabelas e índices.
+
+    As linhas anteriores do idioma saem do índice de texto antes de serem apagadas; só as
+    do idioma entram de novo. Retorna o número de termos traduzidos gravados.
+    """
+    conexao.execute(
+        "INSERT INTO traducoes_fts (traducoes_fts, rowid, traducao, descricao, idioma) "
+        "SELECT 'delete', id, traducao, descricao, idioma FROM traducoes WHERE idioma = ?",
+        (pacote.idioma,),
+    )
+    conexao.execute("DELETE FROM traducoes WHERE idioma = ?", (pacote.idioma,))
+
+    linhas = []
+    for id_termo, coreano, portugues, descricao in conexao.execute(
+        "SELECT id, coreano, portugues, descricao FROM termos ORDER BY id"
+    ):
+        # Termos sem tradução no pacote ficam só nas colunas em português
+        if normalizar_coreano(coreano) not in pacote.termos:
+            continue
+        termo = pacote.localizar({"coreano": coreano, "portugues": portugues, "descricao": descricao})
+        linhas.append((id_termo, pacote.idioma, termo["portugues"], termo["descricao"]))
+    conexao.executemany("INSERT INTO traducoes (termo_id, idioma, traducao, descricao) VALUES (?, ?, ?, ?)", linhas)
+    conexao.execute(
+        "INSERT INTO traducoes_fts (rowid, traducao, descricao, idioma) "
+        "SELECT id, traducao, descricao, idioma FROM traducoes WHERE idioma = ?",
+        (pacote.idioma,),
+    )
+    conexao.execute(
+        "INSERT OR REPLACE INTO metadados (chave, valor) VALUES (?, ?)",
+        (f"idioma_{pacote.idioma}", pacote.assinatura),
+    )
+    return len(linhas)
+
+
+def indexar_idioma(caminho: str, idioma: str) -> int:
+    """Acrescenta (ou atualiza) as traduções de um idioma em um banco já exportado.
+
+    Se o banco já tiver o idioma com o mesmo pacote, nada é gravado.
+
+    Args:
+        caminho: Arquivo SQLite gravado por ``exportar_banco``
+        idioma: Código do idioma (ex: ``"en"``)
+
+    Returns:
+        O número de termos traduzidos gravados (0 se o idioma já estava atualizado).
+
+    Raises:
+        ValueError: Se o idioma for o padrão ou não tiver pacote.
+    """
+    pacote = get_pacote(idioma)
+    if pacote is None:
+        raise ValueError(f"O idioma {idioma} já está nas colunas de termos")
+    if not os.path.isfile(caminho):
+        raise ValueError(f"Banco {caminho} não encontrado")
+    conexao = sqlite3.connect(caminho)
+    try:
+        conexao.executescript(ESQUEMA_TRADUCOES)
+        gravada = conexao.execute(
+            "SELECT valor FROM metadados WHERE chave = ?", (f"idioma_{pacote.idioma}",)
+        ).fetchone()
+        if gravada is not None and gravada[0] == pacote.assinatura:
+            return 0
+        with conexao:
+            return _gravar_idioma(conexao, pacote)
+    finally:
+        conexao.close()
+
+
+def exportar_banco(
+    caminho: str,
+    indice: Optional[IndiceGlossario] = None,
+    gerenciador: Optional[GerenciadorFaixas] = None,
+    max_distance: int = 2,
+    idiomas: Sequence[str] = (),
+) -> str:
+    """Grava o banco SQLite em ``caminho``.
+
+    O banco é montado em um arquivo temporário e só então substitui o anterior, para que
+    consumidores nunca vejam um banco pela metade.
+
+    Args:
+        caminho: Arquivo SQLite de destino
+        indice: Índice de glossário. Se None, usa o índice do registro global.
+        gerenciador: Catálogo de faixas. Se None, carrega o diretório padrão.
+        max_distance: Distância máxima usada na análise das técnicas
+        idiomas: Idiomas cujas traduções também são gravadas e indexadas
+
+    Returns:
+        O caminho do banco gravado.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    gerenciador = gerenciador if gerenciador is not None else GerenciadorFaixas()
+    pacotes = [pacote for pacote in (get_pacote(idioma) for idioma in idiomas) if pacote is not None]
+
+    temporario = caminho + ".tmp"
+    if os.path.exists(temporario):
+        os.remove(temporario)
+    conexao = sqlite3.connect(temporario)
+    try:
+        with conexao:
+            conexao.executescript(ESQUEMA + ESQUEMA_TRADUCOES)
+            conexao.executemany(
+                "INSERT INTO metadados (chave, valor) VALUES (?, ?)",
+                [("versao_glossario", indice.versao), ("max_distance", str(max_distance))],
+            )
+
+            # Categorias e termos; cada termo é identificado pela categoria e pela romanização
+            ids_termos: Dict[Tuple[str, str], int] = {}
+            for id_categoria, (categoria, termos) in enumerate(indice.termos_por_categoria().items(), start=1):
+                conexao.execute("INSERT INTO categorias (id, nome) VALUES (?, ?)", (id_categoria, categoria))
+                for termo in termos:
+                    entrada = indice.buscar(termo["coreano"])
+                    cursor = conexao.execute(
+                        "INSERT INTO termos (categoria_id, fonte, coreano, portugues, descricao) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            id_categoria,
+                            entrada.namespace if entrada else "",
+                            termo["coreano"],
+                            termo["portugues"],
+                            termo["descricao"],
+                        ),
+                    )
+                    ids_termos.setdefault((categoria, normalizar_coreano(termo["coreano"])), cursor.lastrowid)
+
+            # Faixas, técnicas (uma linha por nome, mesmo que apareça em várias faixas) e termos de cada técnica
+            ids_tecnicas: Dict[str, int] = {}
+            for posicao, faixa in enumerate(gerenciador.get_faixas_ordenadas()):
+                id_faixa = conexao.execute(
+                    "INSERT INTO faixas (posicao, cor, nome) VALUES (?, ?, ?)", (posicao, faixa.cor, faixa.nome)
+                ).lastrowid
+                for tipo, nomes in (("braco", faixa.tecnicas_braco), ("chute", faixa.tecnicas_chute)):
+                    for ordem, nome in enumerate(nomes):
+                        if nome not in ids_tecnicas:
+                            ids_tecnicas[nome] = conexao.execute(
+                                "INSERT INTO tecnicas (nome) VALUES (?)", (nome,)
+                            ).lastrowid
+                            tecnica = analisar_tecnica(nome, max_distance, indice=indice)
+                            conexao.executemany(
+                                "INSERT INTO tecnica_termos (tecnica_id, posicao, termo_id, distancia) "
+                                "VALUES (?, ?, ?, ?)",
+                                [
+                                    (
+                                        ids_tecnicas[nome],
+                                        posicao_termo,
+                                        ids_termos[(t.categoria, normalizar_coreano(t.termo["coreano"]))],
+                                        t.distancia,
+                                    )
+                                    for posicao_termo, t in enumerate(tecnica.get_termos_ordenados())
+                                ],
+                            )
+                        conexao.execute(
+                            "INSERT INTO faixa_tecnicas (faixa_id, tecnica_id, tipo, ordem) VALUES (?, ?, ?, ?)",
+                            (id_faixa, ids_tecnicas[nome], tipo, ordem),
+                        )
+
+            conexao.execute("INSERT INTO termos_fts (termos_fts) VALUES ('rebuild')")
+            for pacote in pacotes:
+                _gravar_idioma(conexao, pacote)
+        conexao.execute("VACUUM")
+    finally:
+        conexao.close()
+
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("caminho", help="Arquivo SQLite de destino")
+    parser.add_argument(
+        "--idioma", action="append", default=[], help="Idioma cujas traduções são indexadas (pode repetir)"
+    )
+    parser.add_argument(
+        "--apenas-idiomas", action="store_true", help="Só acrescenta os idiomas a um banco já exportado"
+    )
+    args = parser.parse_args()
+
+    if not args.apenas_idiomas:
+        print(exportar_banco(args.caminho, idiomas=args.idioma))
+        return
+    if not args.idioma:
+        parser.error("--apenas-idiomas exige ao menos um --idioma")
+    for idioma in args.idioma:
+        try:
+            gravados = indexar_idioma(args.caminho, idioma)
+        except ValueError as erro:
+            parser.error(str(erro))
+        print(f"{idioma}: {gravados} termos traduzidos indexados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""Exporta o glossário, as faixas e as análises de técnicas em formato colunar.
+
+Para análises em lote (participação de cada categoria por faixa, reuso de termos entre
+faixas etc.) sem percorrer objetos em Python. Cada tabela é um array estruturado do
+NumPy, gravado sem compressão em ``glossario.npz``; com ``pyarrow`` instalado, cada
+tabela também é gravada como um arquivo Arrow IPC (``<tabela>.arrow``).
+
+Os textos ficam só nas tabelas de dicionário (``categorias``, ``fontes``, ``termos``,
+``faixas``, ``tecnicas``); as demais guardam apenas ids inteiros, e o id de cada linha é
+a sua posição na tabela, de modo que ``categorias["nome"][tecnica_termos["categoria_id"]]``
+decodifica uma coluna inteira de uma vez. No Arrow, as colunas de categoria, fonte e tipo
+são ``DictionaryArray``. As duas formas podem ser carregadas sem cópia, mapeando o
+arquivo na memória (``carregar_npz`` e ``carregar_arrow``). Uso:
+
+    python -m taekwondo_glossario.exportacao.colunas colunas/
+    python -m taekwondo_glossario.exportacao.colunas colunas/ --tecnicas corpus.txt --resumo
+"""
+
+import argparse
+import os
+import zipfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary.cache import CachePersistente
+from ..glossary.registro import IndiceGlossario, get_registro, normalizar_coreano
+from ..glossary.tecnica import analisar_tecnica
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - pyarrow é opcional
+    pa = None
+    pa_ipc = None
+
+ARQUIVO_NPZ = "glossario.npz"
+
+# Tipos das técnicas de uma faixa; ``faixa_tecnicas["tipo"]`` é a posição nesta tupla
+TIPOS_TECNICA = ("braco", "chute")
+
+# Tabelas cujas colunas ``<coluna>_id`` viram dicionários no Arrow: coluna -> tabela de dicionário
+_DICIONARIOS = {"categoria_id": "categorias", "fonte_id": "fontes"}
+
+
+def _texto(valores: List[str]) -> str:
+    """Tipo de texto de largura fixa que comporta todos os valores."""
+    return f"U{max((len(v) for v in valores), default=0) or 1}"
+
+
+def _tabela(colunas: List[Tuple[str, str, list]]) -> np.ndarray:
+    """Monta um array estruturado a partir de (nome, tipo, valores); tipo ``"U"`` usa a maior largura."""
+    tipo = np.dtype([(nome, _texto(valores) if t == "U" else t) for nome, t, valores in colunas])
+    tamanho = len(colunas[0][2])
+    tabela = np.empty(tamanho, dtype=tipo)
+    for nome, _, valores in colunas:
+        tabela[nome] = valores
+    return tabela
+
+
+def montar_colunas(
+    indice: Optional[IndiceGlossario] = None,
+    gerenciador: Optional[GerenciadorFaixas] = None,
+    max_distance: int = 2,
+    tecnicas: Iterable[str] = (),
+    cache: Optional[CachePersistente] = None,
+) -> Dict[str, np.ndarray]:
+    """Monta as tabelas colunares do glossário e das técnicas analisadas.
+
+    Args:
+        indice: Índice de glossário. Se None, usa o índice do registro global.
+        gerenciador: Catálogo de faixas. Se None, carrega o diretório padrão.
+        max_distance: Distância máxima usada na análise das técnicas
+        tecnicas: Técnicas analisadas além das técnicas das faixas (ex: um corpus)
+        cache: Cache persistente opcional para as análises
+
+    Returns:
+        Dicionário nome da tabela -> array estruturado.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    gerenciador = gerenciador if gerenciador is not None else GerenciadorFaixas()
+
+    # Categorias, fontes e termos; cada termo é identificado pela categoria e pela romanização
+    categorias = list(indice.termos_por_categoria())
+    fontes = indice.namespaces
+    termos: Dict[str, list] = {c: [] for c in ("categoria_id", "fonte_id", "coreano", "portugues", "descricao")}
+    ids_termos: Dict[Tuple[str, str], int] = {}
+    for id_categoria, (categoria, lista) in enumerate(indice.termos_por_categoria().items()):
+        for termo in lista:
+            entrada = indice.buscar(termo["coreano"])
+            ids_termos.setdefault((categoria, normalizar_coreano(termo["coreano"])), len(termos["coreano"]))
+            termos["categoria_id"].append(id_categoria)
+            termos["fonte_id"].append(fontes.index(entrada.namespace) if entrada else -1)
+            termos["coreano"].append(termo["coreano"])
+            termos["portugues"].append(termo["portugues"])
+            termos["descricao"].append(termo["descricao"])
+    ids_categorias = {categoria: i for i, categoria in enumerate(categorias)}
+
+    # Técnicas (uma linha por nome) e a sequência de termos de cada uma
+    nomes_tecnicas: List[str] = []
+    ids_tecnicas: Dict[str, int] = {}
+    sequencias: Dict[str, list] = {c: [] for c in ("tecnica_id", "posicao", "termo_id", "categoria_id", "distancia")}
+
+    def id_tecnica(nome: str) -> int:
+        if nome not in ids_tecnicas:
+            ids_tecnicas[nome] = len(nomes_tecnicas)
+            nomes_tecnicas.append(nome)
+            tecnica = analisar_tecnica(nome, max_distance, indice=indice, cache=cache)
+            for posicao, t in enumerate(tecnica.get_termos_ordenados()):
+                sequencias["tecnica_id"].append(ids_tecnicas[nome])
+                sequencias["posicao"].append(posicao)
+                sequencias["termo_id"].append(ids_termos[(t.categoria, normalizar_coreano(t.termo["coreano"]))])
+                sequencias["categoria_id"].append(ids_categorias[t.categoria])
+                sequencias["distancia"].append(t.distancia)
+        return ids_tecnicas[nome]
+
+    faixas = gerenciador.get_faixas_ordenadas()
+    faixa_tecnicas: Dict[str, list] = {c: [] for c in ("faixa_id", "tecnica_id", "tipo", "ordem")}
+    for id_faixa, faixa in enumerate(faixas):
+        for tipo, nomes in enumerate((faixa.tecnicas_braco, faixa.tecnicas_chute)):
+            for ordem, nome in enumerate(nomes):
+                faixa_tecnicas["faixa_id"].append(id_faixa)
+                faixa_tecnicas["tecnica_id"].append(id_tecnica(nome))
+                faixa_tecnicas["tipo"].append(tipo)
+                faixa_tecnicas["ordem"].append(ordem)
+    for nome in tecnicas:
+        id_tecnica(nome)
+
+    return {
+        "metadados": _tabela(
+            [
+                ("chave", "U", ["versao_glossario", "max_distance"]),
+                ("valor", "U", [indice.versao, str(max_distance)]),
+            ]
+        ),
+        "categorias": _tabela([("nome", "U", categorias)]),
+        "fontes": _tabela([("nome", "U", fontes)]),
+        "termos": _tabela(
+            [
+                ("categoria_id", "i2", termos["categoria_id"]),
+                ("fonte_id", "i2", termos["fonte_id"]),
+                ("coreano", "U", termos["coreano"]),
+                ("portugues", "U", termos["portugues"]),
+                ("descricao", "U", termos["descricao"]),
+            ]
+        ),
+        "faixas": _tabela(
+            [
+                ("cor", "U", [f.cor for f in faixas]),
+                ("nome", "U", [f.nome for f in faixas]),
+            ]
+        ),
+        "tecnicas": _tabela([("nome", "U", nomes_tecnicas)]),
+        "faixa_tecnicas": _tabela(
+            [
+                ("faixa_id", "i2", faixa_tecnicas["faixa_id"]),
+                ("tecnica_id", "i4", faixa_tecnicas["tecnica_id"]),
+                ("tipo", "i1", faixa_tecnicas["tipo"]),
+                ("ordem", "i2", faixa_tecnicas["ordem"]),
+            ]
+        ),
+        "tecnica_termos": _tabela(
+            [
+                ("tecnica_id", "i4", sequencias["tecnica_id"]),
+                ("posicao", "i2", sequencias["posicao"]),
+                ("termo_id", "i4", sequencias["termo_id"]),
+                ("categoria_id", "i2", sequencias["categoria_id"]),
+                ("distancia", "f4", sequencias["distancia"]),
+            ]
+        ),
+    }
+
+
+def _para_arrow(nome: str, tabela: np.ndarray, colunas: Dict[str, np.ndarray], metadados: Dict[str, str]):
+    """Converte uma tabela em ``pyarrow.Table``; colunas de id de dicionário viram ``DictionaryArray``."""
+    arrays = []
+    nomes = []
+    for campo in tabela.dtype.names:
+        valores = tabela[campo]
+        if campo in _DICIONARIOS and nome != _DICIONARIOS[campo]:
+            dicionario = pa.array(colunas[_DICIONARIOS[campo]]["nome"].tolist(), pa.string())
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(valores, mask=valores < 0), dicionario))
+            nomes.append(campo[: -len("_id")])
+        elif nome == "faixa_tecnicas" and campo == "tipo":
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(valores), pa.array(TIPOS_TECNICA)))
+            nomes.append(campo)
+        elif valores.dtype.kind == "U":
+            arrays.append(pa.array(valores.tolist(), pa.string()))
+            nomes.append(campo)
+        else:
+            arrays.append(pa.array(valores))
+            nomes.append(campo)
+    return pa.Table.from_arrays(arrays, names=nomes, metadata=metadados)
+
+
+def exportar_colunas(
+    diretorio: str,
+    indice: Optional[IndiceGlossario] = None,
+    gerenciador: Optional[GerenciadorFaixas] = None,
+    max_distance: int = 2,
+    tecnicas: Iterable[str] = (),
+    cache: Optional[CachePersistente] = None,
+) -> List[str]:
+    """Grava as tabelas colunares em ``diretorio`` (veja ``montar_colunas``).
+
+    Cada arquivo é gravado em um temporário e só então substitui o anterior, para que
+    leitores nunca vejam um arquivo pela metade.
+
+    Returns:
+        Os caminhos dos arquivos gravados.
+    """
+    colunas = montar_colunas(indice, gerenciador, max_distance, tecnicas, cache)
+    os.makedirs(diretorio, exist_ok=True)
+
+    caminho = os.path.join(diretorio, ARQUIVO_NPZ)
+    # O temporário precisa terminar em .npz, senão ``np.savez`` acrescenta a extensão
+    temporario = caminho + ".tmp.npz"
+    np.savez(temporario, **colunas)
+    os.replace(temporario, caminho)
+    gravados = [caminho]
+
+    if pa is not None:
+        metadados = dict(zip(colunas["metadados"]["chave"].tolist(), colunas["metadados"]["valor"].tolist()))
+        for nome, tabela in colunas.items():
+            if nome == "metadados":
+                continue
+            tabela_arrow = _para_arrow(nome, tabela, colunas, metadados)
+            caminho = os.path.join(diretorio, f"{nome}.arrow")
+            with pa.OSFile(caminho + ".tmp", "wb") as arquivo:
+                with pa_ipc.new_file(arquivo, tabela_arrow.schema) as escritor:
+                    escritor.write_table(tabela_arrow)
+            os.replace(caminho + ".tmp", caminho)
+            gravados.append(caminho)
+    return gravados
+
+
+def carregar_npz(caminho: str) -> Dict[str, np.ndarray]:
+    """Carrega as tabelas de um ``.npz`` sem compressão mapeando o arquivo na memória (sem cópia).
+
+    ``np.load`` ignora ``mmap_mode`` em arquivos ``.npz``; como os membros gravados por
+    ``exportar_colunas`` não são comprimidos, cada um é mapeado diretamente na posição em
+    que está no arquivo zip. Membros comprimidos são lidos normalmente.
+    """
+    tabelas: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(caminho) as pacote, open(caminho, "rb") as arquivo:
+        for info in pacote.infolist():
+            nome = info.filename[: -len(".npy")]
+            if info.compress_type != zipfile.ZIP_STORED:
+                with pacote.open(info) as membro:
+                    tabelas[nome] = np.lib.format.read_array(membro)
+                continue
+            # Cabeçalho local do zip: 30 bytes fixos, seguidos do nome e do campo extra
+            arquivo.seek(info.header_offset + 26)
+            tamanho_nome = int.from_bytes(arquivo.read(2), "little")
+            tamanho_extra = int.from_bytes(arquivo.read(2), "little")
+            arquivo.seek(info.header_offset + 30 + tamanho_nome + tamanho_extra)
+            versao = np.lib.format.read_magic(arquivo)
+            if versao == (1, 0):
+                forma, fortran, tipo = np.lib.format.read_array_header_1_0(arquivo)
+            else:
+                forma, fortran, tipo = np.lib.format.read_array_header_2_0(arquivo)
+            tabelas[nome] = np.memmap(
+                caminho, dtype=tipo, mode="r", offset=arquivo.tell(), shape=forma, order="F" if fortran else "C"
+            )
+    return tabelas
+
+
+def carregar_arrow(diretorio: str) -> Dict[str, "pa.Table"]:
+    """Carrega as tabelas Arrow de ``diretorio`` mapeando os arquivos na memória (sem cópia)."""
+    if pa is None:
+        raise ValueError("pyarrow não está instalado")
+    tabelas = {}
+    for arquivo in sorted(os.listdir(diretorio)):
+        if arquivo.endswith(".arrow"):
+            with pa.memory_map(os.path.join(diretorio, arquivo)) as origem:
+                tabelas[arquivo[: -len(".arrow")]] = pa_ipc.open_file(origem).read_all()
+    return tabelas
+
+
+def termos_por_faixa(colunas: Dict[str, np.ndarray]) -> np.ndarray:
+    """Matriz faixas x categorias com o número de termos das técnicas de cada faixa.
+
+    Calculada só com operações vetorizadas sobre os ids; dividir cada linha pela sua soma
+    dá a participação de cada categoria na faixa.
+    """
+    sequencias = colunas["tecnica_termos"]
+    faixa_tecnicas = colunas["faixa_tecnicas"]
+    n_tecnicas = len(colunas["tecnicas"])
+    n_categorias = len(colunas["categorias"])
+
+    # Termos de cada técnica por categoria, depois somados nas técnicas de cada faixa
+    por_tecnica = np.bincount(
+        sequencias["tecnica_id"].astype(np.int64) * n_categorias + sequencias["categoria_id"],
+        minlength=n_tecnicas * n_categorias,
+    ).reshape(n_tecnicas, n_categorias)
+    por_faixa = np.zeros((len(colunas["faixas"]), n_categorias), dtype=np.int64)
+    np.add.at(por_faixa, faixa_tecnicas["faixa_id"], por_tecnica[faixa_tecnicas["tecnica_id"]])
+    return por_faixa
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("diretorio", help="Diretório de destino")
+    parser.add_argument("--tecnicas", help="Arquivo com técnicas adicionais a analisar, uma por linha")
+    parser.add_argument("--max-distance", type=int, default=2, help="Distância máxima usada na análise das técnicas")
+    parser.add_argument("--cache", help="Arquivo SQLite do cache persistente das análises")
+    parser.add_argument("--resumo", action="store_true", help="Mostra a participação das categorias por faixa")
+    args = parser.parse_args()
+
+    tecnicas: List[str] = []
+    if args.tecnicas:
+        with open(args.tecnicas, encoding="utf-8") as arquivo:
+            tecnicas = [linha.strip() for linha in arquivo if linha.strip()]
+
+    if args.cache:
+        with CachePersistente(args.cache) as cache:
+            gravados = exportar_colunas(args.diretorio, max_distance=args.max_distance, tecnicas=tecnicas, cache=cache)
+    else:
+        gravados = exportar_colunas(args.diretorio, max_distance=args.max_distance, tecnicas=tecnicas)
+    for caminho in gravados:
+        print(caminho)
+    if pa is None:
+        print("pyarrow não está instalado: só o arquivo .npz foi gravado")
+
+    if args.resumo:
+        colunas = carregar_npz(gravados[0])
+        contagens = termos_por_faixa(colunas)
+        participacao = contagens / np.maximum(contagens.sum(axis=1, keepdims=True), 1)
+        categorias = colunas["categorias"]["nome"]
+        for faixa, linha in zip(colunas["faixas"]["nome"], participacao):
+            partes = ", ".join(f"{categorias[i]} {linha[i]:.0%}" for i in np.argsort(-linha) if linha[i] > 0)
+            print(f"{faixa}: {partes}")
+
+
+if __name__ == "__main__":
+    main()
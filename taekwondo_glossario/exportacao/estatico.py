@@ -0,0 +1,270 @@
+"""Exporta o glossário e as faixas como um site estático (HTML + JSON).
+
+O pacote gerado contém uma página por categoria de termos e por faixa (com os termos de
+cada técnica), os dados em JSON e um índice de busca compacto usado por um script no
+navegador, de modo que pode ser servido por qualquer servidor de arquivos estáticos.
+
+A geração é determinística (mesma entrada, mesmos bytes) e incremental: um manifesto
+guarda o hash de cada arquivo, e arquivos cujo conteúdo não mudou não são regravados.
+Uso:
+
+    python -m taekwondo_glossario.exportacao.estatico site/
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional
+
+from ..faixas.faixa import Faixa, GerenciadorFaixas
+from ..glossary.registro import IndiceGlossario, get_registro
+from ..glossary.tecnica import analisar_tecnica
+
+ARQUIVO_MANIFESTO = "manifesto.json"
+
+ESTILO = """body { font-family: sans-serif; max-width: 960px; margin: 0 auto; padding: 1rem; line-height: 1.5; }
+nav a { margin-right: 1rem; }
+dt { font-weight: bold; margin-top: 0.75rem; }
+.categoria { color: #666; font-size: 0.9em; }
+#resultados li { margin: 0.25rem 0; }
+"""
+
+# Busca no navegador: filtra o índice compacto por substring e, se não houver resultado,
+# por distância de edição limitada, sem nenhuma requisição ao servidor
+SCRIPT_BUSCA = """(function () {
+  var campo = document.getElementById("busca"), lista = document.getElementById("resultados");
+  if (!campo) return;
+  var raiz = document.body.getAttribute("data-raiz") || "";
+  var indice = null;
+  function distancia(a, b, limite) {
+    if (Math.abs(a.length - b.length) > limite) return limite + 1;
+    var ant = [], i, j;
+    for (j = 0; j <= b.length; j++) ant.push(j);
+    for (i = 1; i <= a.length; i++) {
+      var atual = [i], menor = i;
+      for (j = 1; j <= b.length; j++) {
+        atual.push(Math.min(ant[j] + 1, atual[j - 1] + 1, ant[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1)));
+        if (atual[j] < menor) menor = atual[j];
+      }
+      if (menor > limite) return limite + 1;
+      ant = atual;
+    }
+    return ant[b.length];
+  }
+  function buscar() {
+    var q = campo.value.toLowerCase().trim();
+    lista.innerHTML = "";
+    if (!q || !indice) return;
+    var achados = [];
+    indice.t.forEach(function (t) {
+      var c = t[0].toLowerCase(), p = t[1].toLowerCase(), d;
+      if (c.indexOf(q) >= 0 || p.indexOf(q) >= 0) d = 0;
+      else d = Math.min(distancia(q, c, 2), distancia(q, p, 2));
+      if (d <= 2) achados.push([d, t]);
+    });
+    achados.sort(function (x, y) { return x[0] - y[0]; });
+    achados.slice(0, 50).forEach(function (a) {
+      var t = a[1], li = document.createElement("li"), link = document.createElement("a");
+      link.href = raiz + t[3];
+      link.textContent = t[0] + " (" + t[1] + ")";
+      li.appendChild(link);
+      li.appendChild(document.createTextNode(" — " + indice.c[t[2]]));
+      lista.appendChild(li);
+    });
+  }
+  fetch(raiz + "busca.json").then(function (r) { return r.json(); }).then(function (dados) {
+    indice = dados;
+    buscar();
+  });
+  campo.addEventListener("input", buscar);
+})();
+"""
+
+
+@dataclass
+class RelatorioExportacao:
+    """Resumo de uma exportação incremental."""
+
+    gravados: List[str] = field(default_factory=list)
+    inalterados: List[str] = field(default_factory=list)
+    removidos: List[str] = field(default_factory=list)
+
+
+def slug(texto: str) -> str:
+    """Converte um texto em um nome de arquivo ASCII (ex: "Verde Claro" -> "verde-claro")."""
+    ascii_ = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+    return "-".join("".join(c if c.isalnum() else " " for c in ascii_.lower()).split())
+
+
+def _json(dados) -> str:
+    """Serialização determinística e compacta."""
+    return json.dumps(dados, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _pagina(titulo: str, corpo: str, raiz: str = "") -> str:
+    """Envolve o corpo no layout comum das páginas."""
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="pt-BR">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{html.escape(titulo)} - Glossário de Taekwondo</title>\n"
+        f'<link rel="stylesheet" href="{raiz}estilo.css">\n</head>\n'
+        f'<body data-raiz="{raiz}">\n'
+        f'<nav><a href="{raiz}index.html">Início</a></nav>\n'
+        f"<h1>{html.escape(titulo)}</h1>\n{corpo}\n"
+        f'<script src="{raiz}busca.js"></script>\n</body>\n</html>\n'
+    )
+
+
+def _lista_termos_html(termos: List[Mapping[str, str]]) -> str:
+    itens = []
+    for termo in termos:
+        itens.append(
+            f'<dt id="{slug(termo["coreano"])}">{html.escape(termo["coreano"])} '
+            f"({html.escape(termo['portugues'])})</dt>\n<dd>{html.escape(termo['descricao'])}</dd>"
+        )
+    return "<dl>\n" + "\n".join(itens) + "\n</dl>"
+
+
+class ExportadorEstatico:
+    """Gera o site estático a partir de um índice de glossário e de um catálogo de faixas."""
+
+    def __init__(self, indice: Optional[IndiceGlossario] = None, gerenciador: Optional[GerenciadorFaixas] = None):
+        self.indice = indice if indice is not None else get_registro().indice
+        self.gerenciador = gerenciador if gerenciador is not None else GerenciadorFaixas()
+
+    def _analisar_faixa(self, faixa: Faixa) -> Dict[str, List[Dict]]:
+        """Decomposição em termos de cada técnica da faixa, separada em braço e chute."""
+        resultado = {}
+        for lado, nomes in (("braco", faixa.tecnicas_braco), ("chute", faixa.tecnicas_chute)):
+            resultado[lado] = [
+                {
+                    "nome": nome,
+                    "termos": [
+                        {"categoria": t.categoria, "coreano": t.termo["coreano"], "portugues": t.termo["portugues"]}
+                        for t in analisar_tecnica(nome, indice=self.indice).get_termos_ordenados()
+                    ],
+                }
+                for nome in nomes
+            ]
+        return resultado
+
+    def gerar(self) -> Dict[str, str]:
+        """Gera o conteúdo de todos os arquivos do site, indexado pelo caminho relativo."""
+        arquivos: Dict[str, str] = {"estilo.css": ESTILO, "busca.js": SCRIPT_BUSCA}
+        categorias = self.indice.termos_por_categoria()
+        nomes_categorias = list(categorias)
+
+        # Páginas e dados das categorias
+        glossario = {}
+        entradas_busca = []
+        for numero, (categoria, termos) in enumerate(categorias.items()):
+            caminho = f"categorias/{slug(categoria)}.html"
+            arquivos[caminho] = _pagina(categoria, _lista_termos_html(list(termos)), raiz="../")
+            glossario[categoria] = [dict(termo) for termo in termos]
+            for termo in termos:
+                entradas_busca.append(
+                    [termo["coreano"], termo["portugues"], numero, f"{caminho}#{slug(termo['coreano'])}"]
+                )
+
+        # Páginas e dados das faixas
+        faixas = []
+        for faixa in self.gerenciador.get_faixas_ordenadas():
+            analise = self._analisar_faixa(faixa)
+            faixas.append({"cor": faixa.cor, "nome": faixa.nome, **analise})
+            blocos = []
+            for titulo, lado in (("Técnicas de Braço", "braco"), ("Técnicas de Chute", "chute")):
+                itens = []
+                for tecnica in analise[lado]:
+                    termos = ", ".join(
+                        f"{html.escape(t['coreano'])} ({html.escape(t['portugues'])})" for t in tecnica["termos"]
+                    )
+                    termos = termos or "Nenhum termo encontrado."
+                    itens.append(f"<dt>{html.escape(tecnica['nome'])}</dt>\n<dd>{termos}</dd>")
+                blocos.append(f"<h2>{titulo}</h2>\n<dl>\n" + "\n".join(itens) + "\n</dl>")
+            arquivos[f"faixas/{slug(faixa.cor)}.html"] = _pagina(
+                f"Faixa {faixa.cor} ({faixa.nome})", "\n".join(blocos), raiz="../"
+            )
+
+        arquivos["dados/glossario.json"] = _json({"versao": self.indice.versao, "categorias": glossario})
+        arquivos["dados/faixas.json"] = _json({"versao": self.indice.versao, "faixas": faixas})
+        arquivos["busca.json"] = _json({"v": self.indice.versao, "c": nomes_categorias, "t": entradas_busca})
+
+        # Página inicial
+        links_categorias = "\n".join(
+            f'<li><a href="categorias/{slug(c)}.html">{html.escape(c)}</a></li>' for c in nomes_categorias
+        )
+        links_faixas = "\n".join(
+            f'<li><a href="faixas/{slug(f["cor"])}.html">{html.escape(f["cor"])} ({html.escape(f["nome"])})</a></li>'
+            for f in faixas
+        )
+        arquivos["index.html"] = _pagina(
+            "Glossário de Taekwondo",
+            '<input id="busca" type="search" placeholder="Pesquisar termo" autofocus>\n'
+            '<ul id="resultados"></ul>\n'
+            f"<h2>Categorias</h2>\n<ul>\n{links_categorias}\n</ul>\n"
+            f"<h2>Faixas</h2>\n<ul>\n{links_faixas}\n</ul>",
+        )
+        return arquivos
+
+    def exportar(self, destino: str) -> RelatorioExportacao:
+        """Grava o site em ``destino``, regravando apenas os arquivos que mudaram.
+
+        Arquivos gerados por uma exportação anterior e que deixaram de existir são removidos.
+        """
+        relatorio = RelatorioExportacao()
+        caminho_manifesto = os.path.join(destino, ARQUIVO_MANIFESTO)
+        anterior: Dict[str, str] = {}
+        if os.path.exists(caminho_manifesto):
+            with open(caminho_manifesto, encoding="utf-8") as arquivo:
+                anterior = json.load(arquivo)
+
+        manifesto = {}
+        for caminho, conteudo in sorted(self.gerar().items()):
+            dados = conteudo.encode("utf-8")
+            hash_ = hashlib.sha256(dados).hexdigest()
+            manifesto[caminho] = hash_
+            completo = os.path.join(destino, caminho)
+            if anterior.get(caminho) == hash_ and os.path.exists(completo):
+                relatorio.inalterados.append(caminho)
+                continue
+            os.makedirs(os.path.dirname(completo), exist_ok=True)
+            with open(completo, "wb") as arquivo:
+                arquivo.write(dados)
+            relatorio.gravados.append(caminho)
+
+        for caminho in sorted(set(anterior) - set(manifesto)):
+            completo = os.path.join(destino, caminho)
+            if os.path.exists(completo):
+                os.remove(completo)
+            relatorio.removidos.append(caminho)
+
+        with open(caminho_manifesto, "w", encoding="utf-8") as arquivo:
+            json.dump(manifesto, arquivo, indent=1, sort_keys=True)
+        return relatorio
+
+
+def exportar_site(
+    destino: str, indice: Optional[IndiceGlossario] = None, gerenciador: Optional[GerenciadorFaixas] = None
+) -> RelatorioExportacao:
+    """Exporta o glossário e as faixas como site estático em ``destino``."""
+    return ExportadorEstatico(indice, gerenciador).exportar(destino)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("destino", help="Diretório do site gerado")
+    args = parser.parse_args()
+
+    relatorio = exportar_site(args.destino)
+    print(
+        f"{len(relatorio.gravados)} gravados, {len(relatorio.inalterados)} inalterados, "
+        f"{len(relatorio.removidos)} removidos"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..glossary.cache import normalizar_entrada
+from ..glossary.registro import IndiceGlossario, get_registro, normalizar_coreano
+from ..glossary.tecnica import analisar_tecnica
+from .faixa import Faixa, GerenciadorFaixas
+
+
+def _bits(mascara: int) -> List[int]:
+    """Retorna as posições dos bits ligados, em ordem crescente."""
+    posicoes = []
+    while mascara:
+        menor = mascara & -mascara
+        posicoes.append(menor.bit_length() - 1)
+        mascara ^= menor
+    return posicoes
+
+
+class Curriculo:
+    """Consultas de currículo entre faixas com conjuntos de bits pré-calculados.
+
+    As faixas são numeradas na ordem de graduação de ``GerenciadorFaixas.get_faixas_ordenadas``
+    e cada técnica e cada termo recebe um identificador. São pré-calculados:
+
+    - para cada termo e cada técnica, o conjunto de faixas em que aparece;
+    - para cada faixa, o conjunto de técnicas e de termos que ela traz;
+    - para cada faixa, a união acumulada das faixas anteriores e dela própria.
+
+    Assim, programa acumulado, diferença entre faixas e "onde este termo é usado" são
+    operações de bits sobre inteiros, sem reanalisar nenhuma técnica.
+    """
+
+    def __init__(self, gerenciador: GerenciadorFaixas, indice: Optional[IndiceGlossario] = None):
+        """Analisa todas as técnicas de todas as faixas uma única vez.
+
+        Args:
+            gerenciador: Catálogo de faixas
+            indice: Índice de glossário usado nas análises. Se None, usa o do registro global.
+        """
+        indice = indice if indice is not None else get_registro().indice
+        self.gerenciador = gerenciador
+        self.faixas: Tuple[Faixa, ...] = gerenciador.get_faixas_ordenadas()
+
+        self.tecnicas: List[str] = []
+        self.termos: List[Mapping[str, str]] = []
+        self._id_tecnica: Dict[str, int] = {}
+        self._id_termo: Dict[str, int] = {}
+        self._faixas_tecnica: List[int] = []
+        self._faixas_termo: List[int] = []
+        self._tecnicas_faixa: List[int] = []
+        self._termos_faixa: List[int] = []
+
+        for posicao, faixa in enumerate(self.faixas):
+            bit_faixa = 1 << posicao
+            tecnicas_faixa = termos_faixa = 0
+            for nome in (*faixa.tecnicas_braco, *faixa.tecnicas_chute):
+                id_tecnica = self._registrar(normalizar_entrada(nome), nome, self._id_tecnica, self.tecnicas)
+                if id_tecnica == len(self._faixas_tecnica):
+                    self._faixas_tecnica.append(0)
+                self._faixas_tecnica[id_tecnica] |= bit_faixa
+                tecnicas_faixa |= 1 << id_tecnica
+
+                for encontrado in analisar_tecnica(nome, indice=indice).get_termos_ordenados():
+                    termo = encontrado.termo
+                    id_termo = self._registrar(normalizar_coreano(termo["coreano"]), termo, self._id_termo, self.termos)
+                    if id_termo == len(self._faixas_termo):
+                        self._faixas_termo.append(0)
+                    self._faixas_termo[id_termo] |= bit_faixa
+                    termos_faixa |= 1 << id_termo
+            self._tecnicas_faixa.append(tecnicas_faixa)
+            self._termos_faixa.append(termos_faixa)
+
+        # Uniões acumuladas (prefixos) na ordem de graduação
+        self._tecnicas_acumuladas: List[int] = []
+        self._termos_acumulados: List[int] = []
+        tecnicas = termos = 0
+        for tecnicas_faixa, termos_faixa in zip(self._tecnicas_faixa, self._termos_faixa):
+            tecnicas |= tecnicas_faixa
+            termos |= termos_faixa
+            self._tecnicas_acumuladas.append(tecnicas)
+            self._termos_acumulados.append(termos)
+
+    @staticmethod
+    def _registrar(chave: str, valor, ids: Dict[str, int], valores: List) -> int:
+        """Retorna o identificador da chave, criando um novo se for a primeira ocorrência."""
+        if chave not in ids:
+            ids[chave] = len(valores)
+            valores.append(valor)
+        return ids[chave]
+
+    def posicao(self, cor: str) -> int:
+        """Retorna a posição da faixa na ordem de graduação.
+
+        Raises:
+            ValueError: Se a faixa não for encontrada.
+        """
+        return self.gerenciador.posicao(cor)
+
+    def _faixas_de(self, mascara: int) -> List[Faixa]:
+        return [self.faixas[i] for i in _bits(mascara)]
+
+    def _tecnicas_de(self, mascara: int) -> List[str]:
+        return [self.tecnicas[i] for i in _bits(mascara)]
+
+    def _termos_de(self, mascara: int) -> List[Mapping[str, str]]:
+        return [self.termos[i] for i in _bits(mascara)]
+
+    def faixas_com_termo(self, coreano: str) -> List[Faixa]:
+        """Retorna as faixas cujas técnicas usam o termo."""
+        id_termo = self._id_termo.get(normalizar_coreano(coreano))
+        return [] if id_termo is None else self._faixas_de(self._faixas_termo[id_termo])
+
+    def faixas_com_tecnica(self, nome: str) -> List[Faixa]:
+        """Retorna as faixas que incluem a técnica."""
+        id_tecnica = self._id_tecnica.get(normalizar_entrada(nome))
+        return [] if id_tecnica is None else self._faixas_de(self._faixas_tecnica[id_tecnica])
+
+    def programa_acumulado(self, cor: str) -> List[str]:
+        """Retorna todas as técnicas das faixas até a faixa informada, inclusive."""
+        return self._tecnicas_de(self._tecnicas_acumuladas[self.posicao(cor)])
+
+    def termos_acumulados(self, cor: str) -> List[Mapping[str, str]]:
+        """Retorna todos os termos usados nas faixas até a faixa informada, inclusive."""
+        return self._termos_de(self._termos_acumulados[self.posicao(cor)])
+
+    def tecnicas_novas(self, cor_de: str, cor_ate: str) -> List[str]:
+        """Retorna as técnicas do programa até ``cor_ate`` que não estão no programa até ``cor_de``."""
+        mascara = self._tecnicas_acumuladas[self.posicao(cor_ate)] & ~self._tecnicas_acumuladas[self.posicao(cor_de)]
+        return self._tecnicas_de(mascara)
+
+    def termos_novos(self, cor_de: str, cor_ate: str) -> List[Mapping[str, str]]:
+        """Retorna os termos usados até ``cor_ate`` que ainda não eram usados até ``cor_de``."""
+        mascara = self._termos_acumulados[self.posicao(cor_ate)] & ~self._termos_acumulados[self.posicao(cor_de)]
+        return self._termos_de(mascara)
+
+
+@lru_cache(maxsize=8)
+def get_curriculo(gerenciador: GerenciadorFaixas, indice: IndiceGlossario) -> Curriculo:
+    """Retorna o currículo de um catálogo de faixas e de um índice, construído uma única vez.
+
+    Um novo gerenciador (após a recarga de uma faixa) ou um novo índice geram um novo currículo.
+    """
+    return Curriculo(gerenciador, indice)
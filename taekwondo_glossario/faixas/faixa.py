@@ -1,10 +1,17 @@
 import json
+import logging
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
-from ..glossary.tecnica import Tecnica
+from ..glossary.cache import CachePersistente
+from ..glossary.registro import IndiceGlossario
+from ..glossary.tecnica import Tecnica, analisar_tecnica
+
+logger = logging.getLogger(__name__)
 
 
 class FaixaEnum(Enum):
@@ -18,9 +25,51 @@ class FaixaEnum(Enum):
     PRETA = "Preta"
 
 
-@dataclass
+class TipoGrau(Enum):
+    """Tipo de graduação: GUB (faixas coloridas, do 10 ao 1) ou DAN (faixas pretas, do 1 em diante)."""
+
+    GUB = "GUB"
+    DAN = "DAN"
+
+
+_PADRAO_GRAU = re.compile(r"^\s*(\d+)\s*[ºª°]?\s*(GUB|DAN)\s*$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Grau:
+    """Graduação de uma faixa, como "10 GUB" ou "1 DAN"."""
+
+    tipo: TipoGrau
+    numero: int
+
+    @classmethod
+    def de_texto(cls, texto: str) -> "Grau":
+        """Interpreta uma graduação escrita como "10 GUB", "1 DAN" ou "1º DAN".
+
+        Raises:
+            ValueError: Se o texto não for uma graduação.
+        """
+        correspondencia = _PADRAO_GRAU.match(texto)
+        if correspondencia is None:
+            raise ValueError(f"Graduação {texto!r} inválida (esperado, por exemplo, '10 GUB' ou '1 DAN')")
+        return cls(TipoGrau(correspondencia.group(2).upper()), int(correspondencia.group(1)))
+
+    @property
+    def ordem(self) -> int:
+        """Chave de ordenação: do 10º GUB ao 1º GUB, seguidos dos DANs em ordem crescente."""
+        return -self.numero if self.tipo is TipoGrau.GUB else self.numero
+
+    def __str__(self) -> str:
+        return f"{self.numero} {self.tipo.value}"
+
+
+@dataclass(frozen=True)
 class TecnicaFaixa:
-    """Classe que representa uma técnica associada a uma faixa."""
+    """Classe que representa uma técnica associada a uma faixa.
+
+    É imutável: a mesma técnica, em qualquer faixa, é representada pelo mesmo objeto (veja
+    ``tecnica_faixa``), com a análise compartilhada de ``analisar_tecnica``.
+    """
 
     nome: str
     descricao: str = ""
@@ -31,17 +80,34 @@ class TecnicaFaixa:
     def __post_init__(self):
         """Inicializa a técnica após a criação do objeto."""
         if self.tecnica is None:
-            self.tecnica = Tecnica(self.nome)
+            object.__setattr__(self, "tecnica", analisar_tecnica(self.nome))
+
 
+@lru_cache(maxsize=1024)
+def tecnica_faixa(
+    nome: str, indice: Optional[IndiceGlossario] = None, cache: Optional[CachePersistente] = None
+) -> TecnicaFaixa:
+    """Retorna a técnica de faixa de um nome, criada e analisada uma única vez por índice."""
+    return TecnicaFaixa(nome=nome, tecnica=analisar_tecnica(nome, indice=indice, cache=cache))
 
-@dataclass
+
+@dataclass(frozen=True)
 class Faixa:
-    """Classe que representa uma faixa de Taekwondo com suas técnicas."""
+    """Classe que representa uma faixa de Taekwondo com suas técnicas.
+
+    É imutável, pois a mesma faixa é compartilhada por todas as sessões. A graduação é
+    interpretada uma única vez, a partir do nome, ao criar a faixa.
+    """
 
     cor: str
     nome: str
-    tecnicas_braco: List[str]
-    tecnicas_chute: List[str]
+    tecnicas_braco: Tuple[str, ...]
+    tecnicas_chute: Tuple[str, ...]
+    grau: Optional[Grau] = None
+
+    def __post_init__(self):
+        if self.grau is None:
+            object.__setattr__(self, "grau", Grau.de_texto(self.nome))
 
     @classmethod
     def carregar_de_json(cls, caminho_arquivo: str) -> "Faixa":
@@ -52,25 +118,47 @@ class Faixa:
         return cls(
             cor=dados["cor"],
             nome=dados["nome"],
-            tecnicas_braco=dados["tecnicas_braco"],
-            tecnicas_chute=dados["tecnicas_chute"],
+            tecnicas_braco=tuple(dados["tecnicas_braco"]),
+            tecnicas_chute=tuple(dados["tecnicas_chute"]),
         )
 
-    def get_tecnicas_braco_objetos(self) -> List[TecnicaFaixa]:
-        """Retorna as técnicas de braço como objetos TecnicaFaixa."""
-        return [TecnicaFaixa(nome=tecnica) for tecnica in self.tecnicas_braco]
+    def get_tecnicas_braco_objetos(
+        self, indice: Optional[IndiceGlossario] = None, cache: Optional[CachePersistente] = None
+    ) -> List[TecnicaFaixa]:
+        """Retorna as técnicas de braço como objetos TecnicaFaixa.
 
-    def get_tecnicas_chute_objetos(self) -> List[TecnicaFaixa]:
-        """Retorna as técnicas de chute como objetos TecnicaFaixa."""
-        return [TecnicaFaixa(nome=tecnica) for tecnica in self.tecnicas_chute]
+        Args:
+            indice: Índice de glossário usado na análise. Se None, usa o índice do registro global.
+            cache: Cache persistente opcional para as análises.
+        """
+        return [tecnica_faixa(tecnica, indice, cache) for tecnica in self.tecnicas_braco]
 
-    def get_todas_tecnicas(self) -> List[TecnicaFaixa]:
+    def get_tecnicas_chute_objetos(
+        self, indice: Optional[IndiceGlossario] = None, cache: Optional[CachePersistente] = None
+    ) -> List[TecnicaFaixa]:
+        """Retorna as técnicas de chute como objetos TecnicaFaixa.
+
+        Args:
+            indice: Índice de glossário usado na análise. Se None, usa o índice do registro global.
+            cache: Cache persistente opcional para as análises.
+        """
+        return [tecnica_faixa(tecnica, indice, cache) for tecnica in self.tecnicas_chute]
+
+    def get_todas_tecnicas(
+        self, indice: Optional[IndiceGlossario] = None, cache: Optional[CachePersistente] = None
+    ) -> List[TecnicaFaixa]:
         """Retorna todas as técnicas da faixa como objetos TecnicaFaixa."""
-        return self.get_tecnicas_braco_objetos() + self.get_tecnicas_chute_objetos()
+        return self.get_tecnicas_braco_objetos(indice, cache) + self.get_tecnicas_chute_objetos(indice, cache)
 
 
 class GerenciadorFaixas:
-    """Classe para gerenciar as técnicas de cada faixa."""
+    """Catálogo das faixas de Taekwondo e das suas técnicas.
+
+    As faixas ficam em uma tupla na ordem de graduação, montada ao carregar, com índices
+    para encontrar uma faixa pela cor, pela graduação ou pela posição sem percorrer a
+    lista. Os nomes de técnicas são internados: uma técnica presente em várias faixas é
+    a mesma string em todas elas (e a mesma ``TecnicaFaixa``, analisada uma única vez).
+    """
 
     def __init__(self, diretorio_faixas: str = None):
         """Inicializa o gerenciador de faixas.
@@ -85,17 +173,112 @@ class GerenciadorFaixas:
 
         self.diretorio_faixas = diretorio_faixas
         self._faixas: Dict[str, Faixa] = {}
+        # Cor (em minúsculas) carregada de cada arquivo, para recarregar um arquivo isolado
+        self._arquivos: Dict[str, str] = {}
+        self._nomes_tecnicas: Dict[str, str] = {}
         self._carregar_faixas()
+        self._indexar()
+
+    @staticmethod
+    def eh_arquivo_faixa(caminho_arquivo: str) -> bool:
+        """Indica se o caminho corresponde a um arquivo de faixa (faixa_*.json)."""
+        nome = os.path.basename(caminho_arquivo)
+        return nome.endswith(".json") and nome.startswith("faixa_")
 
     def _carregar_faixas(self):
         """Carrega todas as faixas dos arquivos JSON."""
         # Lista todos os arquivos JSON no diretório
-        arquivos_json = [f for f in os.listdir(self.diretorio_faixas) if f.endswith(".json") and f.startswith("faixa_")]
+        arquivos_json = [f for f in os.listdir(self.diretorio_faixas) if self.eh_arquivo_faixa(f)]
 
         for arquivo in arquivos_json:
             caminho_arquivo = os.path.join(self.diretorio_faixas, arquivo)
-            faixa = Faixa.carregar_de_json(caminho_arquivo)
+            faixa = self._ler_faixa(caminho_arquivo)
+            if faixa is None:
+                continue
+            faixa = self._internar(faixa)
             self._faixas[faixa.cor.lower()] = faixa
+            self._arquivos[caminho_arquivo] = faixa.cor.lower()
+
+    @staticmethod
+    def _ler_faixa(caminho_arquivo: str) -> Optional[Faixa]:
+        """Lê a faixa de um arquivo; um arquivo inválido é registrado no log e ignorado."""
+        try:
+            return Faixa.carregar_de_json(caminho_arquivo)
+        except (OSError, ValueError, KeyError, TypeError) as erro:
+            logger.warning("Arquivo de faixa %s ignorado: %s", caminho_arquivo, erro)
+            return None
+
+    def _internar(self, faixa: Faixa) -> Faixa:
+        """Substitui os nomes de técnicas da faixa pelos já conhecidos pelo catálogo."""
+
+        def internar(nomes: Tuple[str, ...]) -> Tuple[str, ...]:
+            return tuple(self._nomes_tecnicas.setdefault(nome, nome) for nome in nomes)
+
+        return replace(
+            faixa, tecnicas_braco=internar(faixa.tecnicas_braco), tecnicas_chute=internar(faixa.tecnicas_chute)
+        )
+
+    def _indexar(self):
+        """Monta a ordem de graduação e os índices por cor, graduação e técnica."""
+        self._ordenadas: Tuple[Faixa, ...] = tuple(sorted(self._faixas.values(), key=lambda faixa: faixa.grau.ordem))
+        self._posicoes: Dict[str, int] = {}
+        self._posicoes_grau: Dict[Grau, int] = {}
+        for posicao, faixa in enumerate(self._ordenadas):
+            self._posicoes[faixa.cor.lower()] = posicao
+            self._posicoes_grau.setdefault(faixa.grau, posicao)
+        self._tecnicas: Tuple[str, ...] = tuple(
+            dict.fromkeys(nome for faixa in self._ordenadas for nome in (*faixa.tecnicas_braco, *faixa.tecnicas_chute))
+        )
+        # Mantém internados apenas os nomes ainda usados por alguma faixa
+        self._nomes_tecnicas = {nome: nome for nome in self._tecnicas}
+
+    def recarregar_arquivo(self, caminho_arquivo: str) -> "GerenciadorFaixas":
+        """Retorna um novo gerenciador com apenas um arquivo de faixa recarregado.
+
+        As demais faixas são compartilhadas com este gerenciador, que não é alterado.
+        Se o arquivo não existir mais, a faixa correspondente é removida; se for inválido, é
+        registrado no log e este gerenciador é retornado, mantendo a versão anterior da faixa.
+
+        Args:
+            caminho_arquivo: Caminho do arquivo JSON da faixa que mudou.
+
+        Returns:
+            Novo objeto GerenciadorFaixas.
+        """
+        caminho_arquivo = os.path.join(self.diretorio_faixas, os.path.basename(caminho_arquivo))
+        faixa = None
+        if os.path.exists(caminho_arquivo):
+            faixa = self._ler_faixa(caminho_arquivo)
+            if faixa is None:
+                return self
+
+        novo = GerenciadorFaixas.__new__(GerenciadorFaixas)
+        novo.diretorio_faixas = self.diretorio_faixas
+        novo._faixas = dict(self._faixas)
+        novo._arquivos = dict(self._arquivos)
+        novo._nomes_tecnicas = dict(self._nomes_tecnicas)
+
+        cor_anterior = novo._arquivos.pop(caminho_arquivo, None)
+        if cor_anterior is not None:
+            novo._faixas.pop(cor_anterior, None)
+
+        if faixa is not None:
+            faixa = novo._internar(faixa)
+            novo._faixas[faixa.cor.lower()] = faixa
+            novo._arquivos[caminho_arquivo] = faixa.cor.lower()
+        novo._indexar()
+        return novo
+
+    def posicao(self, cor: str) -> int:
+        """Retorna a posição da faixa na ordem de graduação.
+
+        Raises:
+            ValueError: Se a faixa não for encontrada.
+        """
+        posicao = self._posicoes.get(cor.lower())
+        if posicao is None:
+            raise ValueError(f"Faixa {cor.lower()} não encontrada")
+        return posicao
 
     def get_faixa(self, cor: str) -> Faixa:
         """Retorna uma faixa específica pelo nome da cor.
@@ -109,19 +292,48 @@ class GerenciadorFaixas:
         Raises:
             ValueError: Se a faixa não for encontrada.
         """
-        cor = cor.lower()
-        if cor not in self._faixas:
-            raise ValueError(f"Faixa {cor} não encontrada")
-        return self._faixas[cor]
+        return self._ordenadas[self.posicao(cor)]
+
+    def get_faixa_por_grau(self, grau: Union[Grau, str]) -> Faixa:
+        """Retorna a faixa de uma graduação (ex: ``"8 GUB"`` ou ``Grau(TipoGrau.GUB, 8)``).
+
+        Raises:
+            ValueError: Se nenhuma faixa tiver a graduação.
+        """
+        if isinstance(grau, str):
+            grau = Grau.de_texto(grau)
+        posicao = self._posicoes_grau.get(grau)
+        if posicao is None:
+            raise ValueError(f"Faixa de graduação {grau} não encontrada")
+        return self._ordenadas[posicao]
+
+    def get_faixa_na_posicao(self, posicao: int) -> Faixa:
+        """Retorna a faixa em uma posição da ordem de graduação (0 é a primeira).
+
+        Raises:
+            ValueError: Se não houver faixa na posição.
+        """
+        if not 0 <= posicao < len(self._ordenadas):
+            raise ValueError(f"Não há faixa na posição {posicao}")
+        return self._ordenadas[posicao]
 
     def get_todas_faixas(self) -> List[Faixa]:
         """Retorna todas as faixas disponíveis."""
         return list(self._faixas.values())
 
-    def get_tecnicas_braco_faixa(self, cor: str) -> List[TecnicaFaixa]:
+    def get_faixas_ordenadas(self) -> Tuple[Faixa, ...]:
+        """Retorna as faixas em ordem de graduação (do 10º GUB aos DANs), sem reordenar a cada chamada."""
+        return self._ordenadas
+
+    @property
+    def tecnicas(self) -> Tuple[str, ...]:
+        """Nomes de todas as técnicas, sem repetição, na ordem em que aparecem nas faixas."""
+        return self._tecnicas
+
+    def get_tecnicas_braco_faixa(self, cor: str, indice: Optional[IndiceGlossario] = None) -> List[TecnicaFaixa]:
         """Retorna as técnicas de braço de uma faixa específica."""
-        return self.get_faixa(cor).get_tecnicas_braco_objetos()
+        return self.get_faixa(cor).get_tecnicas_braco_objetos(indice)
 
-    def get_tecnicas_chute_faixa(self, cor: str) -> List[TecnicaFaixa]:
+    def get_tecnicas_chute_faixa(self, cor: str, indice: Optional[IndiceGlossario] = None) -> List[TecnicaFaixa]:
         """Retorna as técnicas de chute de uma faixa específica."""
-        return self.get_faixa(cor).get_tecnicas_chute_objetos()
+        return self.get_faixa(cor).get_tecnicas_chute_objetos(indice)
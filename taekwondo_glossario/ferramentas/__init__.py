@@ -0,0 +1 @@
+"""Ferramentas de medição e manutenção do glossário."""
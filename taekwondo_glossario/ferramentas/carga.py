@@ -0,0 +1,174 @@
+"""Teste de carga do aplicativo Streamlit com sessões simultâneas.
+
+Cada sessão é um ``AppTest`` do Streamlit (execução sem navegador) que segue um roteiro
+realista: digitar uma pesquisa letra a letra, mudar a distância máxima, analisar técnicas
+e trocar de faixa. Cada interação dispara uma nova execução do script, cujo tempo é medido.
+Para cada quantidade de sessões é usado um processo novo, para que o pico de memória
+medido corresponda apenas àquele nível. Uso:
+
+    python -m taekwondo_glossario.ferramentas.carga --sessoes 1,5,10,25 --json carga.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from streamlit.testing.v1 import AppTest
+
+CAMINHO_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "glossary", "app.py")
+
+# Cada passo é (ação, valor); toda ação provoca uma nova execução do script
+Passo = Tuple[str, object]
+
+ROTEIROS: List[List[Passo]] = [
+    [("pesquisa", "a"), ("pesquisa", "ap"), ("pesquisa", "apc"), ("pesquisa", "apch"), ("pesquisa", "apchagi")],
+    [("pesquisa", "momtong"), ("distancia", 1), ("distancia", 3), ("categoria", "PartesCorpo"), ("pesquisa", "")],
+    [
+        ("tecnica", "Apkubi momtong jireugi"),
+        ("analisar", None),
+        ("distancia_tecnica", 3),
+        ("analisar", None),
+    ],
+    [("faixa", 0), ("faixa", 1), ("faixa", 2), ("descricao", False), ("faixa", 3)],
+    [
+        ("tecnica", "Beom Seogi Geodeureo Batangson An Makgi"),
+        ("analisar", None),
+        ("pesquisa", "sonnal"),
+        ("faixa", -1),
+    ],
+]
+
+
+# Seção do app onde fica o widget de cada ação (as demais ações ficam fora das seções)
+SECOES_ACOES = {
+    "pesquisa": "Termos",
+    "distancia": "Termos",
+    "categoria": "Termos",
+    "tecnica": "Técnica",
+    "analisar": "Técnica",
+    "distancia_tecnica": "Técnica",
+    "faixa": "Faixas",
+}
+
+
+def executar_passo(app, passo: Passo):
+    """Aplica uma interação do roteiro e executa o script novamente.
+
+    Se a ação pertence a outra seção, a seção é trocada antes (o que também é uma execução).
+    """
+    acao, valor = passo
+    secao = SECOES_ACOES.get(acao)
+    if secao is not None and app.radio(key="secao").value != secao:
+        app.radio(key="secao").set_value(secao)
+        app.run()
+    if acao == "pesquisa":
+        app.text_input(key="search_input").input(valor)
+    elif acao == "tecnica":
+        app.text_input(key="tecnica_input").input(valor)
+    elif acao == "analisar":
+        app.button(key="analisar_tecnica").click()
+    elif acao == "distancia":
+        app.slider(key="max_distance").set_value(valor)
+    elif acao == "distancia_tecnica":
+        app.slider(key="tecnica_max_distance").set_value(valor)
+    elif acao == "categoria":
+        app.selectbox(key="categoria_select").select(valor)
+    elif acao == "faixa":
+        seletor = app.selectbox(key="faixa_select")
+        seletor.select(seletor.options[valor])
+    elif acao == "descricao":
+        app.sidebar.checkbox[0].set_value(valor)
+    else:
+        raise ValueError(f"Ação {acao} desconhecida")
+    app.run()
+
+
+def _sessao(indice: int, repeticoes: int, pausa: float, timeout: float, inicio: threading.Barrier) -> List[float]:
+    """Executa o roteiro de uma sessão e retorna a duração de cada execução do script."""
+    roteiro = ROTEIROS[indice % len(ROTEIROS)]
+    app = AppTest.from_file(CAMINHO_APP, default_timeout=timeout)
+    inicio.wait()
+
+    duracoes = []
+    antes = time.perf_counter()
+    app.run()
+    duracoes.append(time.perf_counter() - antes)
+    for _ in range(repeticoes):
+        for passo in roteiro:
+            if pausa:
+                time.sleep(pausa)
+            antes = time.perf_counter()
+            executar_passo(app, passo)
+            duracoes.append(time.perf_counter() - antes)
+    return duracoes
+
+
+def _percentil(valores: Sequence[float], p: float) -> float:
+    """Percentil pelo método do vizinho mais próximo."""
+    ordenados = sorted(valores)
+    posicao = max(0, min(len(ordenados) - 1, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[posicao]
+
+
+def medir_nivel(sessoes: int, repeticoes: int = 3, pausa: float = 0.0, timeout: float = 60.0) -> Dict:
+    """Executa ``sessoes`` sessões simultâneas e retorna as estatísticas do nível."""
+    os.environ.setdefault("TAEKWONDO_RECARGA", "0")
+    # O roteiro digita no campo de pesquisa do servidor; o componente do navegador não roda no AppTest
+    os.environ.setdefault("TAEKWONDO_BUSCA_NAVEGADOR", "0")
+    inicio = threading.Barrier(sessoes)
+    antes = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessoes) as executor:
+        futuros = [executor.submit(_sessao, i, repeticoes, pausa, timeout, inicio) for i in range(sessoes)]
+        duracoes = [d for futuro in futuros for d in futuro.result()]
+    total = time.perf_counter() - antes
+
+    return {
+        "sessoes": sessoes,
+        "execucoes": len(duracoes),
+        "p50_ms": _percentil(duracoes, 50) * 1000,
+        "p90_ms": _percentil(duracoes, 90) * 1000,
+        "p99_ms": _percentil(duracoes, 99) * 1000,
+        "media_ms": statistics.mean(duracoes) * 1000,
+        "vazao_por_s": len(duracoes) / total,
+        # ru_maxrss é dado em KiB no Linux
+        "pico_memoria_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessoes", default="1,5,10,25", help="Níveis de sessões simultâneas (separados por vírgula)")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Quantas vezes cada sessão repete o seu roteiro")
+    parser.add_argument("--pausa", type=float, default=0.0, help="Pausa em segundos entre interações")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Tempo máximo de uma execução do script")
+    parser.add_argument("--json", help="Arquivo onde gravar os resultados, para comparação entre versões")
+    args = parser.parse_args()
+
+    niveis = [int(n) for n in args.sessoes.split(",")]
+    resultados = []
+    colunas = ("sessões", "execuções", "p50 ms", "p90 ms", "p99 ms", "exec/s", "pico MiB")
+    print(" ".join(f"{coluna:>9}" for coluna in colunas))
+    for sessoes in niveis:
+        # Um processo novo por nível, para que o pico de memória seja só daquele nível
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            r = executor.submit(medir_nivel, sessoes, args.repeticoes, args.pausa, args.timeout).result()
+        resultados.append(r)
+        print(
+            f"{r['sessoes']:>9} {r['execucoes']:>9} {r['p50_ms']:>9.1f} {r['p90_ms']:>9.1f} "
+            f"{r['p99_ms']:>9.1f} {r['vazao_por_s']:>9.1f} {r['pico_memoria_mib']:>9.1f}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Teste de estresse das estruturas compartilhadas entre threads.
+
+Várias threads executam ao mesmo tempo pesquisas, análises de técnicas e fragmentos
+renderizados sobre os mesmos caches do processo (e, opcionalmente, o mesmo cache
+persistente), como fazem as sessões do Streamlit. Ao final verifica-se que:
+
+- cada resultado é igual ao calculado sem cache, em uma única thread;
+- nenhum termo do índice foi alterado;
+- os resultados compartilhados não aceitam alteração.
+
+Um índice novo é criado a cada execução, para que os caches comecem vazios e sejam
+preenchidos pelas threads em disputa. Com ``--carga``, as operações são sorteadas de uma
+carga gerada a partir do registro de consultas (``ferramentas.consultas carga``), com a
+distribuição real de uso, em vez de todas as combinações com o mesmo peso. Termina com
+código de saída 1 se houver qualquer divergência, termo alterado ou erro, para que possa
+rodar como verificação automática (ex: na integração contínua). Uso:
+
+    python -m taekwondo_glossario.ferramentas.concorrencia --threads 32 --operacoes 2000
+    python -m taekwondo_glossario.ferramentas.concorrencia --carga carga.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import FrozenInstanceError
+from typing import Dict, List, Optional, Tuple
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary import TERMOS_ENUMS
+from ..glossary.busca import buscar_termos, listar_termos, pesquisar
+from ..glossary.cache import CachePersistente
+from ..glossary.consultas import CONSULTA_BUSCA, Consulta
+from ..glossary.registro import IndiceGlossario
+from ..glossary.renderizacao import fragmento_tecnica_faixa
+from ..glossary.tecnica import Tecnica, analisar_tecnica
+
+CONSULTAS = ["apchagi", "momtong", "chagi", "makgi", "jireugi", "sonnal", "base", "ollyeo", "dwit", "chgai", "pe"]
+DISTANCIAS = (1, 2, 3)
+
+# Uma operação é (tipo, texto, categoria, distância máxima)
+Operacao = Tuple[str, str, Optional[str], int]
+
+
+def _operacoes(indice: IndiceGlossario, tecnicas: List[str]) -> List[Operacao]:
+    """Todas as combinações de operações exercitadas pelo teste."""
+    operacoes: List[Operacao] = []
+    for consulta in CONSULTAS:
+        for categoria in (None, *indice.categorias[:3]):
+            for distancia in DISTANCIAS:
+                operacoes.append(("busca", consulta, categoria, distancia))
+    for nome in tecnicas:
+        for distancia in DISTANCIAS:
+            operacoes.append(("tecnica", nome, None, distancia))
+        operacoes.append(("fragmento", nome, None, 2))
+    return operacoes
+
+
+def _operacoes_carga(caminho: str) -> List[Operacao]:
+    """Converte as consultas de um arquivo de carga em operações (com as repetições, que dão o peso)."""
+    with open(caminho, encoding="utf-8") as arquivo:
+        consultas = [Consulta(*campos) for campos in json.load(arquivo)]
+    return [(c.tipo, c.entrada, c.categoria if c.tipo == CONSULTA_BUSCA else None, c.max_distance) for c in consultas]
+
+
+def _executar(operacao: Operacao, indice: IndiceGlossario, cache: Optional[CachePersistente]):
+    """Executa uma operação pelo caminho com cache usado pelo app."""
+    tipo, texto, categoria, distancia = operacao
+    if tipo == "busca":
+        return buscar_termos(texto, distancia, categoria=categoria, indice=indice, cache=cache)
+    if tipo == "tecnica":
+        return analisar_tecnica(texto, distancia, indice=indice, cache=cache).get_termos_ordenados()
+    return fragmento_tecnica_faixa(texto, indice, distancia, cache)
+
+
+def _referencia(operacao: Operacao, indice: IndiceGlossario):
+    """Calcula o resultado esperado sem nenhum cache."""
+    tipo, texto, categoria, distancia = operacao
+    if tipo == "busca":
+        return pesquisar(listar_termos(categoria, indice), texto, distancia)
+    if tipo == "tecnica":
+        return Tecnica(texto, distancia, indice=indice).get_termos_ordenados()
+    return None
+
+
+def _tentar_alterar(registros: tuple) -> List[str]:
+    """Tenta alterar o primeiro registro de um resultado compartilhado e retorna as alterações aceitas."""
+    aceitas = []
+    for registro in registros[:1]:
+        try:
+            registro.termo["coreano"] = "alterado"
+            aceitas.append(f"termo de {type(registro).__name__}")
+        except TypeError:
+            pass
+        try:
+            registro.distancia = -1
+            aceitas.append(f"distância de {type(registro).__name__}")
+        except FrozenInstanceError:
+            pass
+    return aceitas
+
+
+def estressar(
+    threads: int,
+    operacoes_por_thread: int,
+    caminho_cache: Optional[str] = None,
+    semente: int = 0,
+    carga: Optional[List[Operacao]] = None,
+) -> Dict:
+    """Executa o teste e retorna as contagens de operações, divergências e erros.
+
+    Se ``carga`` for informada, as operações são sorteadas dela; senão, de todas as combinações.
+    """
+    indice = IndiceGlossario.de_categorias(TERMOS_ENUMS)
+    if carga:
+        operacoes = carga
+    else:
+        gerenciador = GerenciadorFaixas()
+        tecnicas = [nome for faixa in gerenciador.get_faixas_ordenadas() for nome in faixa.tecnicas_braco[:4]]
+        operacoes = _operacoes(indice, tecnicas)
+    antes_termos = [dict(termo) for termo in indice.todos_termos]
+    esperados = {operacao: _referencia(operacao, indice) for operacao in set(operacoes)}
+    cache = CachePersistente(caminho_cache, tamanho_lote=16) if caminho_cache else None
+
+    divergencias: List[str] = []
+    erros: List[str] = []
+    fragmentos: Dict[str, object] = {}
+    trava = threading.Lock()
+    inicio = threading.Barrier(threads)
+
+    def trabalhar(numero: int):
+        aleatorio = random.Random(semente + numero)
+        inicio.wait()
+        for _ in range(operacoes_por_thread):
+            operacao = aleatorio.choice(operacoes)
+            try:
+                resultado = _executar(operacao, indice, cache)
+                problemas = _tentar_alterar(resultado) if operacao[0] != "fragmento" else []
+            except Exception as erro:  # qualquer erro em uma thread é uma falha do teste
+                with trava:
+                    erros.append(f"{operacao}: {erro!r}")
+                continue
+            with trava:
+                esperado = esperados[operacao]
+                if operacao[0] == "fragmento":
+                    # Sem referência independente: todas as threads devem ver o mesmo fragmento
+                    esperado = fragmentos.setdefault(operacao[1], resultado)
+                if resultado != esperado:
+                    divergencias.append(f"{operacao}: resultado diferente do esperado")
+                divergencias.extend(f"{operacao}: {problema} aceitou alteração" for problema in problemas)
+
+    antes = time.perf_counter()
+    grupo = [threading.Thread(target=trabalhar, args=(i,)) for i in range(threads)]
+    for thread in grupo:
+        thread.start()
+    for thread in grupo:
+        thread.join()
+    duracao = time.perf_counter() - antes
+    if cache is not None:
+        cache.close()
+
+    alterados = [antes["coreano"] for antes, termo in zip(antes_termos, indice.todos_termos) if antes != dict(termo)]
+    return {
+        "threads": threads,
+        "operacoes": threads * operacoes_por_thread,
+        "segundos": duracao,
+        "divergencias": divergencias,
+        "termos_alterados": alterados,
+        "erros": erros,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32, help="Número de threads simultâneas")
+    parser.add_argument("--operacoes", type=int, default=2000, help="Operações por thread")
+    parser.add_argument("--cache", help="Arquivo SQLite do cache persistente compartilhado (opcional)")
+    parser.add_argument("--semente", type=int, default=0, help="Semente da escolha das operações")
+    parser.add_argument("--carga", help="Arquivo de carga gerado a partir do registro de consultas")
+    args = parser.parse_args()
+
+    carga = _operacoes_carga(args.carga) if args.carga else None
+    r = estressar(args.threads, args.operacoes, args.cache, args.semente, carga)
+    print(f"{r['operacoes']} operações em {r['threads']} threads ({r['operacoes'] / r['segundos']:.0f} op/s)")
+    secoes = (("Divergências", "divergencias"), ("Termos alterados", "termos_alterados"), ("Erros", "erros"))
+    for titulo, chave in secoes:
+        print(f"{titulo}: {len(r[chave])}")
+        for item in r[chave][:10]:
+            print(f"  {item}")
+    falhas = sum(len(r[chave]) for _, chave in secoes)
+    if falhas:
+        sys.exit(f"FALHA: {falhas} problemas de concorrência")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Calcula a matriz de confusão (distâncias entre todos os pares de termos) do glossário.
+
+Mostra os pares de termos mais parecidos e, para cada distância, quantos termos a têm
+como distância máxima segura (aquela em que um erro de digitação não pode ser confundido
+com outro termo). Com ``--sinteticos`` o cálculo é feito sobre um glossário sintético
+do tamanho pedido, para medir tempo e memória em glossários grandes. Uso:
+
+    python -m taekwondo_glossario.ferramentas.confusao --limiar 4 --json pares.json
+    python -m taekwondo_glossario.ferramentas.confusao --sinteticos 100000 --limiar 2
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from collections import Counter
+from typing import List
+
+from ..glossary.confusao import LIMIAR_PADRAO, TAMANHO_LOTE, MatrizConfusao, calcular_pares, np
+from ..glossary.registro import get_registro
+
+SILABAS = ["ap", "dwit", "yeop", "chagi", "chigi", "makgi", "son", "bal", "mok", "geo", "deu", "reo", "ol", "lyeo"]
+
+
+def termos_sinteticos(quantidade: int, semente: int = 0) -> List[str]:
+    """Gera romanizações distintas combinando sílabas comuns do glossário."""
+    aleatorio = random.Random(semente)
+    termos = set()
+    while len(termos) < quantidade:
+        termos.add("".join(aleatorio.choice(SILABAS) for _ in range(aleatorio.randint(2, 4))))
+    return sorted(termos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limiar", type=int, default=LIMIAR_PADRAO, help="Maior distância guardada entre dois termos")
+    parser.add_argument("--distancia", help="Backend de distância (padrão: o configurado)")
+    parser.add_argument("--sinteticos", type=int, help="Usa um glossário sintético com este número de termos")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="Pares calculados de uma vez (memória)")
+    parser.add_argument("--mostrar", type=int, default=20, help="Quantos pares mais parecidos mostrar")
+    parser.add_argument("--json", help="Arquivo onde gravar os pares (chave, chave, distância)")
+    args = parser.parse_args()
+
+    if args.sinteticos:
+        chaves = termos_sinteticos(args.sinteticos)
+    else:
+        chaves = [entrada.chave for entrada in get_registro().indice.entradas]
+
+    tracemalloc.start()
+    antes = time.perf_counter()
+    pares = list(calcular_pares(chaves, args.limiar, args.distancia, args.lote))
+    duracao = time.perf_counter() - antes
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    matriz = MatrizConfusao(chaves, pares, args.limiar)
+    print(
+        f"{len(chaves)} termos, {len(pares)} pares até distância {args.limiar} "
+        f"em {duracao:.2f} s (pico de memória {pico / 2**20:.1f} MiB, numpy: {'sim' if np is not None else 'não'})"
+    )
+
+    print("\nPares mais parecidos:")
+    for i, j, d in sorted(pares, key=lambda p: (p[2], chaves[p[0]], chaves[p[1]]))[: args.mostrar]:
+        print(f"  {d:>4}  {chaves[i]} / {chaves[j]}")
+
+    print("\nDistância máxima segura:")
+    seguras = Counter(matriz.distancia_segura(chave) for chave in chaves)
+    for distancia, quantidade in sorted(seguras.items()):
+        print(f"  {distancia:>4}: {quantidade} termos")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump([[chaves[i], chaves[j], d] for i, j, d in pares], arquivo, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
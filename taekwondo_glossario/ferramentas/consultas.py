@@ -0,0 +1,69 @@
+"""Mostra, reproduz e transforma em carga de teste o registro de consultas do app.
+
+O registro é gravado pelo app quando TAEKWONDO_CONSULTAS indica o arquivo. Comandos:
+
+- ``mostrar``: lista as consultas mais frequentes;
+- ``aquecer``: executa as mais frequentes, preenchendo o cache persistente (SQLite) que o
+  app vai usar, para que ele não comece vazio após uma implantação;
+- ``carga``: sorteia uma sequência de consultas com a distribuição registrada, para ser
+  usada como carga realista (ex: ``concorrencia --carga``).
+
+Uso:
+
+    python -m taekwondo_glossario.ferramentas.consultas consultas.json mostrar --top 20
+    python -m taekwondo_glossario.ferramentas.consultas consultas.json aquecer --cache cache.sqlite --top 500
+    python -m taekwondo_glossario.ferramentas.consultas consultas.json carga --quantidade 10000 --saida carga.json
+"""
+
+import argparse
+import json
+import time
+
+from ..glossary.cache import CachePersistente
+from ..glossary.consultas import AQUECER_PADRAO, LogConsultas, aquecer, gerar_carga
+from ..glossary.registro import get_registro
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("arquivo", help="Arquivo do registro de consultas")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    mostrar = comandos.add_parser("mostrar", help="Lista as consultas mais frequentes")
+    mostrar.add_argument("--top", type=int, default=20, help="Quantas consultas mostrar")
+
+    aquecimento = comandos.add_parser("aquecer", help="Preenche o cache persistente com as consultas mais frequentes")
+    aquecimento.add_argument("--cache", required=True, help="Arquivo SQLite do cache persistente")
+    aquecimento.add_argument("--top", type=int, default=AQUECER_PADRAO, help="Quantas consultas executar")
+
+    carga = comandos.add_parser("carga", help="Gera uma carga de teste com a distribuição registrada")
+    carga.add_argument("--quantidade", type=int, default=10000, help="Número de consultas sorteadas")
+    carga.add_argument("--semente", type=int, default=0, help="Semente do sorteio")
+    carga.add_argument("--saida", required=True, help="Arquivo JSON da carga")
+    args = parser.parse_args()
+
+    log = LogConsultas(args.arquivo)
+    if args.comando == "mostrar":
+        for consulta, contagem in log.mais_frequentes(args.top):
+            opcoes = f"distância {consulta.max_distance}"
+            if consulta.categoria:
+                opcoes += f", {consulta.categoria}"
+            if consulta.distancia_segura:
+                opcoes += ", distância segura"
+            print(f"{contagem:>8}  {consulta.tipo:<8} {consulta.entrada} ({opcoes})")
+    elif args.comando == "aquecer":
+        frequentes = [consulta for consulta, _ in log.mais_frequentes(args.top)]
+        antes = time.perf_counter()
+        with CachePersistente(args.cache) as cache:
+            executadas = aquecer(frequentes, get_registro().indice, cache)
+        resumo = ", ".join(f"{n} de {tipo}" for tipo, n in sorted(executadas.items())) or "nenhuma"
+        print(f"Consultas executadas: {resumo} em {time.perf_counter() - antes:.2f} s")
+    else:
+        consultas = gerar_carga(log.mais_frequentes(), args.quantidade, args.semente)
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump([list(consulta) for consulta in consultas], arquivo, ensure_ascii=False)
+        print(f"{len(consultas)} consultas gravadas em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
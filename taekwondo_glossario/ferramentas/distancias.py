@@ -0,0 +1,195 @@
+"""Avaliação e benchmark dos backends de distância sobre um corpus de erros de digitação.
+
+O corpus é gerado a partir do próprio glossário: para cada termo são produzidos erros
+rotulados por tipo (troca de letras vizinhas, substituição, remoção, inserção, consoante
+dobrada ou simplificada e prefixo incompleto), de forma determinística pela semente. Para
+medir falsos positivos, o corpus inclui também palavras das traduções em português, que não
+devem corresponder a nenhum termo. Cada backend analisa cada entrada como uma técnica de
+uma palavra e acerta quando encontra exatamente o termo de origem (ou nenhum termo). Uso:
+
+    python -m taekwondo_glossario.ferramentas.distancias --max-distance 2 --json distancias.json
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from ..glossary.distancias import DISTANCIAS
+from ..glossary.registro import IndiceGlossario, get_registro, normalizar_coreano
+from ..glossary.tecnica import Tecnica
+
+LETRAS = "abcdefghijklmnopqrstuvwxyz"
+VOGAIS = set("aeiou")
+
+# Termos mais curtos que isto não recebem erros (qualquer erro os aproxima de outro termo)
+TAMANHO_MINIMO_TERMO = 4
+
+# Palavras das traduções usadas como não termos precisam de pelo menos este tamanho
+TAMANHO_MINIMO_NAO_TERMO = 3
+
+# Fração da palavra mantida nos erros de prefixo incompleto
+PROPORCAO_PREFIXO = 0.7
+
+
+class ErroDigitacao(NamedTuple):
+    """Uma entrada do corpus: o texto digitado, o termo esperado (ou None) e o tipo de erro."""
+
+    digitado: str
+    esperado: Optional[str]
+    tipo: str
+
+
+def _trocar(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Troca duas letras vizinhas."""
+    posicao = min(posicao, len(palavra) - 2)
+    if palavra[posicao] == palavra[posicao + 1]:
+        return None
+    return palavra[:posicao] + palavra[posicao + 1] + palavra[posicao] + palavra[posicao + 2 :]
+
+
+def _substituir(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Troca uma letra por outra."""
+    letra = aleatorio.choice(LETRAS.replace(palavra[posicao], ""))
+    return palavra[:posicao] + letra + palavra[posicao + 1 :]
+
+
+def _remover(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Remove uma letra."""
+    return palavra[:posicao] + palavra[posicao + 1 :]
+
+
+def _inserir(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Insere uma letra qualquer."""
+    return palavra[:posicao] + aleatorio.choice(LETRAS) + palavra[posicao:]
+
+
+def _dobrar_consoante(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Simplifica uma consoante dobrada ou, se não houver, dobra uma consoante."""
+    dobradas = [i for i in range(len(palavra) - 1) if palavra[i] == palavra[i + 1] and palavra[i] not in VOGAIS]
+    if dobradas:
+        i = aleatorio.choice(dobradas)
+        return palavra[:i] + palavra[i + 1 :]
+    consoantes = [i for i, c in enumerate(palavra) if c.isalpha() and c not in VOGAIS]
+    if not consoantes:
+        return None
+    i = aleatorio.choice(consoantes)
+    return palavra[: i + 1] + palavra[i:]
+
+
+def _cortar(palavra: str, posicao: int, aleatorio: random.Random) -> Optional[str]:
+    """Mantém só o começo da palavra, como um prefixo digitado pela metade."""
+    return palavra[: math.ceil(len(palavra) * PROPORCAO_PREFIXO)]
+
+
+# Geradores de cada tipo de erro: recebem a palavra, uma posição sorteada e o gerador aleatório
+_GERADORES_ERRO: Dict[str, Callable[[str, int, random.Random], Optional[str]]] = {
+    "troca": _trocar,
+    "substituicao": _substituir,
+    "remocao": _remover,
+    "insercao": _inserir,
+    "consoante_dobrada": _dobrar_consoante,
+    "prefixo": _cortar,
+}
+
+
+def _errar(palavra: str, tipo: str, aleatorio: random.Random) -> Optional[str]:
+    """Aplica um erro do tipo pedido à palavra, ou retorna None se não for possível."""
+    gerador = _GERADORES_ERRO.get(tipo)
+    if gerador is None:
+        raise ValueError(f"Tipo de erro {tipo} desconhecido")
+    return gerador(palavra, aleatorio.randrange(len(palavra)), aleatorio)
+
+
+TIPOS_ERRO = ("troca", "substituicao", "remocao", "insercao", "consoante_dobrada", "prefixo", "nao_termo")
+
+
+def gerar_corpus(indice: IndiceGlossario, por_termo: int = 3, semente: int = 0) -> List[ErroDigitacao]:
+    """Gera o corpus rotulado de erros de digitação a partir dos termos de uma palavra do índice."""
+    aleatorio = random.Random(semente)
+    chaves = {entrada.chave for entrada in indice.entradas}
+    corpus = []
+    nao_termos = set()
+    for entrada in indice.entradas:
+        nao_termos.update(
+            p for p in normalizar_coreano(entrada.termo["portugues"]).split() if len(p) >= TAMANHO_MINIMO_NAO_TERMO
+        )
+        palavra = entrada.chave
+        if " " in palavra or len(palavra) < TAMANHO_MINIMO_TERMO:
+            continue
+        for tipo in TIPOS_ERRO[:-1]:
+            for _ in range(por_termo if tipo != "prefixo" else 1):
+                digitado = _errar(palavra, tipo, aleatorio)
+                # Erros que formam outro termo do glossário não têm resposta certa
+                if digitado and digitado != palavra and digitado not in chaves:
+                    corpus.append(ErroDigitacao(digitado, palavra, tipo))
+    corpus.extend(ErroDigitacao(palavra, None, "nao_termo") for palavra in sorted(nao_termos - chaves))
+    return corpus
+
+
+def avaliar(
+    corpus: Sequence[ErroDigitacao], nome: str, max_distance: int = 2, indice: Optional[IndiceGlossario] = None
+) -> Dict:
+    """Mede a taxa de acerto por tipo de erro e o tempo médio por análise de um backend."""
+    indice = indice if indice is not None else get_registro().indice
+    acertos: Dict[str, int] = defaultdict(int)
+    totais: Dict[str, int] = defaultdict(int)
+    sem_resultado = 0
+    antes = time.perf_counter()
+    for erro in corpus:
+        termos = Tecnica(
+            erro.digitado, max_distance, indice=indice, distancia=nome, ambiguidades=False
+        ).get_termos_ordenados()
+        totais[erro.tipo] += 1
+        if not termos:
+            sem_resultado += 1
+            acertos[erro.tipo] += erro.esperado is None
+        elif erro.esperado is not None and normalizar_coreano(termos[0].termo["coreano"]) == erro.esperado:
+            acertos[erro.tipo] += 1
+    duracao = time.perf_counter() - antes
+
+    return {
+        "distancia": nome,
+        "max_distance": max_distance,
+        "acerto": sum(acertos.values()) / len(corpus),
+        "acerto_por_tipo": {tipo: acertos[tipo] / totais[tipo] for tipo in TIPOS_ERRO if totais[tipo]},
+        "sem_resultado": sem_resultado / len(corpus),
+        "us_por_analise": duracao / len(corpus) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-distance", type=int, default=2, help="Distância máxima usada nas análises")
+    parser.add_argument("--por-termo", type=int, default=3, help="Erros gerados por termo e por tipo")
+    parser.add_argument("--semente", type=int, default=0, help="Semente do gerador de erros")
+    parser.add_argument("--json", help="Arquivo onde gravar os resultados")
+    args = parser.parse_args()
+
+    corpus = gerar_corpus(get_registro().indice, args.por_termo, args.semente)
+    print(f"Corpus: {len(corpus)} erros de digitação")
+    resultados = [avaliar(corpus, nome, args.max_distance) for nome in DISTANCIAS]
+
+    colunas = ("distância", "acerto", *TIPOS_ERRO, "nenhum", "µs/análise")
+    print(" ".join(f"{coluna[:12]:>12}" for coluna in colunas))
+    for r in resultados:
+        por_tipo = " ".join(f"{r['acerto_por_tipo'].get(tipo, 0):>12.1%}" for tipo in TIPOS_ERRO)
+        print(
+            f"{r['distancia']:>12} {r['acerto']:>12.1%} {por_tipo} {r['sem_resultado']:>12.1%} "
+            f"{r['us_por_analise']:>12.1f}"
+        )
+
+    # O mais preciso; em caso de empate, o mais rápido
+    melhor = max(resultados, key=lambda r: (round(r["acerto"], 3), -r["us_por_analise"]))
+    print(f"\nRecomendado: TAEKWONDO_DISTANCIA={melhor['distancia']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=4, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compara a biblioteca em C python-Levenshtein com o cálculo em Python puro (Myers).
+
+A carga é a mesma de uma pesquisa no app: cada entrada do corpus de erros de digitação
+é comparada com a romanização e a tradução de todos os termos do glossário, com e sem
+distância máxima. Antes de medir, confere que as duas implementações dão os mesmos
+resultados. Sem a biblioteca em C instalada, mede apenas o cálculo em Python. Uso:
+
+    python -m taekwondo_glossario.ferramentas.levenshtein --max-distance 2 --repeticoes 5
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from ..glossary.distancias import Levenshtein, _mascaras_padrao, levenshtein_myers
+from ..glossary.registro import get_registro
+from .distancias import gerar_corpus
+
+Comparacao = Tuple[str, str]
+
+
+def _comparacoes() -> List[Comparacao]:
+    """Pares (consulta, campo do termo) comparados por uma pesquisa de cada entrada do corpus."""
+    indice = get_registro().indice
+    campos = [campo.lower() for termo in indice.todos_termos for campo in (termo["coreano"], termo["portugues"])]
+    return [(erro.digitado, campo) for erro in gerar_corpus(indice) for campo in campos]
+
+
+def _medir(
+    calcular: Callable, comparacoes: List[Comparacao], limite: Optional[int], repeticoes: int
+) -> Tuple[float, List[int]]:
+    """Menor tempo (em segundos) entre as repetições e as distâncias calculadas."""
+    melhor = float("inf")
+    distancias: List[int] = []
+    for _ in range(repeticoes):
+        antes = time.perf_counter()
+        if limite is None:
+            distancias = [calcular(a, b) for a, b in comparacoes]
+        else:
+            distancias = [calcular(a, b, limite) for a, b in comparacoes]
+        melhor = min(melhor, time.perf_counter() - antes)
+    return melhor, distancias
+
+
+def _c(a: str, b: str, limite: Optional[int] = None) -> int:
+    if limite is None:
+        return Levenshtein.distance(a, b)
+    return Levenshtein.distance(a, b, score_cutoff=limite)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-distance", type=int, default=2, help="Distância máxima das comparações com limite")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições de cada medida (vale a menor)")
+    args = parser.parse_args()
+
+    comparacoes = _comparacoes()
+    print(f"{len(comparacoes)} comparações por medida")
+
+    _mascaras_padrao.cache_clear()
+    antes = time.perf_counter()
+    _medir(levenshtein_myers, comparacoes, None, 1)
+    print(f"Python (Myers), máscaras ainda não calculadas: {time.perf_counter() - antes:.3f} s")
+
+    divergencias = 0
+    for limite in (None, args.max_distance):
+        rotulo = "sem limite" if limite is None else f"limite {limite}"
+        tempo_myers, myers = _medir(levenshtein_myers, comparacoes, limite, args.repeticoes)
+        linha = f"{rotulo:>12}: Python (Myers) {tempo_myers:.3f} s"
+        if Levenshtein is not None:
+            tempo_c, referencia = _medir(_c, comparacoes, limite, args.repeticoes)
+            divergencias += sum(x != y for x, y in zip(myers, referencia))
+            linha += f", C {tempo_c:.3f} s ({tempo_myers / tempo_c:.1f}x mais lento em Python)"
+        print(linha)
+
+    if Levenshtein is None:
+        print("python-Levenshtein não está instalado: só o cálculo em Python foi medido")
+    elif divergencias:
+        print(f"{divergencias} distâncias diferentes entre as implementações")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
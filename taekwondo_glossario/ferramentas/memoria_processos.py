@@ -0,0 +1,135 @@
+"""Mede a memória exclusiva e a compartilhada de cada processo do servidor pré-fork.
+
+Sobe ``taekwondo_glossario.servidor`` com vários processos em três modos: cada processo
+montando os seus dados (``independente``), dados montados antes do fork (``pre-fork``) e
+dados montados antes do fork com ``gc.freeze()`` (``pre-fork+freeze``). Em cada modo,
+envia uma carga de pesquisas, análises de técnicas e páginas de faixas em todos os
+idiomas e então lê ``/proc/<pid>/smaps_rollup`` de cada processo: memória exclusiva
+(páginas privadas, que só aquele processo usa), compartilhada e PSS (a parte de cada
+processo nas páginas compartilhadas); o PSS total soma também o processo principal.
+Somente Linux. Uso:
+
+    python -m taekwondo_glossario.ferramentas.memoria_processos --processos 4 --requisicoes 2000
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+from urllib.parse import quote, urlencode
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary.idiomas import idiomas_disponiveis
+
+CONSULTAS = ["apchagi", "momtong", "chagi", "makgi", "jireugi", "sonnal", "base", "ollyeo", "dwit", "chute"]
+
+MODOS = {
+    "independente": ["--sem-pre-fork"],
+    "pre-fork": ["--sem-congelar"],
+    "pre-fork+freeze": [],
+}
+
+
+def memoria_processo(pid: int) -> Dict[str, int]:
+    """Memória de um processo em bytes: ``rss``, ``pss``, ``exclusiva`` e ``compartilhada``."""
+    campos = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as arquivo:
+        for linha in arquivo:
+            # Linhas de campo têm a forma "Rss:   1234 kB"
+            nome, *valor = linha.split()
+            if valor[1:] == ["kB"]:
+                campos[nome.rstrip(":")] = int(valor[0]) * 1024
+    return {
+        "rss": campos["Rss"],
+        "pss": campos["Pss"],
+        "exclusiva": campos["Private_Clean"] + campos["Private_Dirty"],
+        "compartilhada": campos["Shared_Clean"] + campos["Shared_Dirty"],
+    }
+
+
+def _porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rotas() -> List[str]:
+    """Carga: pesquisas, técnicas e faixas em todos os idiomas."""
+    gerenciador = GerenciadorFaixas()
+    rotas = []
+    for idioma in idiomas_disponiveis():
+        rotas.extend(f"/termos?{urlencode({'q': q, 'idioma': idioma})}" for q in CONSULTAS)
+        rotas.extend(f"/tecnica?{urlencode({'nome': nome, 'idioma': idioma})}" for nome in gerenciador.tecnicas)
+        rotas.extend(f"/faixas/{quote(f.cor)}?idioma={idioma}" for f in gerenciador.get_faixas_ordenadas())
+    return rotas
+
+
+def _obter(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=30) as resposta:
+        return resposta.read()
+
+
+def medir_modo(
+    argumentos: Sequence[str], processos: int, requisicoes: int, threads: int
+) -> Tuple[Dict[str, int], List[Dict[str, int]]]:
+    """Sobe o servidor, aplica a carga e retorna a memória do processo principal e a de cada filho."""
+    porta = _porta_livre()
+    base = f"http://127.0.0.1:{porta}"
+    comando = [sys.executable, "-m", "taekwondo_glossario.servidor", "--porta", str(porta)]
+    servidor = subprocess.Popen([*comando, "--processos", str(processos), *argumentos])
+    try:
+        limite = time.monotonic() + 60
+        while True:
+            try:
+                _obter(base + "/saude")
+                break
+            except OSError:
+                if time.monotonic() > limite or servidor.poll() is not None:
+                    raise RuntimeError("O servidor não respondeu") from None
+                time.sleep(0.1)
+
+        rotas = _rotas()
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(_obter, (base + rotas[i % len(rotas)] for i in range(requisicoes))))
+
+        with open(f"/proc/{servidor.pid}/task/{servidor.pid}/children", encoding="ascii") as arquivo:
+            filhos = [int(pid) for pid in arquivo.read().split()]
+        return memoria_processo(servidor.pid), [memoria_processo(pid) for pid in filhos]
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processos", type=int, default=4, help="Processos do servidor")
+    parser.add_argument("--requisicoes", type=int, default=2000, help="Requisições enviadas em cada modo")
+    parser.add_argument("--threads", type=int, default=8, help="Requisições simultâneas")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("Esta medição usa /proc/<pid>/smaps_rollup e só funciona no Linux")
+
+    mb = 1024 * 1024
+    print(f"{'modo':<16} {'exclusiva/proc':>14} {'compart./proc':>14} {'PSS/proc':>10} {'PSS total':>10}")
+    for modo, argumentos in MODOS.items():
+        principal, memorias = medir_modo(argumentos, args.processos, args.requisicoes, args.threads)
+        n = len(memorias)
+        exclusiva = sum(m["exclusiva"] for m in memorias) / n
+        compartilhada = sum(m["compartilhada"] for m in memorias) / n
+        pss = sum(m["pss"] for m in memorias)
+        # O total inclui o processo principal, que no pré-fork também mantém as páginas montadas
+        total = pss + principal["pss"]
+        print(
+            f"{modo:<16} {exclusiva / mb:>11.1f} MB {compartilhada / mb:>11.1f} MB "
+            f"{pss / n / mb:>7.1f} MB {total / mb:>7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Mede a memória retida por sessão do aplicativo Streamlit.
+
+Cada sessão é um ``AppTest`` do Streamlit (execução sem navegador, como em
+``ferramentas.carga``) que percorre um dos roteiros do teste de carga e continua viva até
+o fim da medição, com o seu ``session_state`` e a árvore de elementos da última execução.
+Como índice, faixas e resultados são objetos compartilhados no processo, a memória por
+sessão adicional deve permanecer praticamente constante. A medição inclui a árvore de
+elementos guardada por cada ``AppTest``, que corresponde ao que o servidor envia ao
+navegador. Uso:
+
+    python -m taekwondo_glossario.ferramentas.memoria_sessoes --sessoes 100
+"""
+
+import argparse
+import gc
+import os
+import tracemalloc
+from typing import List, Tuple
+
+from streamlit.testing.v1 import AppTest
+
+from taekwondo_glossario.ferramentas.carga import CAMINHO_APP, ROTEIROS, executar_passo
+
+
+def criar_sessao(numero: int, timeout: float) -> AppTest:
+    """Abre uma sessão e executa o roteiro correspondente ao seu número."""
+    app = AppTest.from_file(CAMINHO_APP, default_timeout=timeout)
+    app.run()
+    for passo in ROTEIROS[numero % len(ROTEIROS)]:
+        executar_passo(app, passo)
+    return app
+
+
+def medir(total_sessoes: int, pontos: List[int], timeout: float = 60.0) -> List[Tuple[int, int]]:
+    """Cria sessões até ``total_sessoes`` e retorna (sessões, bytes alocados) em cada ponto."""
+    os.environ.setdefault("TAEKWONDO_RECARGA", "0")
+    # Os roteiros digitam no campo de pesquisa do servidor; o componente do navegador não roda no AppTest
+    os.environ.setdefault("TAEKWONDO_BUSCA_NAVEGADOR", "0")
+
+    # Aquece as estruturas compartilhadas (uma sessão por roteiro) antes de começar a medir
+    for numero in range(len(ROTEIROS)):
+        criar_sessao(numero, timeout)
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+
+    sessoes = []
+    medicoes = []
+    for n in range(1, total_sessoes + 1):
+        sessoes.append(criar_sessao(n, timeout))
+        if n in pontos:
+            gc.collect()
+            atual, _ = tracemalloc.get_traced_memory()
+            medicoes.append((n, atual - base))
+    tracemalloc.stop()
+    return medicoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessoes", type=int, default=100, help="Número de sessões abertas")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Tempo máximo de uma execução do script")
+    args = parser.parse_args()
+
+    pontos = sorted({p for p in (1, 10, 25, 50, 100, 250, 500, args.sessoes) if p <= args.sessoes})
+    medicoes = medir(args.sessoes, pontos, args.timeout)
+
+    print(f"{'sessões':>8} {'memória (KiB)':>14} {'bytes/sessão adicional':>24}")
+    anterior = None
+    for n, total in medicoes:
+        marginal = "" if anterior is None else f"{(total - anterior[1]) / (n - anterior[0]):.0f}"
+        print(f"{n:>8} {total / 1024:>14.1f} {marginal:>24}")
+        anterior = (n, total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Mostra o efeito de uma mudança no glossário sobre as técnicas analisadas.
+
+O corpus (as técnicas das faixas e, opcionalmente, as de um arquivo, uma por linha) é
+analisado com o glossário atual, registrando as dependências de cada técnica; depois o
+glossário é trocado pelo do diretório informado (um ``<Categoria>.json`` por categoria,
+como os gravados por ``exportar_categorias``) e só as técnicas afetadas são reanalisadas.
+O relatório lista as técnicas cujo resultado mudou. Com ``--comparar``, também refaz a
+análise completa e confere que os resultados são os mesmos. Uso:
+
+    python -m taekwondo_glossario.ferramentas.reanalise glossario_editado/ --tecnicas corpus.txt --comparar
+"""
+
+import argparse
+import sys
+import time
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary.cache import CachePersistente
+from ..glossary.dependencias import CorpusAnalises, assinatura
+from ..glossary.fontes import carregar_categorias
+from ..glossary.registro import NAMESPACE_PADRAO, IndiceGlossario, get_registro
+from ..glossary.tecnica import Tecnica
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("glossario", help="Diretório com o glossário alterado (um <Categoria>.json por categoria)")
+    parser.add_argument("--tecnicas", help="Arquivo com técnicas adicionais, uma por linha")
+    parser.add_argument("--max-distance", type=int, default=2, help="Distância máxima permitida para cada palavra")
+    parser.add_argument("--distancia-segura", action="store_true", help="Limita cada termo à sua distância segura")
+    parser.add_argument("--cache", help="Cache persistente onde regravar as análises que não mudaram")
+    parser.add_argument("--comparar", action="store_true", help="Refaz a análise completa e compara os resultados")
+    args = parser.parse_args()
+
+    nomes = list(GerenciadorFaixas().tecnicas)
+    if args.tecnicas:
+        with open(args.tecnicas, encoding="utf-8") as arquivo:
+            nomes.extend(linha.strip() for linha in arquivo if linha.strip())
+
+    cache = CachePersistente(args.cache) if args.cache else None
+    corpus = CorpusAnalises(
+        get_registro().indice, args.max_distance, distancia_segura=args.distancia_segura, cache=cache
+    )
+    antes = time.perf_counter()
+    corpus.adicionar(nomes)
+    print(f"{len(corpus)} técnicas analisadas em {time.perf_counter() - antes:.2f} s", file=sys.stderr)
+
+    novo = IndiceGlossario.de_categorias(carregar_categorias(args.glossario), NAMESPACE_PADRAO)
+    relatorio = corpus.atualizar(novo)
+    print(relatorio)
+    if cache is not None:
+        cache.close()
+
+    if args.comparar:
+        antes = time.perf_counter()
+        divergentes = [
+            nome
+            for nome in corpus.resultados()
+            if assinatura(
+                Tecnica(
+                    nome, args.max_distance, indice=novo, distancia_segura=args.distancia_segura
+                ).get_termos_ordenados()
+            )
+            != assinatura(corpus.resultado(nome))
+        ]
+        print(f"Análise completa: {time.perf_counter() - antes:.2f} s", file=sys.stderr)
+        if divergentes:
+            print(f"{len(divergentes)} técnicas diferentes da análise completa: {', '.join(divergentes[:10])}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Divide sequências de movimentos ou roteiros de poomsae em movimentos individuais.
+
+O texto (arquivos ou a entrada padrão, com ``-``) é lido em blocos e cada movimento é
+impresso assim que termina, com a base, a ação e os termos encontrados; movimentos sem
+ação (incompletos) são marcados. Ao final, informa o tempo até o primeiro movimento e o
+tempo total. Uso:
+
+    python -m taekwondo_glossario.ferramentas.sequencia poomsae.txt
+    echo "Apgubi Montong Hecheo Makgi Mureup Ollyeo Chigi" | python -m taekwondo_glossario.ferramentas.sequencia -
+"""
+
+import argparse
+import sys
+import time
+
+from ..glossary.sequencia import dividir_arquivo, dividir_movimentos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("arquivos", nargs="+", help="Arquivos de texto (- para a entrada padrão)")
+    parser.add_argument("--max-distance", type=int, default=2, help="Distância máxima permitida para cada palavra")
+    parser.add_argument("--distancia", help="Backend de distância (padrão: o configurado)")
+    parser.add_argument("--bloco", type=int, default=1 << 16, help="Caracteres lidos de cada vez")
+    args = parser.parse_args()
+
+    opcoes = {"max_distance": args.max_distance, "distancia": args.distancia}
+    antes = time.perf_counter()
+    primeiro = None
+    total = 0
+    for caminho in args.arquivos:
+        if caminho == "-":
+            movimentos = dividir_movimentos(iter(lambda: sys.stdin.read(args.bloco), ""), **opcoes)
+        else:
+            movimentos = dividir_arquivo(caminho, args.bloco, **opcoes)
+        for movimento in movimentos:
+            if primeiro is None:
+                primeiro = time.perf_counter() - antes
+            total += 1
+            base = movimento.base.termo["coreano"] if movimento.base else "-"
+            acao = movimento.acao.termo["coreano"] if movimento.acao else "(incompleto)"
+            termos = ", ".join(t.termo["coreano"] for t in movimento.termos)
+            print(f"{total:>5}. {movimento.nome}\n       base: {base}; ação: {acao}; termos: {termos}")
+
+    duracao = time.perf_counter() - antes
+    if primeiro is not None:
+        print(f"{total} movimentos em {duracao:.2f} s (primeiro em {primeiro * 1000:.1f} ms)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
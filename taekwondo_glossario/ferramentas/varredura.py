@@ -0,0 +1,67 @@
+"""Extrai as menções de termos e técnicas de documentos de texto livre.
+
+Cada arquivo (ou a entrada padrão, com ``-``) é lido em blocos e varrido em uma única
+passagem, então documentos de qualquer tamanho usam a mesma memória. Cada menção é
+impressa com o arquivo, a posição (início e fim, em caracteres), a categoria, o termo
+e a distância (0 nas menções exatas). Uso:
+
+    python -m taekwondo_glossario.ferramentas.varredura apostila.txt --tecnicas
+    cat notas.txt | python -m taekwondo_glossario.ferramentas.varredura - --max-distance 2 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from ..faixas.faixa import GerenciadorFaixas
+from ..glossary.varredura import VarredorTexto
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("arquivos", nargs="+", help="Arquivos de texto a varrer (- para a entrada padrão)")
+    parser.add_argument(
+        "--tecnicas", action="store_true", help="Reconhece também os nomes completos das técnicas das faixas"
+    )
+    parser.add_argument("--max-distance", type=int, default=0, help="Distância da verificação aproximada (0 desliga)")
+    parser.add_argument("--distancia", help="Backend de distância (padrão: o configurado)")
+    parser.add_argument("--bloco", type=int, default=1 << 16, help="Caracteres lidos de cada vez")
+    parser.add_argument("--json", action="store_true", help="Imprime uma menção por linha em JSON")
+    args = parser.parse_args()
+
+    tecnicas = []
+    if args.tecnicas:
+        for faixa in GerenciadorFaixas().get_faixas_ordenadas():
+            tecnicas.extend(faixa.tecnicas_braco + faixa.tecnicas_chute)
+    varredor = VarredorTexto(tecnicas=tecnicas, max_distance=args.max_distance, distancia=args.distancia)
+
+    antes = time.perf_counter()
+    total = 0
+    for caminho in args.arquivos:
+        if caminho == "-":
+            mencoes = varredor.varrer(iter(lambda: sys.stdin.read(args.bloco), ""))
+        else:
+            mencoes = varredor.varrer_arquivo(caminho, args.bloco)
+        for mencao in mencoes:
+            total += 1
+            if args.json:
+                registro = {
+                    "arquivo": caminho,
+                    "inicio": mencao.inicio,
+                    "fim": mencao.fim,
+                    "categoria": mencao.categoria,
+                    "nome": mencao.nome,
+                    "distancia": mencao.distancia,
+                }
+                print(json.dumps(registro, ensure_ascii=False))
+            else:
+                print(
+                    f"{caminho}\t{mencao.inicio}\t{mencao.fim}\t{mencao.categoria}\t{mencao.nome}\t{mencao.distancia}"
+                )
+    duracao = time.perf_counter() - antes
+    print(f"{total} menções em {duracao:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
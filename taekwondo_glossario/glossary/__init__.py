@@ -1,6 +1,9 @@
 """Módulo de glossário de termos do Taekwondo."""
 
+from .fontes import CategoriaArquivo, carregar_categorias, exportar_categorias
+from .registro import FonteGlossario, IndiceGlossario, RegistroGlossarios, get_registro
 from .termos import (
+    TERMOS_ENUMS,
     Acoes,
     Bases,
     Direcoes,
@@ -15,26 +18,19 @@ from .termos import (
     TiposMovimento,
 )
 
-# Lista de todas as enumerações de termos disponíveis
-TERMOS_ENUMS = [
-    Bases,
-    Acoes,
-    Direcoes,
-    PartesCorpo,
-    PartesMao,
-    PartesPe,
-    TecnicasDeBloqueio,
-    TiposChute,
-    TiposMovimento,
-    ModificadoresDirecao,
-]
-
 
 # Função para obter todos os termos de todas as enumerações
-def get_all_terms():
-    """Retorna todos os termos disponíveis no sistema."""
+def get_all_terms(categorias=None):
+    """Retorna todos os termos disponíveis no sistema.
+
+    Args:
+        categorias: Enumerações ou categorias de arquivo a consultar. Se None, usa o índice
+            consolidado do registro global de fontes.
+    """
+    if categorias is None:
+        return get_registro().indice.termos_por_categoria()
     termos = {}
-    for enum in TERMOS_ENUMS:
+    for enum in categorias:
         termos[enum.__name__] = enum.listar_todos()
     return termos
 
@@ -43,15 +39,22 @@ __all__ = [
     "TERMOS_ENUMS",
     "Acoes",
     "Bases",
+    "CategoriaArquivo",
     "Direcoes",
+    "FonteGlossario",
+    "IndiceGlossario",
     "ModificadoresDirecao",
     "PartesCorpo",
     "PartesMao",
     "PartesPe",
+    "RegistroGlossarios",
     "TecnicasDeBloqueio",
     "TermoBase",
     "TermoEnumMixin",
     "TiposChute",
     "TiposMovimento",
+    "carregar_categorias",
+    "exportar_categorias",
     "get_all_terms",
+    "get_registro",
 ]
@@ -1,11 +1,21 @@
-from typing import Dict, List
+import atexit
+import os
+import threading
+from typing import Optional
 
-import Levenshtein
 import streamlit as st
 
-from taekwondo_glossario.faixas.faixa import GerenciadorFaixas
-from taekwondo_glossario.glossary import TERMOS_ENUMS, get_all_terms
-from taekwondo_glossario.glossary.tecnica import Tecnica
+from taekwondo_glossario.faixas.curriculo import get_curriculo
+from taekwondo_glossario.glossary.autocompletar import get_autocompletar
+from taekwondo_glossario.glossary.busca import ResultadoBusca, buscar_termos
+from taekwondo_glossario.glossary.busca_navegador import busca_navegador
+from taekwondo_glossario.glossary.cache import CachePersistente
+from taekwondo_glossario.glossary.consultas import AQUECER_PADRAO, LogConsultas, aquecer
+from taekwondo_glossario.glossary.idiomas import IDIOMA_PADRAO, NOMES_IDIOMAS, idiomas_disponiveis
+from taekwondo_glossario.glossary.registro import IndiceGlossario
+from taekwondo_glossario.glossary.renderizacao import fragmento_analise, fragmento_tecnica_faixa, fragmento_termo
+from taekwondo_glossario.glossary.sequencia import dividir_movimentos
+from taekwondo_glossario.recarga import Recarregador, Snapshot
 
 # Configurações de estilo da página
 st.set_page_config(
@@ -44,37 +54,322 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+# Pesquisa de termos no navegador; TAEKWONDO_BUSCA_NAVEGADOR=0 volta à pesquisa no servidor
+BUSCA_NAVEGADOR = os.environ.get("TAEKWONDO_BUSCA_NAVEGADOR", "1") != "0"
 
-def calculate_levenshtein_distance(a: str, b: str) -> int:
-    """Calcula a distância de Levenshtein entre duas strings."""
-    return Levenshtein.distance(a.lower(), b.lower())
 
+@st.cache_resource
+def get_cache() -> Optional[CachePersistente]:
+    """Abre o cache persistente de análises se TAEKWONDO_CACHE indicar o arquivo SQLite."""
+    caminho = os.environ.get("TAEKWONDO_CACHE")
+    if not caminho:
+        return None
+    cache = CachePersistente(caminho)
+    atexit.register(cache.flush)
+    return cache
 
-def search_terms(terms: List[Dict[str, str]], query: str, max_distance: int = 2) -> List[Dict[str, str]]:
-    """Pesquisa termos que correspondam à query usando a distância de Levenshtein."""
-    if not query:
-        return terms
 
-    query = query.lower()
-    results = []
+@st.cache_resource
+def get_log_consultas(_indice: IndiceGlossario, _cache: Optional[CachePersistente]) -> Optional[LogConsultas]:
+    """Abre o registro de consultas se TAEKWONDO_CONSULTAS indicar o arquivo.
 
-    for term in terms:
-        # Calcula a distância de Levenshtein para cada campo
-        coreano_distance = calculate_levenshtein_distance(query, term["coreano"])
-        portugues_distance = calculate_levenshtein_distance(query, term["portugues"])
+    Ao abrir, pré-calcula em segundo plano as consultas mais frequentes do registro, para
+    que os caches não comecem vazios a cada reinício do servidor.
+    """
+    caminho = os.environ.get("TAEKWONDO_CONSULTAS")
+    if not caminho:
+        return None
+    log = LogConsultas(caminho)
+    atexit.register(log.flush)
+    frequentes = [consulta for consulta, _ in log.mais_frequentes(AQUECER_PADRAO)]
+    threading.Thread(target=aquecer, args=(frequentes, _indice, _cache), daemon=True).start()
+    return log
+
+
+@st.cache_resource
+def get_recarregador() -> Recarregador:
+    """Cria, uma única vez por processo, o recarregador de glossário e faixas.
+
+    Diretórios de fontes extras podem ser informados em TAEKWONDO_FONTES (separados por
+    os.pathsep). A observação de arquivos pode ser desligada com TAEKWONDO_RECARGA=0.
+    """
+    recarregador = Recarregador()
+    for diretorio in filter(None, os.environ.get("TAEKWONDO_FONTES", "").split(os.pathsep)):
+        recarregador.observar_fonte(os.path.basename(os.path.normpath(diretorio)), diretorio, prioridade=1)
+    if os.environ.get("TAEKWONDO_RECARGA", "1") != "0":
+        recarregador.iniciar()
+    return recarregador
+
+
+def aplicar_sugestao(texto: str):
+    """Substitui o nome da técnica digitado pela sugestão escolhida."""
+    st.session_state.tecnica_nome = texto
+    # Remove o estado do campo para que ele seja recriado com o novo valor
+    st.session_state.pop("tecnica_input", None)
+
+
+def secao_termos(snapshot: Snapshot, cache: Optional[CachePersistente], log_consultas: Optional[LogConsultas]):
+    """Pesquisa e listagem de termos."""
+    indice = snapshot.indice
+
+    # Seleção de categoria
+    categoria = st.sidebar.selectbox(
+        "Selecione uma categoria:",
+        ["Todos os Termos", *indice.categorias],
+        key="categoria_select",
+    )
+
+    # Configuração da distância máxima de Levenshtein
+    max_distance = st.sidebar.slider(
+        "Distância máxima permitida:",
+        min_value=0,
+        max_value=5,
+        step=1,
+        help="Quanto maior o valor, mais tolerante será a busca a erros",
+        key="max_distance",
+    )
+
+    categoria_busca = None if categoria == "Todos os Termos" else categoria
+    if BUSCA_NAVEGADOR:
+        # Filtro e ordenação no navegador: digitar não executa o script, só escolher um termo
+        selecao = busca_navegador(
+            indice,
+            st.session_state.idioma,
+            max_distance,
+            categoria_busca,
+            st.session_state.mostrar_descricao,
+            consulta=st.session_state.search_query,
+            key="busca_termos",
+        )
+        if selecao is None:
+            return
+        search_query = selecao.consulta
+        terms = (ResultadoBusca(selecao.termo),)
+    else:
+        # Barra de pesquisa com atualização em tempo real
+        search_query = st.text_input(
+            "Pesquisar termo:",
+            value=st.session_state.search_query,
+            key="search_input",
+            label_visibility="collapsed",
+        )
+
+        # Obtém os termos da categoria selecionada, filtrados pela pesquisa se houver uma query
+        terms = buscar_termos(
+            search_query,
+            max_distance,
+            categoria=categoria_busca,
+            indice=indice,
+            cache=cache,
+            idioma=st.session_state.idioma,
+        )
+
+    # Atualiza o estado da sessão com o novo valor da busca
+    st.session_state.search_query = search_query
+
+    # Registra a pesquisa apenas quando ela muda, não a cada nova execução do script
+    busca_atual = (search_query, max_distance, categoria_busca)
+    if log_consultas is not None and search_query and st.session_state.get("ultima_busca") != busca_atual:
+        log_consultas.registrar_busca(*busca_atual)
+    st.session_state.ultima_busca = busca_atual
+
+    # Exibe os termos, cada um com o seu fragmento pré-renderizado
+    for resultado in terms:
+        term = resultado.termo
+        title = f"{term['coreano']} ({term['portugues']})"
+        with st.expander(title, expanded=BUSCA_NAVEGADOR):
+            conteudo = fragmento_termo(term).para(st.session_state.mostrar_descricao)
+            if conteudo:
+                st.markdown(conteudo)
+
+
+def secao_tecnica(snapshot: Snapshot, cache: Optional[CachePersistente], log_consultas: Optional[LogConsultas]):
+    """Análise de uma técnica digitada."""
+    indice = snapshot.indice
+    st.header("Análise de Técnica")
+    st.write("Digite o nome completo da técnica para identificar os termos presentes nela.")
+
+    # Campo para digitar o nome da técnica
+    tecnica_nome = st.text_input(
+        "Nome da técnica:",
+        value=st.session_state.tecnica_nome,
+        key="tecnica_input",
+        placeholder="Ex: Apkubi momtong jireugi",
+    )
+
+    # Atualiza o estado da sessão com o novo valor
+    st.session_state.tecnica_nome = tecnica_nome
+
+    # Sugestões de preenchimento, para corrigir erros de digitação antes da análise
+    if tecnica_nome:
+        sugestoes = get_autocompletar(indice, snapshot.gerenciador.tecnicas).sugerir(tecnica_nome)
+        if sugestoes:
+            st.caption("Sugestões:")
+            for coluna, sugestao in zip(st.columns(len(sugestoes)), sugestoes):
+                rotulo = f"{sugestao.palavra} ({sugestao.portugues})" if sugestao.portugues else sugestao.palavra
+                coluna.button(
+                    rotulo,
+                    key=f"sugestao_{sugestao.texto}",
+                    on_click=aplicar_sugestao,
+                    args=(sugestao.texto + " ",),
+                )
+
+    # Configuração da distância máxima de Levenshtein para a técnica
+    tecnica_max_distance = st.slider(
+        "Distância máxima permitida:",
+        min_value=0,
+        max_value=5,
+        step=1,
+        help="Quanto maior o valor, mais tolerante será a busca a erros de digitação",
+        key="tecnica_max_distance",
+    )
+
+    # Limita cada termo à distância em que ele não se confunde com outro termo do glossário
+    distancia_segura = st.checkbox(
+        "Limitar a distância de termos parecidos",
+        help="Evita que um erro de digitação seja associado a um termo que tem outro muito parecido",
+        key="tecnica_distancia_segura",
+    )
+
+    # Botão para analisar a técnica
+    if st.button("Analisar Técnica", key="analisar_tecnica"):
+        if tecnica_nome:
+            # Exibe o nome da técnica
+            st.subheader(f"Técnica: {tecnica_nome}")
+
+            # Analisa a técnica (ou reaproveita a análise) e exibe os termos por categoria
+            encontrou, fragmento = fragmento_analise(
+                tecnica_nome, indice, tecnica_max_distance, cache, distancia_segura, st.session_state.idioma
+            )
+
+            if log_consultas is not None:
+                log_consultas.registrar_tecnica(tecnica_nome, tecnica_max_distance, distancia_segura)
+
+            # Nomes com vários movimentos (ex: sequências das faixas) são mostrados divididos
+            movimentos = list(
+                dividir_movimentos(tecnica_nome, tecnica_max_distance, indice, cache, distancia_segura=distancia_segura)
+            )
+            if len(movimentos) > 1:
+                with st.expander(f"Sequência de {len(movimentos)} movimentos"):
+                    st.markdown("\n".join(f"{m.posicao + 1}. {m.nome}" for m in movimentos))
+
+            if encontrou:
+                st.markdown(fragmento.para(st.session_state.mostrar_descricao))
+            else:
+                st.warning("Nenhum termo encontrado na técnica. Tente aumentar a distância máxima permitida.")
+        else:
+            st.warning("Por favor, digite o nome da técnica.")
+
+
+def secao_faixas(snapshot: Snapshot, cache: Optional[CachePersistente], log_consultas: Optional[LogConsultas]):
+    """Técnicas e currículo de cada faixa."""
+    indice = snapshot.indice
+    st.header("Técnicas por Faixa")
+    st.write("Selecione uma faixa para visualizar suas técnicas.")
+
+    # Gerenciador de faixas do snapshot atual (carregado uma única vez, compartilhado)
+    gerenciador = snapshot.gerenciador
+
+    # Obtém as faixas ordenadas por GUB/DAN de forma decrescente
+    faixas_ordenadas = gerenciador.get_faixas_ordenadas()
 
-        # Verifica se algum campo está dentro da distância máxima permitida
-        if coreano_distance <= max_distance or portugues_distance <= max_distance:
-            # Usa a menor distância encontrada
-            min_distance = min(coreano_distance, portugues_distance)
-            term["distance"] = min_distance
-            results.append(term)
+    # Cria uma lista de opções para o selectbox
+    opcoes_faixas = [f"{faixa.cor} ({faixa.nome})" for faixa in faixas_ordenadas]
 
-    # Ordena os resultados por distância (menor distância primeiro)
-    return sorted(results, key=lambda x: x["distance"])
+    # Seleção da faixa, pela posição na ordem de graduação
+    posicao_faixa = st.selectbox(
+        "Selecione uma faixa:",
+        range(len(opcoes_faixas)),
+        index=0,
+        format_func=opcoes_faixas.__getitem__,
+        key="faixa_select",
+    )
+
+    # Obtém a faixa selecionada
+    faixa = gerenciador.get_faixa_na_posicao(posicao_faixa)
+
+    # Exibe informações da faixa
+    st.subheader(f"Faixa {faixa.cor} ({faixa.nome})")
+
+    # Cria duas colunas para técnicas de braço e chute
+    col1, col2 = st.columns(2)
+
+    # Técnicas de braço e de chute, cada expander com um único fragmento pré-renderizado
+    colunas = [
+        (col1, "Técnicas de Braço", faixa.tecnicas_braco),
+        (col2, "Técnicas de Chute", faixa.tecnicas_chute),
+    ]
+    for coluna, titulo, nomes in colunas:
+        with coluna:
+            st.write(f"**{titulo}:**")
+            for nome in nomes:
+                with st.expander(nome):
+                    fragmento = fragmento_tecnica_faixa(nome, indice, cache=cache, idioma=st.session_state.idioma)
+                    st.markdown(fragmento.para(st.session_state.mostrar_descricao))
+
+    # Consultas de currículo entre faixas (pré-calculadas com conjuntos de bits)
+    st.subheader("Currículo")
+    curriculo = get_curriculo(gerenciador, indice)
+    posicao = curriculo.posicao(faixa.cor)
+
+    with st.expander(f"Programa acumulado até a faixa {faixa.cor}"):
+        st.markdown("\n".join(f"- {nome}" for nome in curriculo.programa_acumulado(faixa.cor)))
+
+    if posicao > 0:
+        anterior = curriculo.faixas[posicao - 1]
+        with st.expander(f"Novidades em relação à faixa {anterior.cor}"):
+            termos_novos = curriculo.termos_novos(anterior.cor, faixa.cor)
+            tecnicas_novas = curriculo.tecnicas_novas(anterior.cor, faixa.cor)
+            st.markdown(
+                "**Termos novos:** "
+                + (", ".join(termo["coreano"] for termo in termos_novos) or "nenhum")
+                + "\n\n**Técnicas novas:**\n\n"
+                + "\n".join(f"- {nome}" for nome in tecnicas_novas)
+            )
+
+    termo_consulta = st.selectbox(
+        "Em quais faixas aparece o termo:",
+        [termo["coreano"] for termo in curriculo.termos],
+        key="curriculo_termo",
+    )
+    if termo_consulta:
+        faixas_termo = curriculo.faixas_com_termo(termo_consulta)
+        st.write(", ".join(f"{f.cor} ({f.nome})" for f in faixas_termo))
+
+
+# Seções do app; apenas a seção escolhida é executada a cada interação
+SECOES = {
+    "Termos": secao_termos,
+    "Técnica": secao_tecnica,
+    "Faixas": secao_faixas,
+}
+
+# Widgets das seções cujo valor deve ser mantido enquanto a seção não é exibida, com o
+# valor inicial dos que não começam na primeira opção
+CHAVES_PERSISTENTES = (
+    "categoria_select",
+    "max_distance",
+    "tecnica_max_distance",
+    "tecnica_distancia_segura",
+    "faixa_select",
+    "curriculo_termo",
+)
+VALORES_INICIAIS = {
+    "idioma": IDIOMA_PADRAO,
+    "max_distance": 2,
+    "tecnica_max_distance": 2,
+    "tecnica_distancia_segura": False,
+}
 
 
 def main():
+    # Obtém o snapshot uma única vez: a execução inteira usa os mesmos dados,
+    # mesmo que uma recarga aconteça no meio dela
+    snapshot = get_recarregador().atual
+    indice = snapshot.indice
+    cache = get_cache()
+    log_consultas = get_log_consultas(indice, cache)
+
     # Inicializa o estado da sessão se necessário
     if "search_query" not in st.session_state:
         st.session_state.search_query = ""
@@ -86,6 +381,19 @@ def main():
     st.title("Glossário de Taekwondo")
     st.write("Consulte e pesquise termos do Taekwondo")
 
+    # O Streamlit descarta o estado dos widgets que não são exibidos em uma execução;
+    # regravá-lo mantém as opções de cada seção ao navegar entre elas
+    for chave in CHAVES_PERSISTENTES:
+        if chave in st.session_state:
+            st.session_state[chave] = st.session_state[chave]
+    for chave, valor in VALORES_INICIAIS.items():
+        if chave not in st.session_state:
+            st.session_state[chave] = valor
+
+    # Seleção da seção: diferente de abas, só a seção visível é calculada, então digitar
+    # na pesquisa não carrega nem analisa as técnicas das faixas (e vice-versa)
+    secao = st.sidebar.radio("Seção:", list(SECOES), key="secao")
+
     # Sidebar para seleção de categoria e configurações
     st.sidebar.title("Configurações")
 
@@ -96,210 +404,16 @@ def main():
         help="Quando desabilitado, mostra apenas a tradução dos termos",
     )
 
-    # Criação de abas
-    tab1, tab2, tab3 = st.tabs(["Termos", "Técnica", "Faixas"])
-
-    # Aba de Termos
-    with tab1:
-        # Seleção de categoria
-        categoria = st.sidebar.selectbox(
-            "Selecione uma categoria:",
-            ["Todos os Termos"] + [enum.__name__ for enum in TERMOS_ENUMS],
-        )
-
-        # Configuração da distância máxima de Levenshtein
-        max_distance = st.sidebar.slider(
-            "Distância máxima permitida:",
-            min_value=0,
-            max_value=5,
-            value=2,
-            step=1,
-            help="Quanto maior o valor, mais tolerante será a busca a erros",
-        )
-
-        # Barra de pesquisa com atualização em tempo real
-        search_query = st.text_input(
-            "Pesquisar termo:",
-            value=st.session_state.search_query,
-            key="search_input",
-            label_visibility="collapsed",
-        )
-
-        # Atualiza o estado da sessão com o novo valor da busca
-        st.session_state.search_query = search_query
-
-        # Obtém os termos baseado na categoria selecionada
-        if categoria == "Todos os Termos":
-            # Obtém todos os termos de todas as categorias
-            all_terms = get_all_terms()
-            # Combina todos os termos em uma única lista
-            terms = []
-            for categoria_termos in all_terms.values():
-                terms.extend(categoria_termos)
-        else:
-            # Encontra a enumeração correspondente à categoria selecionada
-            enum = next((e for e in TERMOS_ENUMS if e.__name__ == categoria), None)
-            if enum:
-                terms = enum.listar_todos()
-            else:
-                terms = []
-
-        # Aplica a pesquisa se houver uma query
-        if search_query:
-            terms = search_terms(terms, search_query, max_distance)
-
-        # Exibe os termos
-        for term in terms:
-            # Adiciona a distância ao título se estiver pesquisando
-            title = f"{term['coreano']} ({term['portugues']})"
-            if search_query and "distance" in term:
-                # Não exibe a distância para o usuário
-                pass
-
-            with st.expander(title):
-                if st.session_state.mostrar_descricao:
-                    st.write("**Descrição:**")
-                    st.write(term["descricao"])
-
-    # Aba de Técnica
-    with tab2:
-        st.header("Análise de Técnica")
-        st.write("Digite o nome completo da técnica para identificar os termos presentes nela.")
-
-        # Campo para digitar o nome da técnica
-        tecnica_nome = st.text_input(
-            "Nome da técnica:",
-            value=st.session_state.tecnica_nome,
-            key="tecnica_input",
-            placeholder="Ex: Apkubi momtong jireugi",
-        )
-
-        # Atualiza o estado da sessão com o novo valor
-        st.session_state.tecnica_nome = tecnica_nome
-
-        # Configuração da distância máxima de Levenshtein para a técnica
-        tecnica_max_distance = st.slider(
-            "Distância máxima permitida:",
-            min_value=0,
-            max_value=5,
-            value=2,
-            step=1,
-            help="Quanto maior o valor, mais tolerante será a busca a erros de digitação",
-        )
-
-        # Botão para analisar a técnica
-        if st.button("Analisar Técnica"):
-            if tecnica_nome:
-                # Cria uma instância da classe Tecnica
-                tecnica = Tecnica(tecnica_nome, tecnica_max_distance)
-
-                # Exibe o nome da técnica
-                st.subheader(f"Técnica: {tecnica.nome}")
-
-                # Obtém os termos encontrados
-                termos_encontrados = tecnica.get_termos_encontrados()
-
-                if termos_encontrados:
-                    # Exibe os termos encontrados por categoria
-                    for categoria, termos in termos_encontrados.items():
-                        st.write(f"**{categoria}:**")
-                        for termo in termos:
-                            if st.session_state.mostrar_descricao:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                                st.write(f"  {termo['descricao']}")
-                            else:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                else:
-                    st.warning("Nenhum termo encontrado na técnica. Tente aumentar a distância máxima permitida.")
-            else:
-                st.warning("Por favor, digite o nome da técnica.")
-
-    # Aba de Faixas
-    with tab3:
-        st.header("Técnicas por Faixa")
-        st.write("Selecione uma faixa para visualizar suas técnicas.")
-
-        # Inicializa o gerenciador de faixas
-        gerenciador = GerenciadorFaixas()
-
-        # Obtém todas as faixas disponíveis
-        faixas = gerenciador.get_todas_faixas()
-
-        # Função para extrair o número do GUB/DAN
-        def extrair_grau(faixa):
-            nome = faixa.nome
-            if "GUB" in nome:
-                return int(nome.split()[0])
-            elif "DAN" in nome:
-                return -int(nome.split()[0])  # DANs vêm depois dos GUBs
-            return 0
-
-        # Ordena as faixas por GUB/DAN de forma decrescente
-        faixas_ordenadas = sorted(faixas, key=extrair_grau, reverse=True)
-
-        # Cria uma lista de opções para o selectbox
-        opcoes_faixas = [f"{faixa.cor} ({faixa.nome})" for faixa in faixas_ordenadas]
-
-        # Seleção da faixa
-        faixa_selecionada = st.selectbox(
-            "Selecione uma faixa:",
-            opcoes_faixas,
-            index=0,
-        )
+    # Idioma das traduções e descrições; o pacote do idioma só é lido quando alguém o escolhe
+    st.sidebar.selectbox(
+        "Idioma das traduções:",
+        idiomas_disponiveis(),
+        format_func=lambda idioma: NOMES_IDIOMAS.get(idioma, idioma),
+        key="idioma",
+    )
 
-        # Extrai a cor da faixa selecionada
-        cor_faixa = faixa_selecionada.split(" (")[0].lower()
-
-        # Obtém a faixa selecionada
-        faixa = gerenciador.get_faixa(cor_faixa)
-
-        # Exibe informações da faixa
-        st.subheader(f"Faixa {faixa.cor} ({faixa.nome})")
-
-        # Cria duas colunas para técnicas de braço e chute
-        col1, col2 = st.columns(2)
-
-        # Técnicas de braço
-        with col1:
-            st.write("**Técnicas de Braço:**")
-            for tecnica in faixa.get_tecnicas_braco_objetos():
-                with st.expander(tecnica.nome):
-                    # Analisa a técnica para encontrar os termos
-                    tecnica_analisada = tecnica.tecnica
-                    termos_ordenados = tecnica_analisada.get_termos_ordenados()
-
-                    if termos_ordenados:
-                        # Exibe os termos na ordem em que aparecem
-                        st.write("**Termos encontrados:**")
-                        for categoria, termo in termos_ordenados:
-                            if st.session_state.mostrar_descricao:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                                st.write(f"  {termo['descricao']}")
-                            else:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                    else:
-                        st.write("Nenhum termo encontrado nesta técnica.")
-
-        # Técnicas de chute
-        with col2:
-            st.write("**Técnicas de Chute:**")
-            for tecnica in faixa.get_tecnicas_chute_objetos():
-                with st.expander(tecnica.nome):
-                    # Analisa a técnica para encontrar os termos
-                    tecnica_analisada = tecnica.tecnica
-                    termos_ordenados = tecnica_analisada.get_termos_ordenados()
-
-                    if termos_ordenados:
-                        # Exibe os termos na ordem em que aparecem
-                        st.write("**Termos encontrados:**")
-                        for _, termo in termos_ordenados:
-                            if st.session_state.mostrar_descricao:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                                st.write(f"  {termo['descricao']}")
-                            else:
-                                st.write(f"- {termo['coreano']} - {termo['portugues']}")
-                    else:
-                        st.write("Nenhum termo encontrado nesta técnica.")
+    # Executa apenas a seção escolhida
+    SECOES[secao](snapshot, cache, log_consultas)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .cache import normalizar_entrada
+from .registro import IndiceGlossario, normalizar_coreano
+
+# Quantos candidatos cada nó da trie guarda já ordenados
+CANDIDATOS_POR_NO = 32
+
+# Peso de uma ocorrência "palavra anterior -> palavra" em relação a uma ocorrência isolada
+PESO_SEQUENCIA = 100
+
+
+class Sugestao(NamedTuple):
+    """Uma sugestão de preenchimento do nome de técnica."""
+
+    texto: str  # entrada completa com a última palavra preenchida
+    palavra: str  # palavra sugerida, com a grafia original
+    portugues: Optional[str]  # tradução, quando a palavra é um termo do glossário
+
+
+class _No:
+    __slots__ = ("filhos", "melhores")
+
+    def __init__(self):
+        self.filhos: Dict[str, _No] = {}
+        self.melhores: List[str] = []
+
+
+class Autocompletar:
+    """Sugestões de preenchimento para nomes de técnicas.
+
+    Combina uma trie sobre as grafias normalizadas dos termos e das palavras dos nomes de
+    técnicas com um modelo de próxima palavra (contagem de pares consecutivos) montado a
+    partir das técnicas das faixas. Cada nó da trie guarda os seus melhores candidatos já
+    ordenados pela frequência, então uma consulta percorre só o prefixo digitado e
+    reordena algumas dezenas de candidatos pela palavra anterior.
+    """
+
+    def __init__(self, indice: IndiceGlossario, tecnicas: Sequence[str]):
+        """Monta a trie e o modelo de próxima palavra.
+
+        Args:
+            indice: Índice de glossário cujos termos entram no vocabulário
+            tecnicas: Nomes de técnicas (ex: das faixas) usados como sequências de palavras
+        """
+        self._indice = indice
+        self._frequencia: Counter = Counter()
+        self._seguintes: Dict[str, Counter] = defaultdict(Counter)
+        self._grafia: Dict[str, str] = {}
+
+        for nome in tecnicas:
+            palavras = nome.split()
+            anterior = None
+            for palavra in palavras:
+                chave = normalizar_coreano(palavra)
+                self._grafia.setdefault(chave, palavra)
+                self._frequencia[chave] += 1
+                if anterior is not None:
+                    self._seguintes[anterior][chave] += 1
+                anterior = chave
+
+        # Termos do glossário que não aparecem em nenhuma técnica ainda podem ser sugeridos
+        for entrada in indice.entradas:
+            self._grafia.setdefault(entrada.chave, entrada.termo["coreano"])
+            self._frequencia[entrada.chave] += 0
+
+        self._seguintes_ordenados: Dict[str, Tuple[str, ...]] = {
+            anterior: tuple(palavra for palavra, _ in seguintes.most_common())
+            for anterior, seguintes in self._seguintes.items()
+        }
+
+        self._raiz = _No()
+        for chave in sorted(self._frequencia, key=lambda c: (-self._frequencia[c], c)):
+            no = self._raiz
+            for caractere in ("", *chave):
+                no = no.filhos.setdefault(caractere, _No()) if caractere else no
+                if len(no.melhores) < CANDIDATOS_POR_NO:
+                    no.melhores.append(chave)
+
+    def _no_prefixo(self, prefixo: str) -> Tuple[_No, int]:
+        """Nó do maior prefixo de ``prefixo`` presente na trie e o tamanho desse prefixo."""
+        no = self._raiz
+        for tamanho, caractere in enumerate(prefixo):
+            proximo = no.filhos.get(caractere)
+            if proximo is None:
+                return no, tamanho
+            no = proximo
+        return no, len(prefixo)
+
+    def _pontuacao(self, palavra: str, anterior: Optional[str]) -> int:
+        sequencia = self._seguintes[anterior][palavra] if anterior in self._seguintes else 0
+        return sequencia * PESO_SEQUENCIA + self._frequencia[palavra]
+
+    def sugerir(self, texto: str, k: int = 5) -> List[Sugestao]:
+        """Retorna até ``k`` preenchimentos prováveis para o texto digitado.
+
+        Se o texto termina em espaço, sugere a próxima palavra; senão, completa a última.
+        Quando a última palavra não é prefixo de nenhuma grafia conhecida (erro de
+        digitação), as sugestões partem do maior prefixo conhecido, substituindo a palavra.
+
+        Args:
+            texto: Nome de técnica digitado até o momento
+            k: Número máximo de sugestões
+
+        Returns:
+            Lista de sugestões, da mais provável para a menos provável.
+        """
+        palavras = [normalizar_coreano(p) for p in normalizar_entrada(texto).split()]
+        completando = bool(palavras) and not texto[-1:].isspace()
+        prefixo = palavras.pop() if completando else ""
+        anterior = palavras[-1] if palavras else None
+        digitado = texto.split()[: len(palavras)]
+
+        seguintes = self._seguintes_ordenados.get(anterior, ())
+        if prefixo:
+            no, tamanho = self._no_prefixo(prefixo)
+            if tamanho == 0:
+                return []
+            parcial = prefixo[:tamanho]
+            candidatos = dict.fromkeys(
+                [palavra for palavra in seguintes if palavra.startswith(parcial)] + no.melhores
+            )
+        else:
+            candidatos = dict.fromkeys(seguintes or self._raiz.melhores)
+
+        melhores = sorted(candidatos, key=lambda c: (-self._pontuacao(c, anterior), c))
+        sugestoes = []
+        for palavra in melhores:
+            if palavra == prefixo:
+                continue
+            grafia = self._grafia[palavra]
+            entrada = self._indice.buscar(palavra)
+            sugestoes.append(
+                Sugestao(" ".join([*digitado, grafia]), grafia, entrada.termo["portugues"] if entrada else None)
+            )
+            if len(sugestoes) == k:
+                break
+        return sugestoes
+
+
+@lru_cache(maxsize=8)
+def get_autocompletar(indice: IndiceGlossario, tecnicas: Tuple[str, ...]) -> Autocompletar:
+    """Retorna o autocompletar de um índice e de uma lista de técnicas, construído uma única vez."""
+    return Autocompletar(indice, tecnicas)
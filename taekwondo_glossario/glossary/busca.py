@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .cache import TIPO_BUSCA, CachePersistente, normalizar_entrada
+from .distancias import Distancia, Numero, get_distancia
+from .idiomas import get_indice_idioma, get_pacote
+from .registro import IndiceGlossario, get_registro
+
+
+@dataclass(frozen=True)
+class ResultadoBusca:
+    """Termo encontrado em uma pesquisa.
+
+    ``termo`` é o próprio termo (somente leitura) do índice, compartilhado por todas as
+    pesquisas; a distância até a consulta fica neste registro, não no termo.
+    """
+
+    termo: Mapping[str, str]
+    distancia: Numero = 0
+
+
+def calculate_levenshtein_distance(a: str, b: str) -> int:
+    """Calcula a distância de Levenshtein entre duas strings."""
+    return get_distancia("levenshtein")(a.lower(), b.lower())
+
+
+def _pesquisar_posicoes(
+    terms: Sequence[Mapping[str, str]], query: str, max_distance: int, calcular: Distancia
+) -> List[Tuple[int, Numero]]:
+    """Retorna (posição em ``terms``, distância) dos termos encontrados, do mais próximo ao mais distante."""
+    query = query.lower()
+    results = []
+
+    for posicao, term in enumerate(terms):
+        # Calcula a distância para cada campo, parando cedo ao passar do máximo permitido
+        coreano_distance = calcular(query, term["coreano"].lower(), max_distance)
+        portugues_distance = calcular(query, term["portugues"].lower(), max_distance)
+
+        # Verifica se algum campo está dentro da distância máxima permitida
+        if coreano_distance <= max_distance or portugues_distance <= max_distance:
+            # Usa a menor distância encontrada
+            results.append((posicao, min(coreano_distance, portugues_distance)))
+
+    # Ordena os resultados por distância (menor distância primeiro)
+    return sorted(results, key=lambda x: x[1])
+
+
+def pesquisar(
+    terms: Sequence[Mapping[str, str]],
+    query: str,
+    max_distance: int = 2,
+    distancia: Optional[str] = None,
+    idioma: Optional[str] = None,
+) -> Tuple[ResultadoBusca, ...]:
+    """Pesquisa termos que correspondam à query usando o backend de distância configurado.
+
+    Os termos recebidos não são copiados nem alterados: cada resultado referencia o termo
+    original e guarda a sua distância. Com ``idioma``, a tradução comparada (e retornada)
+    é a do pacote do idioma.
+    """
+    pacote = get_pacote(idioma)
+    if pacote is not None:
+        terms = [pacote.localizar(term) for term in terms]
+    if not query:
+        return tuple(ResultadoBusca(term) for term in terms)
+    posicoes = _pesquisar_posicoes(terms, query, max_distance, get_distancia(distancia))
+    return tuple(ResultadoBusca(terms[posicao], distance) for posicao, distance in posicoes)
+
+
+def search_terms(
+    terms: Sequence[Mapping[str, str]],
+    query: str,
+    max_distance: int = 2,
+    distancia: Optional[str] = None,
+    idioma: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """Pesquisa termos que correspondam à query, no formato antigo (dicionários).
+
+    Os termos recebidos não são alterados: cada resultado é uma cópia com a chave ``distance``.
+    Com ``idioma``, compara e retorna a tradução do pacote do idioma.
+    """
+    if not query and get_pacote(idioma) is None:
+        return terms
+    resultados = pesquisar(terms, query, max_distance, distancia, idioma)
+    return [{**resultado.termo, "distance": resultado.distancia} for resultado in resultados]
+
+
+def listar_termos(
+    categoria: Optional[str] = None, indice: Optional[IndiceGlossario] = None, idioma: Optional[str] = None
+) -> Tuple[Mapping[str, str], ...]:
+    """Retorna os termos de uma categoria do índice, ou de todas se ``categoria`` for None.
+
+    Com ``idioma``, os termos vêm traduzidos, na mesma ordem do índice.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    fonte = get_indice_idioma(indice, idioma) or indice
+    if categoria is not None:
+        return fonte.listar_categoria(categoria)
+    return fonte.todos_termos
+
+
+def buscar_termos(
+    query: str,
+    max_distance: int = 2,
+    categoria: Optional[str] = None,
+    indice: Optional[IndiceGlossario] = None,
+    cache: Optional[CachePersistente] = None,
+    distancia: Optional[str] = None,
+    idioma: Optional[str] = None,
+) -> Tuple[ResultadoBusca, ...]:
+    """Pesquisa no índice de glossário, reaproveitando resultados já calculados.
+
+    O resultado é uma tupla de registros imutáveis, compartilhada entre as sessões que
+    fizerem a mesma pesquisa sobre o mesmo índice. Sem consulta, retorna todos os termos
+    da categoria com distância 0.
+
+    Args:
+        query: Texto digitado (normalizado para minúsculas e espaços simples)
+        max_distance: Distância máxima permitida
+        categoria: Categoria onde pesquisar. Se None, pesquisa em todas.
+        indice: Índice de glossário. Se None, usa o índice do registro global.
+        cache: Cache persistente opcional. A chave inclui a categoria e a versão do índice.
+        distancia: Nome do backend de distância. Se None, usa o configurado.
+        idioma: Idioma das traduções comparadas e retornadas. Se None, usa o dos termos.
+            O pacote do idioma é carregado no primeiro uso e as romanizações continuam
+            as do índice, que não é reconstruído.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    idioma = idioma if get_pacote(idioma) is not None else None
+    query = normalizar_entrada(query)
+    if not query:
+        return _listar_resultados(categoria, indice, idioma)
+    return _buscar_compartilhado(query, max_distance, categoria, indice, cache, get_distancia(distancia).nome, idioma)
+
+
+@lru_cache(maxsize=64)
+def _listar_resultados(
+    categoria: Optional[str], indice: IndiceGlossario, idioma: Optional[str] = None
+) -> Tuple[ResultadoBusca, ...]:
+    """Memoriza a listagem sem consulta de cada categoria do índice."""
+    return pesquisar(listar_termos(categoria, indice, idioma), "")
+
+
+@lru_cache(maxsize=1024)
+def _buscar_compartilhado(
+    query: str,
+    max_distance: int,
+    categoria: Optional[str],
+    indice: IndiceGlossario,
+    cache: Optional[CachePersistente],
+    distancia: str,
+    idioma: Optional[str] = None,
+) -> Tuple[ResultadoBusca, ...]:
+    """Memoriza as pesquisas no processo; o índice (imutável) faz parte da chave."""
+    # O cache guarda apenas as posições na listagem da categoria e as distâncias. A consulta
+    # já vem normalizada; a categoria e os separadores não podem ser normalizados junto
+    termos = listar_termos(categoria, indice, idioma)
+    entrada = f"{distancia}\x1f{categoria or ''}\x1f{query}"
+    pacote = get_pacote(idioma)
+    if pacote is not None:
+        # A tradução comparada depende do conteúdo do pacote, não só do índice
+        entrada += f"\x1f{pacote.idioma}:{pacote.assinatura}"
+    posicoes = None
+    if cache is not None:
+        posicoes = cache.obter(TIPO_BUSCA, entrada, max_distance, indice.versao)
+        if posicoes is not None and not all(0 <= posicao < len(termos) for posicao, _ in posicoes):
+            posicoes = None
+
+    if posicoes is None:
+        posicoes = _pesquisar_posicoes(termos, query, max_distance, get_distancia(distancia))
+        if cache is not None:
+            cache.guardar(TIPO_BUSCA, entrada, max_distance, indice.versao, posicoes)
+    return tuple(ResultadoBusca(termos[posicao], distance) for posicao, distance in posicoes)
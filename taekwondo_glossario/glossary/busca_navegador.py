@@ -0,0 +1,104 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from .busca import listar_termos
+from .idiomas import get_pacote
+from .registro import IndiceGlossario
+
+# Página do componente (HTML e JavaScript, sem etapa de build)
+DIRETORIO_COMPONENTE = os.path.join(os.path.dirname(__file__), "componente_busca")
+
+# Máximo de termos listados pelo navegador a cada busca
+LIMITE_RESULTADOS = 50
+
+_componente = components.declare_component("busca_termos", path=DIRETORIO_COMPONENTE)
+
+
+class SelecaoBusca(NamedTuple):
+    """Termo escolhido na lista do navegador e a consulta digitada até a escolha."""
+
+    termo: Mapping[str, str]
+    consulta: str
+
+
+@lru_cache(maxsize=16)
+def indice_busca(indice: IndiceGlossario, idioma: Optional[str] = None) -> Dict[str, Any]:
+    """Índice compacto enviado ao navegador, montado uma vez por índice e idioma.
+
+    ``v`` é a versão (a do índice e a do pacote do idioma), ``c`` as categorias e ``t`` um
+    ``[coreano, tradução, descrição, número da categoria]`` por termo, na ordem de
+    ``listar_termos``: a posição de um termo em ``t`` é a que o navegador devolve.
+    """
+    pacote = get_pacote(idioma)
+    versao = indice.versao if pacote is None else f"{indice.versao}:{pacote.idioma}:{pacote.assinatura}"
+    categorias = indice.categorias
+    numeros = {categoria: numero for numero, categoria in enumerate(categorias)}
+    termos = []
+    for categoria in categorias:
+        for termo in listar_termos(categoria, indice, idioma):
+            termos.append([termo["coreano"], termo["portugues"], termo["descricao"], numeros[categoria]])
+    return {"v": versao, "c": categorias, "t": termos}
+
+
+def busca_navegador(
+    indice: IndiceGlossario,
+    idioma: Optional[str] = None,
+    max_distance: int = 2,
+    categoria: Optional[str] = None,
+    mostrar_descricao: bool = True,
+    consulta: str = "",
+    key: str = "busca_navegador",
+) -> Optional[SelecaoBusca]:
+    """Campo de pesquisa cujo filtro e ordenação rodam no navegador.
+
+    O índice compacto vai ao navegador só na primeira execução de cada versão por sessão
+    (o navegador o guarda e o pede de novo se o perder); digitar não executa o script. O
+    Python só é chamado quando um termo é escolhido.
+
+    Args:
+        indice: Índice de glossário pesquisado
+        idioma: Idioma das traduções. Se None, usa o dos termos.
+        max_distance: Distância máxima permitida
+        categoria: Categoria onde pesquisar. Se None, pesquisa em todas.
+        mostrar_descricao: Se True, a lista mostra a descrição de cada termo
+        consulta: Texto inicial do campo, usado quando o componente é criado
+        key: Chave do componente no estado da sessão
+
+    Returns:
+        O termo escolhido (traduzido, se houver idioma) ou None enquanto nenhum foi escolhido.
+    """
+    dados = indice_busca(indice, idioma)
+    chave_versao, chave_pedido = f"{key}_versao", f"{key}_pedido"
+
+    # Um pedido novo do navegador (ex: o armazenamento da sessão foi apagado) reenvia o índice
+    valor = st.session_state.get(key)
+    if valor and valor.get("acao") == "indice" and valor.get("n") != st.session_state.get(chave_pedido):
+        st.session_state[chave_pedido] = valor["n"]
+        st.session_state.pop(chave_versao, None)
+
+    enviar = st.session_state.get(chave_versao) != dados["v"]
+    valor = _componente(
+        versao=dados["v"],
+        indice=dados if enviar else None,
+        max_distance=max_distance,
+        categoria=dados["c"].index(categoria) if categoria in dados["c"] else None,
+        mostrar_descricao=mostrar_descricao,
+        consulta=consulta,
+        placeholder="Pesquisar termo",
+        limite=LIMITE_RESULTADOS,
+        key=key,
+        default=None,
+    )
+    st.session_state[chave_versao] = dados["v"]
+
+    # Escolhas feitas sobre outra versão (glossário recarregado, idioma trocado) são ignoradas
+    if not valor or valor.get("acao") != "termo" or valor.get("versao") != dados["v"]:
+        return None
+    termos = listar_termos(None, indice, idioma)
+    if not 0 <= valor["posicao"] < len(termos):
+        return None
+    return SelecaoBusca(termos[valor["posicao"]], valor.get("consulta", ""))
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Tipos de resultado armazenados no cache; o número é a versão do formato do valor
+TIPO_TECNICA = "tecnica:2"
+TIPO_BUSCA = "busca:2"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    tipo TEXT NOT NULL,
+    chave TEXT NOT NULL,
+    max_distance INTEGER NOT NULL,
+    versao TEXT NOT NULL,
+    valor TEXT NOT NULL,
+    tamanho INTEGER NOT NULL,
+    acessado REAL NOT NULL,
+    UNIQUE (tipo, chave, max_distance, versao)
+);
+CREATE INDEX IF NOT EXISTS cache_acessado ON cache (acessado);
+"""
+
+ChaveCache = Tuple[str, str, int, str]
+
+
+def normalizar_entrada(texto: str) -> str:
+    """Normaliza o texto digitado para uso como chave (minúsculas, espaços simples)."""
+    return " ".join(texto.lower().split())
+
+
+class CachePersistente:
+    """Cache em disco (SQLite) de análises de técnicas e resultados de busca.
+
+    As entradas são identificadas pelo tipo, pela entrada (montada e normalizada por quem
+    chama, que sabe quais partes dela podem ser normalizadas), pela distância
+    máxima e pela versão (hash do conteúdo) do índice de glossário, então qualquer mudança
+    no glossário invalida automaticamente os resultados antigos. As gravações são
+    acumuladas em memória e enviadas em lote; o banco usa WAL para que vários processos
+    possam ler enquanto outro grava. Quando o tamanho total dos valores passa de
+    ``max_bytes``, as entradas acessadas há mais tempo são removidas.
+    """
+
+    def __init__(self, caminho: str, max_bytes: int = 64 * 1024 * 1024, tamanho_lote: int = 64):
+        """Abre (ou cria) o cache.
+
+        Args:
+            caminho: Caminho do arquivo SQLite
+            max_bytes: Tamanho máximo somado dos valores armazenados
+            tamanho_lote: Número de gravações pendentes que dispara o envio ao disco
+        """
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        self.caminho = caminho
+        self.max_bytes = max_bytes
+        self.tamanho_lote = tamanho_lote
+        self._lock = threading.Lock()
+        self._pendentes: Dict[ChaveCache, Tuple[str, float]] = {}
+        self._acessos: Dict[ChaveCache, float] = {}
+        self._conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(_ESQUEMA)
+
+    def obter(self, tipo: str, entrada: str, max_distance: int, versao: str) -> Optional[Any]:
+        """Retorna o valor armazenado ou None se não houver entrada válida."""
+        chave = (tipo, entrada, max_distance, versao)
+        with self._lock:
+            pendente = self._pendentes.get(chave)
+            if pendente is not None:
+                return json.loads(pendente[0])
+
+            linha = self._conexao.execute(
+                "SELECT valor FROM cache WHERE tipo = ? AND chave = ? AND max_distance = ? AND versao = ?",
+                chave,
+            ).fetchone()
+            if linha is None:
+                return None
+            # O horário de acesso (usado no descarte) é atualizado junto com o próximo lote
+            self._acessos[chave] = time.time()
+            return json.loads(linha[0])
+
+    def guardar(self, tipo: str, entrada: str, max_distance: int, versao: str, valor: Any):
+        """Agenda a gravação de um valor serializável em JSON."""
+        chave = (tipo, entrada, max_distance, versao)
+        with self._lock:
+            self._pendentes[chave] = (json.dumps(valor, ensure_ascii=False), time.time())
+            if len(self._pendentes) + len(self._acessos) >= self.tamanho_lote:
+                self._enviar()
+
+    def flush(self):
+        """Grava imediatamente todas as entradas pendentes."""
+        with self._lock:
+            self._enviar()
+
+    def _enviar(self):
+        """Grava o lote pendente em uma única transação e aplica o descarte por tamanho."""
+        if not self._pendentes and not self._acessos:
+            return
+        with self._conexao:
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO cache (tipo, chave, max_distance, versao, valor, tamanho, acessado) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (*chave, valor, len(valor.encode("utf-8")), quando)
+                    for chave, (valor, quando) in self._pendentes.items()
+                ],
+            )
+            self._conexao.executemany(
+                "UPDATE cache SET acessado = ? WHERE tipo = ? AND chave = ? AND max_distance = ? AND versao = ?",
+                [(quando, *chave) for chave, quando in self._acessos.items()],
+            )
+            self._descartar()
+        self._pendentes.clear()
+        self._acessos.clear()
+
+    def _descartar(self):
+        """Remove as entradas menos recentemente acessadas até caber em ``max_bytes``."""
+        (total,) = self._conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM cache").fetchone()
+        excesso = total - self.max_bytes
+        if excesso <= 0:
+            return
+        remover = []
+        for rowid, tamanho in self._conexao.execute("SELECT rowid, tamanho FROM cache ORDER BY acessado"):
+            remover.append((rowid,))
+            excesso -= tamanho
+            if excesso <= 0:
+                break
+        self._conexao.executemany("DELETE FROM cache WHERE rowid = ?", remover)
+
+    def tamanho(self) -> int:
+        """Retorna o número de entradas gravadas em disco."""
+        with self._lock:
+            return self._conexao.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def limpar(self):
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._pendentes.clear()
+            self._acessos.clear()
+            with self._conexao:
+                self._conexao.execute("DELETE FROM cache")
+
+    def close(self):
+        """Grava as entradas pendentes e fecha o banco."""
+        with self._lock:
+            self._enviar()
+            self._conexao.close()
+
+    def __enter__(self) -> "CachePersistente":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
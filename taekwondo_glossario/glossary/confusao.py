@@ -0,0 +1,195 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .distancias import DistanciaLevenshtein, Numero, get_distancia
+from .registro import IndiceGlossario
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy é opcional
+    np = None
+
+# Maior distância guardada entre dois termos. Com 4, a ambiguidade é conhecida para
+# correspondências até distância 2 (dois termos a até 2 * d um do outro podem empatar)
+LIMIAR_PADRAO = 4
+
+# Número máximo de pares calculados de uma vez no caminho vetorizado
+TAMANHO_LOTE = 65536
+
+# Par de termos (índices em ``chaves``) e a distância entre eles
+Par = Tuple[int, int, Numero]
+
+
+def _por_tamanho(chaves: Sequence[str]) -> Dict[int, List[int]]:
+    grupos: Dict[int, List[int]] = defaultdict(list)
+    for posicao, chave in enumerate(chaves):
+        grupos[len(chave)].append(posicao)
+    return grupos
+
+
+def _pares_python(chaves: Sequence[str], limiar: int, distancia: str) -> Iterator[Par]:
+    """Todos os pares até ``limiar``, comparando apenas palavras de tamanhos compatíveis."""
+    calcular = get_distancia(distancia)
+    grupos = _por_tamanho(chaves)
+    for tamanho_a, posicoes_a in grupos.items():
+        for tamanho_b, posicoes_b in grupos.items():
+            if tamanho_b < tamanho_a or tamanho_b - tamanho_a > limiar:
+                continue
+            for i in posicoes_a:
+                for j in posicoes_b:
+                    if tamanho_a == tamanho_b and j <= i:
+                        continue
+                    d = calcular(chaves[i], chaves[j], limiar)
+                    if d <= limiar:
+                        yield (i, j, d) if i < j else (j, i, d)
+
+
+def _levenshtein_vetorizado(a, b, limiar: int):
+    """Distância de Levenshtein de cada par de linhas de ``a`` (P x m) e ``b`` (P x n), limitada a limiar + 1."""
+    pares, n = b.shape
+    anterior = np.broadcast_to(np.arange(n + 1, dtype=np.int16), (pares, n + 1)).copy()
+    atual = np.empty_like(anterior)
+    for i in range(a.shape[1]):
+        diferente = a[:, i : i + 1] != b
+        # Substituição e remoção dependem só da linha anterior; a inserção é sequencial
+        parcial = np.minimum(anterior[:, :-1] + diferente, anterior[:, 1:] + 1)
+        atual[:, 0] = i + 1
+        for j in range(n):
+            atual[:, j + 1] = np.minimum(parcial[:, j], atual[:, j] + 1)
+        np.minimum(atual, limiar + 1, out=atual)
+        anterior, atual = atual, anterior
+    return anterior[:, -1]
+
+
+def _pares_numpy(chaves: Sequence[str], limiar: int, tamanho_lote: int) -> Iterator[Par]:
+    """Mesmo resultado de ``_pares_python`` para Levenshtein, calculado em lotes vetorizados.
+
+    As palavras são agrupadas por tamanho, para que cada lote tenha matrizes retangulares
+    sem preenchimento. Antes da programação dinâmica, um limite inferior barato (metade da
+    diferença entre os histogramas de letras) descarta os pares que não podem ficar abaixo
+    do limiar. A memória usada é proporcional ao tamanho do lote, não ao número de termos.
+    """
+    alfabeto = {c: i for i, c in enumerate(sorted({c for chave in chaves for c in chave}))}
+    codigos = {}
+    histogramas = {}
+    posicoes_grupo = {}
+    for tamanho, posicoes in _por_tamanho(chaves).items():
+        matriz = np.array([[alfabeto[c] for c in chaves[p]] for p in posicoes], dtype=np.int32)
+        histograma = np.zeros((len(posicoes), len(alfabeto)), dtype=np.int16)
+        np.add.at(histograma, (np.repeat(np.arange(len(posicoes)), tamanho), matriz.ravel()), 1)
+        codigos[tamanho] = matriz.reshape(len(posicoes), tamanho)
+        histogramas[tamanho] = histograma
+        posicoes_grupo[tamanho] = np.array(posicoes)
+
+    for tamanho_a in sorted(codigos):
+        for tamanho_b in sorted(codigos):
+            if tamanho_b < tamanho_a or tamanho_b - tamanho_a > limiar:
+                continue
+            hist_b = histogramas[tamanho_b]
+            # Linhas de ``a`` por bloco, para que o filtro (linhas x colunas) tenha no máximo um lote de pares
+            por_bloco = max(1, tamanho_lote // len(hist_b))
+            for inicio in range(0, len(codigos[tamanho_a]), por_bloco):
+                hist_a = histogramas[tamanho_a][inicio : inicio + por_bloco]
+                limite_inferior = (np.abs(hist_a[:, None, :] - hist_b[None, :, :]).sum(axis=2) + 1) // 2
+                linhas, colunas = np.nonzero(limite_inferior <= limiar)
+                linhas += inicio
+                if tamanho_a == tamanho_b:
+                    manter = colunas > linhas
+                    linhas, colunas = linhas[manter], colunas[manter]
+                for lote in range(0, len(linhas), tamanho_lote):
+                    sel_a, sel_b = linhas[lote : lote + tamanho_lote], colunas[lote : lote + tamanho_lote]
+                    distancias = _levenshtein_vetorizado(codigos[tamanho_a][sel_a], codigos[tamanho_b][sel_b], limiar)
+                    dentro = distancias <= limiar
+                    globais_a = posicoes_grupo[tamanho_a][sel_a[dentro]]
+                    globais_b = posicoes_grupo[tamanho_b][sel_b[dentro]]
+                    for i, j, d in zip(globais_a.tolist(), globais_b.tolist(), distancias[dentro].tolist()):
+                        yield (i, j, d) if i < j else (j, i, d)
+
+
+def calcular_pares(
+    chaves: Sequence[str],
+    limiar: int = LIMIAR_PADRAO,
+    distancia: Optional[str] = None,
+    tamanho_lote: int = TAMANHO_LOTE,
+) -> Iterator[Par]:
+    """Gera os pares de chaves (i < j) a no máximo ``limiar`` de distância.
+
+    Para a distância de Levenshtein usa o cálculo vetorizado com numpy, quando disponível;
+    para os demais backends (ou sem numpy) compara os pares em Python, com parada antecipada.
+    """
+    if np is not None and isinstance(get_distancia(distancia), DistanciaLevenshtein):
+        return _pares_numpy(chaves, limiar, tamanho_lote)
+    return _pares_python(chaves, limiar, get_distancia(distancia).nome)
+
+
+class MatrizConfusao:
+    """Matriz esparsa de distâncias entre os termos de um índice.
+
+    Guarda apenas os pares a até ``limiar`` de distância, como lista de vizinhos por termo.
+    Com ela, sem calcular nenhuma distância durante a consulta, é possível saber:
+
+    - se uma correspondência a distância ``d`` de um termo é ambígua: pela desigualdade
+      triangular, um termo vizinho a até ``2 * d`` pode estar tão perto da palavra quanto ele;
+    - a distância máxima segura de cada termo: o maior ``d`` com ``2 * d`` menor que a
+      distância ao vizinho mais próximo.
+    """
+
+    def __init__(self, chaves: Sequence[str], pares: Sequence[Par], limiar: int = LIMIAR_PADRAO):
+        self.chaves: Tuple[str, ...] = tuple(chaves)
+        self.limiar = limiar
+        self._posicao = {chave: i for i, chave in enumerate(self.chaves)}
+        vizinhos: Dict[int, List[Tuple[Numero, int]]] = defaultdict(list)
+        for i, j, d in pares:
+            vizinhos[i].append((d, j))
+            vizinhos[j].append((d, i))
+        # Empates de distância pela chave, não pela posição: a ordem dos vizinhos de um termo
+        # não muda quando outros termos entram ou saem do índice
+        self._vizinhos: Mapping[int, Tuple[Tuple[Numero, int], ...]] = {
+            i: tuple(sorted(lista, key=lambda vizinho: (vizinho[0], self.chaves[vizinho[1]])))
+            for i, lista in vizinhos.items()
+        }
+        # Distância ao vizinho mais próximo (limiar + 1 se não houver nenhum até o limiar)
+        self._seguras: Dict[str, int] = {}
+        for i, chave in enumerate(self.chaves):
+            mais_proximo = self._vizinhos[i][0][0] if i in self._vizinhos else limiar + 1
+            self._seguras[chave] = max(0, int((mais_proximo - 1) // 2))
+
+    @classmethod
+    def de_indice(
+        cls, indice: IndiceGlossario, limiar: int = LIMIAR_PADRAO, distancia: Optional[str] = None
+    ) -> "MatrizConfusao":
+        """Calcula a matriz sobre as chaves (romanizações normalizadas) das entradas do índice."""
+        chaves = [entrada.chave for entrada in indice.entradas]
+        return cls(chaves, list(calcular_pares(chaves, limiar, distancia)), limiar)
+
+    def __len__(self) -> int:
+        """Número de pares guardados."""
+        return sum(len(v) for v in self._vizinhos.values()) // 2
+
+    def vizinhos(self, chave: str, ate: Optional[Numero] = None) -> List[Tuple[str, Numero]]:
+        """Termos a até ``ate`` (padrão: o limiar) de distância da chave, do mais próximo ao mais distante."""
+        ate = self.limiar if ate is None else ate
+        posicao = self._posicao.get(chave)
+        if posicao is None:
+            return []
+        return [(self.chaves[j], d) for d, j in self._vizinhos.get(posicao, ()) if d <= ate]
+
+    def ambiguos(self, chave: str, distancia: Numero) -> List[str]:
+        """Termos que podem estar tão perto quanto ``chave`` de uma palavra a ``distancia`` dela."""
+        if distancia <= 0:
+            return []
+        return [vizinho for vizinho, _ in self.vizinhos(chave, 2 * distancia)]
+
+    def distancia_segura(self, chave: str) -> int:
+        """Maior distância em que uma correspondência com a chave nunca é ambígua.
+
+        Termos sem vizinho até o limiar são considerados com vizinho a ``limiar + 1``.
+        """
+        return self._seguras.get(chave, self.limiar // 2)
+
+
+@lru_cache(maxsize=8)
+def get_matriz_confusao(indice: IndiceGlossario, distancia: str) -> MatrizConfusao:
+    """Retorna a matriz de confusão de um índice, calculada uma única vez por índice e backend."""
+    return MatrizConfusao.de_indice(indice, LIMIAR_PADRAO, distancia)
@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .busca import buscar_termos
+from .cache import CachePersistente, normalizar_entrada
+from .registro import IndiceGlossario
+from .renderizacao import fragmento_analise
+
+logger = logging.getLogger(__name__)
+
+# Tipos de consulta registrados
+CONSULTA_BUSCA = "busca"
+CONSULTA_TECNICA = "tecnica"
+
+# Número máximo de consultas distintas guardadas no arquivo
+MAX_CONSULTAS = 5000
+
+# Consultas maiores que isto não são registradas (provavelmente não são termos nem técnicas)
+TAMANHO_MAXIMO_CONSULTA = 80
+
+# Número de consultas pré-calculadas ao iniciar o app
+AQUECER_PADRAO = 100
+
+_FORMATO = 1
+
+
+class Consulta(NamedTuple):
+    """Consulta registrada: a entrada normalizada e as opções que mudam o resultado."""
+
+    tipo: str
+    entrada: str
+    max_distance: int
+    categoria: Optional[str] = None
+    distancia_segura: bool = False
+
+
+def consulta_aceitavel(entrada: str) -> bool:
+    """Indica se a entrada pode ser registrada sem expor dados pessoais.
+
+    Só são aceitas entradas curtas, sem números nem ``@`` (que indicariam telefones,
+    documentos ou emails digitados por engano no campo de pesquisa).
+    """
+    if not entrada or len(entrada) > TAMANHO_MAXIMO_CONSULTA:
+        return False
+    return not any(caractere.isdigit() or caractere == "@" for caractere in entrada)
+
+
+def ler_consultas(caminho: str) -> Counter:
+    """Lê as contagens de um arquivo de consultas.
+
+    Retorna um contador vazio se o arquivo não existir ou não puder ser lido (o erro é
+    registrado no log): o registro de consultas nunca deve interromper uma página.
+    """
+    contagens: Counter = Counter()
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        if not isinstance(dados, dict):
+            raise ValueError(f"Arquivo de consultas deve conter um objeto, não {type(dados).__name__}")
+        if dados.get("formato") != _FORMATO:
+            raise ValueError(f"Formato de arquivo de consultas não suportado: {dados.get('formato')}")
+        for *campos, contagem in dados["consultas"]:
+            contagens[Consulta(*campos)] += contagem
+    except FileNotFoundError:
+        return Counter()
+    except (OSError, ValueError, TypeError, KeyError) as erro:
+        logger.warning("Não foi possível ler o registro de consultas %s: %s", caminho, erro)
+        return Counter()
+    return contagens
+
+
+class LogConsultas:
+    """Registro das consultas feitas no app, com contagens, em um arquivo JSON compacto.
+
+    Guarda apenas a entrada normalizada (minúsculas, espaços simples), as opções da
+    consulta e quantas vezes ela foi feita: nada identifica a sessão, o usuário ou o
+    horário, e entradas que parecem dados pessoais são descartadas. As contagens ficam em
+    memória e são somadas ao arquivo a cada ``intervalo`` consultas; a gravação é atômica
+    (arquivo temporário exclusivo, no mesmo diretório, e ``os.replace``). Quando o arquivo
+    passa de ``max_consultas`` consultas distintas, todas as contagens são divididas por
+    dois e as que chegam a zero saem, então as consultas antigas perdem peso com o tempo.
+    Erros de leitura ou gravação vão para o log, e as contagens ficam em memória até a
+    próxima gravação: o registro nunca interrompe uma página.
+
+    Vários processos podem usar o mesmo arquivo; em gravações simultâneas, as contagens
+    de um dos lotes podem se perder, o que não muda a distribuição de forma relevante.
+    """
+
+    def __init__(self, caminho: str, max_consultas: int = MAX_CONSULTAS, intervalo: int = 50):
+        """Abre (ou cria na primeira gravação) o registro.
+
+        Args:
+            caminho: Caminho do arquivo JSON
+            max_consultas: Número máximo de consultas distintas guardadas
+            intervalo: Número de consultas acumuladas em memória antes de gravar
+        """
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        self.caminho = caminho
+        self.max_consultas = max_consultas
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._novas: Counter = Counter()
+
+    def registrar(self, consulta: Consulta):
+        """Conta uma consulta, se a entrada puder ser registrada."""
+        consulta = consulta._replace(entrada=normalizar_entrada(consulta.entrada))
+        if not consulta_aceitavel(consulta.entrada):
+            return
+        with self._lock:
+            self._novas[consulta] += 1
+            if sum(self._novas.values()) >= self.intervalo:
+                self._gravar()
+
+    def registrar_busca(self, query: str, max_distance: int, categoria: Optional[str] = None):
+        """Conta uma pesquisa de termos."""
+        self.registrar(Consulta(CONSULTA_BUSCA, query, max_distance, categoria))
+
+    def registrar_tecnica(self, nome: str, max_distance: int, distancia_segura: bool = False):
+        """Conta uma análise de técnica."""
+        self.registrar(Consulta(CONSULTA_TECNICA, nome, max_distance, None, distancia_segura))
+
+    def flush(self):
+        """Soma imediatamente ao arquivo as contagens em memória."""
+        with self._lock:
+            self._gravar()
+
+    def _gravar(self):
+        if not self._novas:
+            return
+        contagens = ler_consultas(self.caminho)
+        contagens.update(self._novas)
+        while len(contagens) > self.max_consultas:
+            contagens = Counter({c: n // 2 for c, n in contagens.items() if n // 2})
+        linhas = [[*consulta, contagem] for consulta, contagem in contagens.most_common()]
+        # Um temporário por gravação, para que processos que gravam juntos não se atrapalhem
+        descritor, temporario = tempfile.mkstemp(
+            prefix=os.path.basename(self.caminho) + ".",
+            suffix=".tmp",
+            dir=os.path.dirname(os.path.abspath(self.caminho)),
+        )
+        try:
+            with os.fdopen(descritor, "w", encoding="utf-8") as arquivo:
+                dados = {"formato": _FORMATO, "consultas": linhas}
+                json.dump(dados, arquivo, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporario, self.caminho)
+        except (OSError, ValueError) as erro:
+            logger.warning("Não foi possível gravar o registro de consultas %s: %s", self.caminho, erro)
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
+            return
+        self._novas.clear()
+
+    def mais_frequentes(self, n: Optional[int] = None, tipo: Optional[str] = None) -> List[Tuple[Consulta, int]]:
+        """Retorna as ``n`` consultas mais frequentes (todas, se None), incluindo as ainda não gravadas."""
+        with self._lock:
+            contagens = ler_consultas(self.caminho)
+            contagens.update(self._novas)
+        if tipo is not None:
+            contagens = Counter({c: n for c, n in contagens.items() if c.tipo == tipo})
+        return contagens.most_common(n)
+
+
+def aquecer(
+    consultas: Iterable[Consulta], indice: IndiceGlossario, cache: Optional[CachePersistente] = None
+) -> Dict[str, int]:
+    """Executa as consultas pelos mesmos caminhos do app, preenchendo os caches.
+
+    Pesquisas preenchem o cache de busca; análises de técnicas preenchem o cache de
+    análises e o de fragmentos renderizados. Com ``cache``, os resultados também são
+    gravados no cache persistente. Retorna quantas consultas de cada tipo foram executadas.
+    """
+    executadas: Counter = Counter()
+    for consulta in consultas:
+        if consulta.tipo == CONSULTA_BUSCA:
+            buscar_termos(consulta.entrada, consulta.max_distance, consulta.categoria, indice, cache)
+        elif consulta.tipo == CONSULTA_TECNICA:
+            fragmento_analise(consulta.entrada, indice, consulta.max_distance, cache, consulta.distancia_segura)
+        else:
+            continue
+        executadas[consulta.tipo] += 1
+    if cache is not None:
+        cache.flush()
+    return dict(executadas)
+
+
+def gerar_carga(frequencias: Sequence[Tuple[Consulta, int]], quantidade: int, semente: int = 0) -> List[Consulta]:
+    """Sorteia ``quantidade`` consultas com a mesma distribuição das contagens registradas."""
+    if not frequencias:
+        raise ValueError("Não há consultas registradas para gerar a carga")
+    aleatorio = random.Random(semente)
+    consultas = [consulta for consulta, _ in frequencias]
+    pesos = [contagem for _, contagem in frequencias]
+    return aleatorio.choices(consultas, weights=pesos, k=quantidade)
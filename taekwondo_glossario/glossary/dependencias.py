@@ -0,0 +1,341 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set, Tuple
+
+from .cache import TIPO_TECNICA, CachePersistente
+from .confusao import get_matriz_confusao
+from .distancias import get_distancia
+from .registro import EntradaIndice, IndiceGlossario, get_registro, normalizar_coreano
+from .tecnica import TermoEncontrado, analisar_tecnica, entrada_cache, valor_cache
+
+
+@dataclass(frozen=True)
+class Dependencias:
+    """O que foi consultado no glossário ao analisar uma técnica.
+
+    ``palavras`` são as palavras comparadas termo a termo (cujos candidatos ficam no
+    vocabulário do corpus), ``compostos`` as sequências de 2 e 3 palavras procuradas como
+    termos compostos e ``termos`` as chaves dos termos encontrados. O resultado da técnica
+    só pode mudar se um destes mudar.
+    """
+
+    palavras: FrozenSet[str]
+    compostos: FrozenSet[str]
+    termos: FrozenSet[str]
+
+
+def dependencias_tecnica(nome: str, indice: IndiceGlossario, termos: Iterable[TermoEncontrado]) -> Dependencias:
+    """Registra as consultas feitas pela análise de uma técnica (veja ``Tecnica._encontrar_termos``)."""
+    palavras = [p.replace("-", " ") for p in nome.lower().split()]
+    comparadas: Set[str] = set()
+    compostos: Set[str] = set()
+    i = 0
+    while i < len(palavras):
+        tamanho = 1
+        for n in (3, 2):
+            if i + n <= len(palavras):
+                composto = " ".join(palavras[i : i + n])
+                compostos.add(composto)
+                if indice.buscar_composto(composto):
+                    tamanho = n
+                    break
+        if tamanho == 1:
+            comparadas.add(palavras[i])
+        i += tamanho
+    chaves = frozenset(normalizar_coreano(t.termo["coreano"]) for t in termos)
+    return Dependencias(frozenset(comparadas), frozenset(compostos), chaves)
+
+
+def assinatura(termos: Iterable[TermoEncontrado]) -> tuple:
+    """Conteúdo de um resultado, para comparar análises feitas com índices diferentes."""
+    return tuple((t.categoria, tuple(t.termo.items()), t.distancia, t.ambiguo_com) for t in termos)
+
+
+def _conteudo(entrada: Optional[EntradaIndice]) -> Optional[tuple]:
+    if entrada is None:
+        return None
+    return (entrada.namespace, entrada.categoria, tuple(entrada.termo.items()))
+
+
+@dataclass(frozen=True)
+class Alteracoes:
+    """Diferenças entre dois índices, do ponto de vista da análise de técnicas.
+
+    ``chaves`` inclui toda chave cujo termo vencedor mudou; ``estruturais`` só as incluídas
+    ou removidas (que mudam os candidatos das palavras e a matriz de confusão); ``grafias``
+    as incluídas, removidas ou com outra grafia em coreano (que aparece nas ambiguidades
+    dos vizinhos); ``compostos`` as chaves compostas dos termos alterados.
+    """
+
+    chaves: FrozenSet[str]
+    estruturais: FrozenSet[str]
+    grafias: FrozenSet[str]
+    compostos: FrozenSet[str]
+
+
+def comparar_indices(antigo: IndiceGlossario, novo: IndiceGlossario) -> Alteracoes:
+    """Compara os termos vencedores de cada chave nos dois índices."""
+    chaves: Set[str] = set()
+    estruturais: Set[str] = set()
+    grafias: Set[str] = set()
+    compostos: Set[str] = set()
+    antigas = {entrada.chave: entrada for entrada in antigo.entradas}
+    novas = {entrada.chave: entrada for entrada in novo.entradas}
+    for chave in antigas.keys() | novas.keys():
+        anterior, atual = antigas.get(chave), novas.get(chave)
+        if _conteudo(anterior) == _conteudo(atual):
+            continue
+        chaves.add(chave)
+        compostos.update(e.chave_composta for e in (anterior, atual) if e is not None)
+        if anterior is None or atual is None:
+            estruturais.add(chave)
+            grafias.add(chave)
+        elif anterior.termo["coreano"] != atual.termo["coreano"]:
+            grafias.add(chave)
+    return Alteracoes(frozenset(chaves), frozenset(estruturais), frozenset(grafias), frozenset(compostos))
+
+
+@dataclass(frozen=True)
+class MudancaTecnica:
+    """Resultado de uma técnica antes e depois de uma mudança no glossário."""
+
+    nome: str
+    antes: Tuple[TermoEncontrado, ...]
+    depois: Tuple[TermoEncontrado, ...]
+
+    def __str__(self) -> str:
+        def termos(resultado: Tuple[TermoEncontrado, ...]) -> str:
+            return ", ".join(f"{t.termo['coreano']} ({t.termo['portugues']})" for t in resultado) or "nenhum termo"
+
+        return f"{self.nome}: {termos(self.antes)} -> {termos(self.depois)}"
+
+
+@dataclass(frozen=True)
+class RelatorioReanalise:
+    """Diferenças nas análises do corpus causadas por uma mudança no glossário."""
+
+    termos_alterados: Tuple[str, ...]
+    reanalisadas: int
+    total: int
+    mudancas: Tuple[MudancaTecnica, ...]
+    duracao: float
+
+    def __str__(self) -> str:
+        linhas = [
+            f"Termos alterados: {', '.join(self.termos_alterados) or 'nenhum'}",
+            f"{self.reanalisadas} de {self.total} técnicas reanalisadas em {self.duracao:.2f} s; "
+            f"{len(self.mudancas)} com resultado diferente",
+        ]
+        linhas.extend(f"- {mudanca}" for mudanca in self.mudancas)
+        return "\n".join(linhas)
+
+
+class CorpusAnalises:
+    """Técnicas analisadas com as dependências de cada uma no glossário.
+
+    Para cada palavra comparada termo a termo, guarda os candidatos: as chaves a até
+    ``max_distance`` dela (o termo escolhido e os que quase foram); para cada técnica, os
+    termos encontrados e os compostos procurados. Quando o glossário muda, só as técnicas
+    cujo resultado pode mudar são reanalisadas (veja ``afetadas``).
+    """
+
+    def __init__(
+        self,
+        indice: Optional[IndiceGlossario] = None,
+        max_distance: int = 2,
+        distancia: Optional[str] = None,
+        distancia_segura: bool = False,
+        cache: Optional[CachePersistente] = None,
+    ):
+        """Cria um corpus vazio.
+
+        Args:
+            indice: Índice de glossário. Se None, usa o índice do registro global.
+            max_distance: Distância máxima permitida para cada palavra
+            distancia: Nome do backend de distância. Se None, usa o configurado.
+            distancia_segura: Se True, limita cada termo à sua distância segura.
+            cache: Cache persistente opcional. Ao atualizar o índice, as análises que não
+                mudaram são regravadas com a nova versão, em vez de serem recalculadas.
+        """
+        self.indice = indice if indice is not None else get_registro().indice
+        self.max_distance = max_distance
+        self.distancia = get_distancia(distancia)
+        self.distancia_segura = distancia_segura
+        self.cache = cache
+        self._resultados: Dict[str, Tuple[TermoEncontrado, ...]] = {}
+        self._dependencias: Dict[str, Dependencias] = {}
+        self._candidatos: Dict[str, FrozenSet[str]] = {}
+        self._palavras_por_chave: Dict[str, Set[str]] = defaultdict(set)
+        self._tecnicas_por_palavra: Dict[str, Set[str]] = defaultdict(set)
+        self._tecnicas_por_composto: Dict[str, Set[str]] = defaultdict(set)
+        self._tecnicas_por_termo: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._resultados)
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._resultados
+
+    def resultado(self, nome: str) -> Tuple[TermoEncontrado, ...]:
+        """Termos encontrados em uma técnica do corpus, na ordem em que aparecem."""
+        return self._resultados[nome]
+
+    def dependencias(self, nome: str) -> Dependencias:
+        """Dependências registradas para uma técnica do corpus."""
+        return self._dependencias[nome]
+
+    def candidatos(self, palavra: str) -> FrozenSet[str]:
+        """Chaves a até ``max_distance`` de uma palavra do corpus."""
+        return self._candidatos[palavra]
+
+    def adicionar(self, nomes: Iterable[str]):
+        """Analisa e registra técnicas (as já presentes são ignoradas)."""
+        for nome in nomes:
+            if nome not in self._resultados:
+                self._analisar(nome)
+
+    def _calcular_candidatos(self, palavra: str) -> FrozenSet[str]:
+        limite = self.max_distance
+        return frozenset(
+            entrada.chave
+            for entrada in self.indice.entradas
+            if self.distancia(palavra, entrada.chave, limite) <= limite
+        )
+
+    def _registrar_palavra(self, palavra: str):
+        candidatos = self._calcular_candidatos(palavra)
+        for chave in self._candidatos.get(palavra, ()):
+            self._palavras_por_chave[chave].discard(palavra)
+        self._candidatos[palavra] = candidatos
+        for chave in candidatos:
+            self._palavras_por_chave[chave].add(palavra)
+
+    def _analisar(self, nome: str) -> Tuple[TermoEncontrado, ...]:
+        """Analisa uma técnica com o índice atual e atualiza as suas dependências."""
+        anteriores = self._dependencias.get(nome)
+        if anteriores is not None:
+            for palavra in anteriores.palavras:
+                self._tecnicas_por_palavra[palavra].discard(nome)
+            for composto in anteriores.compostos:
+                self._tecnicas_por_composto[composto].discard(nome)
+            for chave in anteriores.termos:
+                self._tecnicas_por_termo[chave].discard(nome)
+
+        tecnica = analisar_tecnica(
+            nome, self.max_distance, self.indice, distancia=self.distancia.nome, distancia_segura=self.distancia_segura
+        )
+        termos = tecnica.get_termos_ordenados()
+        dependencias = dependencias_tecnica(nome, self.indice, termos)
+        for palavra in dependencias.palavras:
+            if palavra not in self._candidatos:
+                self._registrar_palavra(palavra)
+            self._tecnicas_por_palavra[palavra].add(nome)
+        for composto in dependencias.compostos:
+            self._tecnicas_por_composto[composto].add(nome)
+        for chave in dependencias.termos:
+            self._tecnicas_por_termo[chave].add(nome)
+        self._resultados[nome] = termos
+        self._dependencias[nome] = dependencias
+        return termos
+
+    def afetadas(self, novo: IndiceGlossario) -> Tuple[Set[str], Set[str], Alteracoes]:
+        """Técnicas cujo resultado pode mudar com o novo índice.
+
+        - termo incluído ou removido: as técnicas com uma palavra a até ``max_distance``
+          dele, pois o termo escolhido para a palavra pode mudar;
+        - qualquer mudança em um termo: as técnicas em que ele foi encontrado ou que
+          procuraram a sua chave composta;
+        - termo incluído, removido ou com outra grafia: as técnicas que encontraram um
+          vizinho dele na matriz de confusão (cujas ambiguidades listam o termo) e, com
+          ``distancia_segura``, as que têm o vizinho como candidato, pois a distância
+          segura do vizinho pode ter mudado.
+
+        Returns:
+            Tupla (técnicas afetadas, palavras cujos candidatos mudam, alterações).
+        """
+        alteracoes = comparar_indices(self.indice, novo)
+
+        # Vizinhos dos termos com outra grafia, nas matrizes de confusão antiga e nova
+        vizinhos: Set[str] = set()
+        if alteracoes.grafias:
+            matriz_antiga = get_matriz_confusao(self.indice, self.distancia.nome)
+            matriz_nova = get_matriz_confusao(novo, self.distancia.nome)
+            for chave in alteracoes.grafias:
+                vizinhos.update(vizinho for vizinho, _ in matriz_antiga.vizinhos(chave))
+                vizinhos.update(vizinho for vizinho, _ in matriz_nova.vizinhos(chave))
+
+        # Palavras cujos candidatos mudam: as próximas de um termo removido estão no índice
+        # invertido; as de um termo incluído são procuradas no vocabulário do corpus
+        removidas: Set[str] = set()
+        incluidas = [chave for chave in alteracoes.estruturais if self.indice.buscar(chave) is None]
+        for chave in alteracoes.estruturais:
+            removidas.update(self._palavras_por_chave.get(chave, ()))
+        perto_de_incluidas: Set[str] = set()
+        if incluidas:
+            limite = self.max_distance
+            for palavra in self._candidatos:
+                if any(self.distancia(palavra, chave, limite) <= limite for chave in incluidas):
+                    perto_de_incluidas.add(palavra)
+
+        # Um termo removido só muda o resultado das palavras em que foi escolhido (já
+        # cobertas pelos termos encontrados); um incluído pode ser escolhido por qualquer
+        # palavra perto dele. Com distância segura, o termo escolhido também pode mudar
+        # quando muda a distância segura de um candidato
+        palavras_afetadas = set(perto_de_incluidas)
+        if self.distancia_segura:
+            for chave in vizinhos:
+                palavras_afetadas.update(self._palavras_por_chave.get(chave, ()))
+
+        tecnicas: Set[str] = set()
+        for palavra in palavras_afetadas:
+            tecnicas.update(self._tecnicas_por_palavra.get(palavra, ()))
+        for chave in alteracoes.chaves | vizinhos:
+            tecnicas.update(self._tecnicas_por_termo.get(chave, ()))
+        for composto in alteracoes.compostos:
+            tecnicas.update(self._tecnicas_por_composto.get(composto, ()))
+        return tecnicas, removidas | perto_de_incluidas, alteracoes
+
+    def atualizar(self, novo: IndiceGlossario) -> RelatorioReanalise:
+        """Passa o corpus para o novo índice, reanalisando só as técnicas afetadas.
+
+        Returns:
+            Relatório com as técnicas cujo resultado mudou.
+        """
+        antes = time.perf_counter()
+        tecnicas, palavras, alteracoes = self.afetadas(novo)
+        versao_antiga = self.indice.versao
+        self.indice = novo
+
+        for palavra in palavras:
+            self._registrar_palavra(palavra)
+
+        mudancas = []
+        for nome in sorted(tecnicas):
+            anterior = self._resultados[nome]
+            atual = self._analisar(nome)
+            if assinatura(anterior) != assinatura(atual):
+                mudancas.append(MudancaTecnica(nome, anterior, atual))
+
+        if self.cache is not None and versao_antiga != novo.versao:
+            self._regravar_cache(tecnicas)
+
+        return RelatorioReanalise(
+            termos_alterados=tuple(sorted(alteracoes.chaves)),
+            reanalisadas=len(tecnicas),
+            total=len(self._resultados),
+            mudancas=tuple(mudancas),
+            duracao=time.perf_counter() - antes,
+        )
+
+    def _regravar_cache(self, reanalisadas: Set[str]):
+        """Grava no cache, com a nova versão do índice, as análises que não precisaram ser refeitas."""
+        for nome, termos in self._resultados.items():
+            if nome not in reanalisadas:
+                entrada = entrada_cache(nome, self.distancia.nome, self.distancia_segura)
+                self.cache.guardar(TIPO_TECNICA, entrada, self.max_distance, self.indice.versao, valor_cache(termos))
+
+    def resultados(self) -> Mapping[str, Tuple[TermoEncontrado, ...]]:
+        """Resultados de todas as técnicas do corpus (somente leitura)."""
+        return MappingProxyType(self._resultados)
@@ -0,0 +1,222 @@
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Union
+
+try:
+    import Levenshtein
+except ImportError:  # pragma: no cover - python-Levenshtein é opcional
+    Levenshtein = None
+
+# Variável de ambiente com o nome do backend de distância padrão
+VARIAVEL_DISTANCIA = "TAEKWONDO_DISTANCIA"
+DISTANCIA_PADRAO = "levenshtein"
+
+Numero = Union[int, float]
+
+# Maior peso por letra do prefixo comum no Jaro-Winkler (acima disso a similaridade passa de 1)
+PESO_PREFIXO_MAXIMO = 0.25
+
+
+class Distancia:
+    """Backend de distância entre strings.
+
+    Uma distância recebe duas strings já normalizadas (minúsculas) e um limite opcional.
+    Quando o limite é informado, o cálculo pode parar assim que a distância com certeza
+    o ultrapassar; nesse caso qualquer valor maior que o limite pode ser retornado.
+    """
+
+    nome = ""
+
+    def __call__(self, a: str, b: str, limite: Optional[Numero] = None) -> Numero:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+@lru_cache(maxsize=4096)
+def _mascaras_padrao(padrao: str) -> Dict[str, int]:
+    """Máscara de bits das posições de cada letra no padrão (bit i ligado se ``padrao[i]`` é a letra)."""
+    mascaras: Dict[str, int] = {}
+    for posicao, caractere in enumerate(padrao):
+        mascaras[caractere] = mascaras.get(caractere, 0) | (1 << posicao)
+    return mascaras
+
+
+def levenshtein_myers(a: str, b: str, limite: Optional[Numero] = None) -> int:
+    """Distância de Levenshtein pelo algoritmo paralelo em bits de Myers (variante de Hyyrö).
+
+    Cada coluna da matriz de programação dinâmica é representada pelas diferenças entre
+    células vizinhas, guardadas como bits de inteiros do Python (um bit por letra de ``b``),
+    e atualizada com poucas operações por letra de ``a``, em vez de uma operação por célula.
+    As máscaras de ``b`` (em geral o termo do glossário) são calculadas uma vez e reaproveitadas.
+
+    Com ``limite``, retorna ``limite + 1`` assim que a distância com certeza o ultrapassar.
+    """
+    if a == b:
+        return 0
+    if limite is not None and abs(len(a) - len(b)) > limite:
+        return int(limite) + 1
+    if not b:
+        return len(a)
+
+    mascaras = _mascaras_padrao(b)
+    todos = (1 << len(b)) - 1
+    ultimo = 1 << (len(b) - 1)
+    positivos, negativos = todos, 0  # diferenças verticais +1 e -1
+    distancia = len(b)
+    restantes = len(a)
+    for caractere in a:
+        iguais = mascaras.get(caractere, 0)
+        xv = iguais | negativos
+        xh = (((iguais & positivos) + positivos) ^ positivos) | iguais
+        horizontal_positivos = negativos | (~(xh | positivos) & todos)
+        horizontal_negativos = positivos & xh
+        if horizontal_positivos & ultimo:
+            distancia += 1
+        elif horizontal_negativos & ultimo:
+            distancia -= 1
+        # Distância global: a primeira linha da matriz cresce uma unidade por coluna
+        horizontal_positivos = ((horizontal_positivos << 1) | 1) & todos
+        horizontal_negativos = (horizontal_negativos << 1) & todos
+        positivos = horizontal_negativos | (~(xv | horizontal_positivos) & todos)
+        negativos = horizontal_positivos & xv
+        restantes -= 1
+        # Cada letra restante de ``a`` reduz a distância em no máximo 1
+        if limite is not None and distancia - restantes > limite:
+            return int(limite) + 1
+    return distancia
+
+
+class DistanciaLevenshtein(Distancia):
+    """Distância de Levenshtein (inserção, remoção e substituição).
+
+    Usa a biblioteca em C python-Levenshtein quando instalada; caso contrário, o cálculo
+    paralelo em bits de ``levenshtein_myers``, em Python puro.
+    """
+
+    nome = "levenshtein"
+
+    def __call__(self, a: str, b: str, limite: Optional[Numero] = None) -> Numero:
+        if Levenshtein is None:
+            return levenshtein_myers(a, b, limite)
+        if limite is None:
+            return Levenshtein.distance(a, b)
+        return Levenshtein.distance(a, b, score_cutoff=int(limite))
+
+
+class DistanciaDamerau(Distancia):
+    """Distância de Damerau-Levenshtein restrita (OSA): a troca de duas letras vizinhas custa 1.
+
+    Assim "chgai" fica a 1 de "chagi", enquanto pela distância de Levenshtein fica a 2.
+    """
+
+    nome = "damerau"
+
+    def __call__(self, a: str, b: str, limite: Optional[Numero] = None) -> Numero:
+        if a == b:
+            return 0
+        if limite is not None and abs(len(a) - len(b)) > limite:
+            return limite + 1
+
+        anterior2 = None
+        anterior = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            atual = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                custo = 0 if a[i - 1] == b[j - 1] else 1
+                valor = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + custo)
+                if anterior2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    valor = min(valor, anterior2[j - 2] + 1)
+                atual[j] = valor
+            # O menor valor de uma linha nunca diminui nas linhas seguintes
+            if limite is not None and min(atual) > limite:
+                return limite + 1
+            anterior2, anterior = anterior, atual
+        return anterior[-1]
+
+
+class DistanciaJaroWinkler(Distancia):
+    """Distância derivada da similaridade de Jaro-Winkler, com peso para o prefixo comum.
+
+    A similaridade (entre 0 e 1) favorece palavras que começam igual, o que ajuda em
+    pesquisas que digitam só o começo do termo. Para ser comparável com as distâncias de
+    edição (e com a mesma distância máxima), ela é convertida em
+    ``(1 - similaridade) * max(len(a), len(b))``, arredondada em duas casas.
+    """
+
+    nome = "jaro_winkler"
+
+    def __init__(self, peso_prefixo: float = 0.1, tamanho_prefixo: int = 4):
+        """
+        Args:
+            peso_prefixo: Peso de cada letra do prefixo comum (no máximo ``PESO_PREFIXO_MAXIMO``)
+            tamanho_prefixo: Maior prefixo comum considerado
+        """
+        if not 0 <= peso_prefixo <= PESO_PREFIXO_MAXIMO:
+            raise ValueError(f"O peso do prefixo deve estar entre 0 e {PESO_PREFIXO_MAXIMO}")
+        self.peso_prefixo = peso_prefixo
+        self.tamanho_prefixo = tamanho_prefixo
+
+    def similaridade(self, a: str, b: str) -> float:
+        """Similaridade de Jaro-Winkler entre 0 (nada em comum) e 1 (iguais)."""
+        if a == b:
+            return 1.0
+        if not a or not b:
+            return 0.0
+
+        janela = max(max(len(a), len(b)) // 2 - 1, 0)
+        usados_b = [False] * len(b)
+        comuns_a = []
+        for i, caractere in enumerate(a):
+            for j in range(max(0, i - janela), min(len(b), i + janela + 1)):
+                if not usados_b[j] and b[j] == caractere:
+                    usados_b[j] = True
+                    comuns_a.append(caractere)
+                    break
+        comuns = len(comuns_a)
+        if comuns == 0:
+            return 0.0
+        comuns_b = [b[j] for j in range(len(b)) if usados_b[j]]
+        transposicoes = sum(x != y for x, y in zip(comuns_a, comuns_b)) / 2
+        jaro = (comuns / len(a) + comuns / len(b) + (comuns - transposicoes) / comuns) / 3
+
+        prefixo = 0
+        for x, y in zip(a[: self.tamanho_prefixo], b[: self.tamanho_prefixo]):
+            if x != y:
+                break
+            prefixo += 1
+        return jaro + prefixo * self.peso_prefixo * (1 - jaro)
+
+    def __call__(self, a: str, b: str, limite: Optional[Numero] = None) -> Numero:
+        maior = max(len(a), len(b))
+        if limite is not None and maior:
+            # A similaridade nunca passa de 1 quando falta parte da palavra mais longa
+            menor = min(len(a), len(b))
+            teto = (2 + menor / maior) / 3
+            teto += self.tamanho_prefixo * self.peso_prefixo * (1 - teto)
+            if (1 - min(teto, 1.0)) * maior > limite:
+                return limite + 1
+        return round((1 - self.similaridade(a, b)) * maior, 2)
+
+    def __repr__(self) -> str:
+        return f"DistanciaJaroWinkler(peso_prefixo={self.peso_prefixo}, tamanho_prefixo={self.tamanho_prefixo})"
+
+
+DISTANCIAS: Dict[str, Distancia] = {
+    distancia.nome: distancia for distancia in (DistanciaLevenshtein(), DistanciaDamerau(), DistanciaJaroWinkler())
+}
+
+
+def get_distancia(nome: Optional[str] = None) -> Distancia:
+    """Retorna o backend de distância pelo nome.
+
+    Args:
+        nome: Um dos nomes em ``DISTANCIAS``. Se None, usa a variável de ambiente
+            TAEKWONDO_DISTANCIA ou, na falta dela, a distância de Levenshtein.
+    """
+    nome = nome or os.environ.get(VARIAVEL_DISTANCIA) or DISTANCIA_PADRAO
+    try:
+        return DISTANCIAS[nome]
+    except KeyError:
+        raise ValueError(f"Distância {nome} desconhecida. Opções: {', '.join(DISTANCIAS)}") from None
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .termos import TermoBase
+
+EXTENSAO_CATEGORIA = ".json"
+
+
+@dataclass(frozen=True)
+class TermoArquivo:
+    """Membro de uma categoria carregada de arquivo, com a mesma forma de um membro de Enum."""
+
+    name: str
+    value: TermoBase
+
+
+def _nome_membro(coreano: str) -> str:
+    """Gera um nome no estilo dos membros das enumerações (ex: "Juchum Seogi" -> "JUCHUM_SEOGI")."""
+    return "_".join(coreano.replace("-", " ").upper().split())
+
+
+class CategoriaArquivo:
+    """Categoria de termos carregada sob demanda a partir de um arquivo JSON.
+
+    O arquivo contém uma lista de objetos com as chaves ``coreano``, ``portugues`` e,
+    opcionalmente, ``descricao`` e ``nome``. Nada é lido até o primeiro acesso aos termos,
+    de modo que registrar muitas categorias (ou categorias muito grandes) não tem custo
+    na importação.
+    """
+
+    def __init__(self, caminho: str, nome: Optional[str] = None):
+        """Inicializa a categoria sem ler o arquivo.
+
+        Args:
+            caminho: Caminho do arquivo JSON da categoria
+            nome: Nome da categoria. Se None, usa o nome do arquivo sem extensão.
+        """
+        self.caminho = caminho
+        self.__name__ = nome or os.path.splitext(os.path.basename(caminho))[0]
+        self._membros: Optional[Tuple[TermoArquivo, ...]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def carregada(self) -> bool:
+        """Indica se o arquivo da categoria já foi lido."""
+        return self._membros is not None
+
+    def _carregar(self) -> Tuple[TermoArquivo, ...]:
+        """Lê o arquivo da categoria uma única vez, mesmo com acessos concorrentes."""
+        membros = self._membros
+        if membros is not None:
+            return membros
+
+        with self._lock:
+            if self._membros is None:
+                with open(self.caminho, encoding="utf-8") as arquivo:
+                    dados = json.load(arquivo)
+                if not isinstance(dados, list) or not all(isinstance(item, dict) for item in dados):
+                    raise ValueError(f"Arquivo de categoria {self.caminho} deve conter uma lista de termos")
+
+                self._membros = tuple(
+                    TermoArquivo(
+                        name=item.get("nome") or _nome_membro(item["coreano"]),
+                        value=TermoBase(item["coreano"], item["portugues"], item.get("descricao", "")),
+                    )
+                    for item in dados
+                )
+            return self._membros
+
+    def listar_todos(self) -> List[Dict[str, str]]:
+        """Retorna uma lista de dicionários com todos os termos."""
+        return [
+            {
+                "coreano": termo.value.coreano,
+                "portugues": termo.value.portugues,
+                "descricao": termo.value.descricao,
+            }
+            for termo in self._carregar()
+        ]
+
+    def __iter__(self) -> Iterator[TermoArquivo]:
+        return iter(self._carregar())
+
+    def __len__(self) -> int:
+        return len(self._carregar())
+
+    def __repr__(self) -> str:
+        estado = "carregada" if self.carregada else "não carregada"
+        return f"<CategoriaArquivo {self.__name__} ({estado})>"
+
+
+def carregar_categorias(diretorio: str) -> List[CategoriaArquivo]:
+    """Cria as categorias de um diretório de dados, um arquivo JSON por categoria.
+
+    Apenas o diretório é listado; o conteúdo de cada arquivo é lido no primeiro acesso
+    à respectiva categoria.
+
+    Args:
+        diretorio: Diretório com os arquivos ``<Categoria>.json``
+
+    Returns:
+        Lista de categorias, ordenada pelo nome do arquivo.
+    """
+    arquivos = sorted(f for f in os.listdir(diretorio) if f.endswith(EXTENSAO_CATEGORIA))
+    return [CategoriaArquivo(os.path.join(diretorio, arquivo)) for arquivo in arquivos]
+
+
+def exportar_categorias(categorias: Iterable, diretorio: str) -> List[str]:
+    """Grava cada categoria (enumeração ou arquivo) como um arquivo JSON no diretório.
+
+    Útil para gerar um conjunto de dados editável a partir das enumerações embutidas.
+
+    Returns:
+        Lista com os caminhos dos arquivos gravados.
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for categoria in categorias:
+        dados = [
+            {
+                "nome": termo.name,
+                "coreano": termo.value.coreano,
+                "portugues": termo.value.portugues,
+                "descricao": termo.value.descricao,
+            }
+            for termo in categoria
+        ]
+        caminho = os.path.join(diretorio, categoria.__name__ + EXTENSAO_CATEGORIA)
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, indent=4)
+        caminhos.append(caminho)
+    return caminhos
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .registro import IndiceGlossario, ParticaoIndice, normalizar_coreano
+
+# Idioma dos próprios termos; não tem pacote
+IDIOMA_PADRAO = "pt"
+
+# Um pacote ``<idioma>.json`` por idioma, com as traduções indexadas pelo id de cada termo
+DIRETORIO_PACOTES = os.path.join(os.path.dirname(__file__), "traducoes")
+
+NOMES_IDIOMAS = {"pt": "Português", "en": "English", "es": "Español"}
+
+
+def id_termo(termo: Mapping[str, str]) -> str:
+    """Id estável de um termo nos pacotes de idioma: a romanização normalizada (a chave do índice)."""
+    return normalizar_coreano(termo["coreano"])
+
+
+@dataclass(frozen=True, eq=False)
+class PacoteIdioma:
+    """Traduções e descrições de todos os termos em um idioma.
+
+    ``termos`` mapeia o id de cada termo (veja ``id_termo``) para as chaves ``traducao`` e,
+    opcionalmente, ``descricao``. O pacote é somente leitura, pois é compartilhado por
+    todas as sessões que usam o idioma. ``assinatura`` é um hash do conteúdo, usado nas
+    chaves do cache persistente.
+    """
+
+    idioma: str
+    nome: str
+    termos: Mapping[str, Mapping[str, str]]
+    assinatura: str = ""
+
+    @classmethod
+    def carregar_de_json(cls, caminho: str) -> "PacoteIdioma":
+        """Carrega um pacote a partir de um arquivo JSON."""
+        with open(caminho, "rb") as arquivo:
+            conteudo = arquivo.read()
+        dados = json.loads(conteudo.decode("utf-8"))
+        return cls(
+            idioma=dados["idioma"],
+            nome=dados.get("nome", dados["idioma"]),
+            termos=MappingProxyType({chave: MappingProxyType(valor) for chave, valor in dados["termos"].items()}),
+            assinatura=hashlib.sha256(conteudo).hexdigest()[:16],
+        )
+
+    def localizar(self, termo: Mapping[str, str]) -> Mapping[str, str]:
+        """Retorna o termo com a tradução e a descrição do idioma.
+
+        O resultado tem a mesma forma do termo original (``portugues`` traz a tradução no
+        idioma do pacote), para que pesquisa, renderização e caches funcionem sem mudanças.
+        Termos sem tradução no pacote mantêm o texto original.
+        """
+        traducao = self.termos.get(id_termo(termo))
+        if traducao is None:
+            return termo
+        return MappingProxyType(
+            {
+                **termo,
+                "portugues": traducao.get("traducao") or termo["portugues"],
+                "descricao": traducao.get("descricao") or termo["descricao"],
+            }
+        )
+
+
+_pacotes: Dict[str, PacoteIdioma] = {}
+_pacotes_lock = threading.Lock()
+
+
+def idiomas_disponiveis(diretorio: str = DIRETORIO_PACOTES) -> List[str]:
+    """Códigos dos idiomas disponíveis: o padrão e os que têm pacote no diretório (sem ler os pacotes)."""
+    pacotes = sorted(os.path.splitext(f)[0] for f in os.listdir(diretorio) if f.endswith(".json"))
+    return [IDIOMA_PADRAO, *pacotes]
+
+
+def get_pacote(idioma: Optional[str], diretorio: str = DIRETORIO_PACOTES) -> Optional[PacoteIdioma]:
+    """Retorna o pacote de um idioma, lendo-o só no primeiro pedido; None para o idioma padrão.
+
+    Os pacotes carregados ficam no processo e são compartilhados por todas as sessões;
+    idiomas que nenhuma sessão pediu não ocupam memória.
+    """
+    if not idioma or idioma == IDIOMA_PADRAO:
+        return None
+    pacote = _pacotes.get(idioma)
+    if pacote is not None:
+        return pacote
+
+    with _pacotes_lock:
+        if idioma not in _pacotes:
+            caminho = os.path.join(diretorio, idioma + ".json")
+            if not os.path.isfile(caminho):
+                raise ValueError(f"Idioma {idioma} não disponível")
+            _pacotes[idioma] = PacoteIdioma.carregar_de_json(caminho)
+        return _pacotes[idioma]
+
+
+def pacotes_carregados() -> List[str]:
+    """Códigos dos idiomas cujos pacotes já foram lidos."""
+    return sorted(_pacotes)
+
+
+@lru_cache(maxsize=64)
+def _localizar_particao(particao: ParticaoIndice, pacote: PacoteIdioma) -> Dict[int, Mapping[str, str]]:
+    """Termos traduzidos de uma partição, pela identidade do termo original.
+
+    As partições de fontes que não mudaram são reaproveitadas pelo registro a cada novo
+    índice, então só as fontes alteradas são traduzidas de novo.
+    """
+    return {id(entrada.termo): pacote.localizar(entrada.termo) for entrada in particao.entradas}
+
+
+class IndiceIdioma:
+    """Termos de um ``IndiceGlossario`` em outro idioma, na mesma ordem do índice.
+
+    Apenas as listagens são traduzidas: as romanizações, as chaves e os demais índices em
+    coreano continuam os do índice original, que não é reconstruído. Como a ordem das
+    listagens é a mesma, posições calculadas sobre uma valem para a outra.
+    """
+
+    def __init__(self, indice: IndiceGlossario, pacote: PacoteIdioma):
+        self.indice = indice
+        self.pacote = pacote
+        self._localizados: Dict[int, Mapping[str, str]] = {}
+        for particao in indice.particoes:
+            self._localizados.update(_localizar_particao(particao, pacote))
+        self._categorias: Mapping[str, Tuple[Mapping[str, str], ...]] = MappingProxyType(
+            {
+                categoria: tuple(self.localizar(termo) for termo in termos)
+                for categoria, termos in indice.termos_por_categoria().items()
+            }
+        )
+        self.todos_termos: Tuple[Mapping[str, str], ...] = tuple(
+            termo for termos in self._categorias.values() for termo in termos
+        )
+
+    def localizar(self, termo: Mapping[str, str]) -> Mapping[str, str]:
+        """Retorna a versão traduzida de um termo do índice (ou de uma cópia dele)."""
+        localizado = self._localizados.get(id(termo))
+        return localizado if localizado is not None else self.pacote.localizar(termo)
+
+    def listar_categoria(self, categoria: str) -> Tuple[Mapping[str, str], ...]:
+        """Retorna os termos traduzidos de uma categoria (tupla compartilhada, somente leitura)."""
+        return self._categorias.get(categoria, ())
+
+    def termos_por_categoria(self) -> Mapping[str, Tuple[Mapping[str, str], ...]]:
+        """Retorna todos os termos traduzidos, agrupados por categoria."""
+        return self._categorias
+
+
+@lru_cache(maxsize=16)
+def _indice_idioma(indice: IndiceGlossario, pacote: PacoteIdioma) -> IndiceIdioma:
+    return IndiceIdioma(indice, pacote)
+
+
+def get_indice_idioma(indice: IndiceGlossario, idioma: Optional[str]) -> Optional[IndiceIdioma]:
+    """Retorna os termos do índice no idioma (compartilhados pelas sessões); None para o idioma padrão."""
+    pacote = get_pacote(idioma)
+    if pacote is None:
+        return None
+    return _indice_idioma(indice, pacote)
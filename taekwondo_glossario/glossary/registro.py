@@ -0,0 +1,243 @@
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .termos import TERMOS_ENUMS
+
+NAMESPACE_PADRAO = "padrao"
+
+
+def normalizar_coreano(coreano: str) -> str:
+    """Normaliza a romanização de um termo para comparação (minúsculas, hífens viram espaços)."""
+    return coreano.lower().replace("-", " ")
+
+
+@dataclass(frozen=True, eq=False)
+class EntradaIndice:
+    """Termo indexado, com a fonte e a categoria de onde veio.
+
+    O dicionário do termo é somente leitura, pois é compartilhado por todas as sessões.
+    """
+
+    namespace: str
+    categoria: str
+    termo: Mapping[str, str]
+    chave: str
+    chave_composta: str
+
+
+@dataclass
+class FonteGlossario:
+    """Fonte de termos (federação, escola, arquivo de dados) registrada no índice.
+
+    Attributes:
+        namespace: Identificador único da fonte (ex: "wt", "itf")
+        categorias: Enumerações ou categorias de arquivo com os termos da fonte
+        prioridade: Em romanizações idênticas, vence a fonte de maior prioridade
+    """
+
+    namespace: str
+    categorias: Sequence = field(default_factory=list)
+    prioridade: int = 0
+
+
+@dataclass(frozen=True, eq=False)
+class ParticaoIndice:
+    """Parte do índice construída a partir de uma única fonte."""
+
+    fonte: FonteGlossario
+    entradas: Tuple[EntradaIndice, ...]
+    chaves: Dict[str, EntradaIndice]
+    assinatura: str = ""
+
+    @classmethod
+    def construir(cls, fonte: FonteGlossario) -> "ParticaoIndice":
+        """Indexa todos os termos de uma fonte."""
+        entradas = []
+        chaves: Dict[str, EntradaIndice] = {}
+        for categoria in fonte.categorias:
+            for termo in categoria.listar_todos():
+                entrada = EntradaIndice(
+                    namespace=fonte.namespace,
+                    categoria=categoria.__name__,
+                    termo=MappingProxyType(termo),
+                    chave=normalizar_coreano(termo["coreano"]),
+                    chave_composta=termo["coreano"].lower().replace("-", ""),
+                )
+                entradas.append(entrada)
+                # Dentro de uma mesma fonte, vale o primeiro termo com a romanização
+                chaves.setdefault(entrada.chave, entrada)
+        conteudo = [(e.categoria, e.termo["coreano"], e.termo["portugues"], e.termo["descricao"]) for e in entradas]
+        assinatura = hashlib.sha256(json.dumps(conteudo, ensure_ascii=False).encode("utf-8")).hexdigest()
+        return cls(fonte=fonte, entradas=tuple(entradas), chaves=chaves, assinatura=assinatura)
+
+    @property
+    def ordem(self) -> Tuple[int, str]:
+        """Chave de ordenação das fontes: maior prioridade primeiro, depois namespace."""
+        return (-self.fonte.prioridade, self.fonte.namespace)
+
+
+class IndiceGlossario:
+    """Índice consolidado e imutável de todas as fontes registradas.
+
+    Cada romanização aparece uma única vez: em caso de conflito vence a fonte de maior
+    prioridade e, em empate, a de namespace alfabeticamente menor.
+    """
+
+    def __init__(self, particoes: Sequence[ParticaoIndice], vencedores: Dict[str, EntradaIndice]):
+        self.particoes = tuple(sorted(particoes, key=lambda p: p.ordem))
+        self._vencedores = vencedores
+        # Hash do conteúdo; muda sempre que um termo, uma fonte ou uma prioridade muda
+        conteudo = [(p.fonte.namespace, p.fonte.prioridade, p.assinatura) for p in self.particoes]
+        self.versao = hashlib.sha256(json.dumps(conteudo).encode("utf-8")).hexdigest()[:16]
+        self.entradas: Tuple[EntradaIndice, ...] = tuple(
+            entrada
+            for particao in self.particoes
+            for entrada in particao.entradas
+            if vencedores[entrada.chave] is entrada
+        )
+        self._compostos: Dict[str, EntradaIndice] = {}
+        for entrada in self.entradas:
+            self._compostos.setdefault(entrada.chave_composta, entrada)
+
+        # Na listagem por categoria, omite apenas os termos sobrepostos por outra fonte;
+        # repetições dentro da mesma fonte (ex: um termo em duas categorias) são mantidas
+        categorias: Dict[str, List[Mapping[str, str]]] = {}
+        for particao in self.particoes:
+            for entrada in particao.entradas:
+                if vencedores[entrada.chave].namespace == entrada.namespace:
+                    categorias.setdefault(entrada.categoria, []).append(entrada.termo)
+        self._categorias: Mapping[str, Tuple[Mapping[str, str], ...]] = MappingProxyType(
+            {categoria: tuple(termos) for categoria, termos in categorias.items()}
+        )
+        self.todos_termos: Tuple[Mapping[str, str], ...] = tuple(
+            termo for termos in self._categorias.values() for termo in termos
+        )
+
+    @classmethod
+    def de_categorias(cls, categorias: Sequence, namespace: str = NAMESPACE_PADRAO) -> "IndiceGlossario":
+        """Cria um índice avulso a partir de uma lista de categorias."""
+        particao = ParticaoIndice.construir(FonteGlossario(namespace, categorias))
+        return cls([particao], dict(particao.chaves))
+
+    @property
+    def namespaces(self) -> List[str]:
+        """Namespaces das fontes do índice, em ordem de precedência."""
+        return [particao.fonte.namespace for particao in self.particoes]
+
+    @property
+    def categorias(self) -> List[str]:
+        """Nomes das categorias presentes no índice."""
+        return list(self._categorias)
+
+    def buscar(self, coreano: str) -> Optional[EntradaIndice]:
+        """Retorna a entrada vencedora para uma romanização, se existir."""
+        return self._vencedores.get(normalizar_coreano(coreano))
+
+    def buscar_composto(self, termo_composto: str) -> Optional[EntradaIndice]:
+        """Retorna a entrada cuja romanização sem hífens é exatamente ``termo_composto``."""
+        return self._compostos.get(termo_composto)
+
+    def listar_categoria(self, categoria: str) -> Tuple[Mapping[str, str], ...]:
+        """Retorna os termos de uma categoria (tupla compartilhada, somente leitura)."""
+        return self._categorias.get(categoria, ())
+
+    def termos_por_categoria(self) -> Mapping[str, Tuple[Mapping[str, str], ...]]:
+        """Retorna todos os termos agrupados por categoria (mapeamento compartilhado, somente leitura)."""
+        return self._categorias
+
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+
+class RegistroGlossarios:
+    """Registro de fontes de glossário consolidadas em um único índice.
+
+    Registrar ou remover uma fonte reconstrói apenas a partição daquela fonte e as
+    romanizações que ela contém; as demais partições são reaproveitadas. O índice
+    publicado em ``indice`` é imutável e substituído de uma só vez, então leitores
+    que já obtiveram uma referência continuam consistentes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._particoes: Dict[str, ParticaoIndice] = {}
+        self._fontes_por_chave: Dict[str, Tuple[str, ...]] = {}
+        self._vencedores: Dict[str, EntradaIndice] = {}
+        self.indice = IndiceGlossario([], {})
+
+    def registrar(self, fonte: FonteGlossario) -> IndiceGlossario:
+        """Registra (ou substitui) uma fonte e retorna o novo índice."""
+        particao = ParticaoIndice.construir(fonte)
+        with self._lock:
+            chaves_afetadas = set(particao.chaves)
+            anterior = self._particoes.get(fonte.namespace)
+            if anterior is not None:
+                chaves_afetadas.update(anterior.chaves)
+                self._desindexar(anterior)
+            self._particoes[fonte.namespace] = particao
+            for chave in particao.chaves:
+                self._fontes_por_chave[chave] = (*self._fontes_por_chave.get(chave, ()), fonte.namespace)
+            return self._publicar(chaves_afetadas)
+
+    def remover(self, namespace: str) -> IndiceGlossario:
+        """Remove uma fonte registrada e retorna o novo índice."""
+        with self._lock:
+            if namespace not in self._particoes:
+                raise ValueError(f"Fonte {namespace} não registrada")
+            particao = self._particoes.pop(namespace)
+            self._desindexar(particao)
+            return self._publicar(set(particao.chaves))
+
+    def get_fonte(self, namespace: str) -> FonteGlossario:
+        """Retorna uma fonte registrada pelo namespace."""
+        if namespace not in self._particoes:
+            raise ValueError(f"Fonte {namespace} não registrada")
+        return self._particoes[namespace].fonte
+
+    def get_fontes(self) -> List[FonteGlossario]:
+        """Retorna as fontes registradas, em ordem de precedência."""
+        return [particao.fonte for particao in self.indice.particoes]
+
+    def _desindexar(self, particao: ParticaoIndice):
+        """Remove o namespace da partição do mapa de romanizações."""
+        namespace = particao.fonte.namespace
+        for chave in particao.chaves:
+            restantes = tuple(n for n in self._fontes_por_chave.get(chave, ()) if n != namespace)
+            if restantes:
+                self._fontes_por_chave[chave] = restantes
+            else:
+                self._fontes_por_chave.pop(chave, None)
+
+    def _publicar(self, chaves_afetadas) -> IndiceGlossario:
+        """Recalcula o vencedor apenas das chaves afetadas e publica um novo índice."""
+        vencedores = dict(self._vencedores)
+        for chave in chaves_afetadas:
+            namespaces = self._fontes_por_chave.get(chave)
+            if not namespaces:
+                vencedores.pop(chave, None)
+                continue
+            particao = min((self._particoes[n] for n in namespaces), key=lambda p: p.ordem)
+            vencedores[chave] = particao.chaves[chave]
+        self._vencedores = vencedores
+        self.indice = IndiceGlossario(list(self._particoes.values()), vencedores)
+        return self.indice
+
+
+# Registro global, criado na primeira chamada de get_registro
+_registro: List[RegistroGlossarios] = []
+_registro_lock = threading.Lock()
+
+
+def get_registro() -> RegistroGlossarios:
+    """Retorna o registro global, criado com as enumerações embutidas como fonte padrão."""
+    if not _registro:
+        with _registro_lock:
+            if not _registro:
+                registro = RegistroGlossarios()
+                registro.registrar(FonteGlossario(NAMESPACE_PADRAO, TERMOS_ENUMS))
+                _registro.append(registro)
+    return _registro[0]
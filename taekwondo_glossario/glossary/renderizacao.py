@@ -0,0 +1,122 @@
+from functools import lru_cache
+from typing import Callable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .cache import CachePersistente
+from .idiomas import get_indice_idioma
+from .registro import IndiceGlossario
+from .tecnica import Tecnica, TermoEncontrado, analisar_tecnica
+
+MENSAGEM_SEM_TERMOS = "Nenhum termo encontrado nesta técnica."
+
+
+class Fragmento(NamedTuple):
+    """Markdown pré-renderizado nas duas variantes de exibição."""
+
+    com_descricao: str
+    sem_descricao: str
+
+    def para(self, mostrar_descricao: bool) -> str:
+        """Retorna a variante correspondente à configuração de descrições."""
+        return self.com_descricao if mostrar_descricao else self.sem_descricao
+
+
+def _linha_termo(termo: Mapping[str, str], mostrar_descricao: bool, ambiguo_com: Sequence[str] = ()) -> str:
+    """Item de lista de um termo, com a descrição na linha seguinte se solicitada."""
+    linha = f"- {termo['coreano']} - {termo['portugues']}"
+    if ambiguo_com:
+        linha += f" _(ambíguo, pode ser também: {', '.join(ambiguo_com)})_"
+    if mostrar_descricao and termo["descricao"]:
+        linha += f"  \n  {termo['descricao']}"
+    return linha
+
+
+Traducao = Callable[[Mapping[str, str]], Mapping[str, str]]
+
+
+def _sem_traducao(termo: Mapping[str, str]) -> Mapping[str, str]:
+    return termo
+
+
+def _traducao(indice: IndiceGlossario, idioma: Optional[str]) -> Traducao:
+    """Função que traduz os termos do índice para o idioma (identidade no idioma padrão)."""
+    indice_idioma = get_indice_idioma(indice, idioma)
+    return indice_idioma.localizar if indice_idioma is not None else _sem_traducao
+
+
+def _lista_termos(
+    termos_ordenados: Sequence[TermoEncontrado], mostrar_descricao: bool, traduzir: Traducao = _sem_traducao
+) -> str:
+    """Lista de termos na ordem em que aparecem na técnica."""
+    if not termos_ordenados:
+        return MENSAGEM_SEM_TERMOS
+    linhas = [_linha_termo(traduzir(t.termo), mostrar_descricao, t.ambiguo_com) for t in termos_ordenados]
+    return "**Termos encontrados:**\n\n" + "\n".join(linhas)
+
+
+def _analise_por_categoria(tecnica: Tecnica, mostrar_descricao: bool, traduzir: Traducao = _sem_traducao) -> str:
+    """Termos da técnica agrupados por categoria, como na aba Técnica."""
+    blocos = []
+    for categoria, termos in tecnica.get_termos_encontrados().items():
+        linhas = [_linha_termo(traduzir(t.termo), mostrar_descricao, t.ambiguo_com) for t in termos]
+        blocos.append(f"**{categoria}:**\n\n" + "\n".join(linhas))
+    return "\n\n".join(blocos)
+
+
+@lru_cache(maxsize=4096)
+def _fragmento_termo(coreano: str, portugues: str, descricao: str) -> Fragmento:
+    """Fragmento de um termo, por conteúdo; termos editados ou traduzidos geram entradas novas."""
+    com_descricao = f"**Descrição:**\n\n{descricao}"
+    return Fragmento(com_descricao=com_descricao, sem_descricao="")
+
+
+def fragmento_termo(termo: Mapping[str, str]) -> Fragmento:
+    """Corpo do expander de um termo na aba Termos.
+
+    O fragmento depende apenas do conteúdo do termo, então é gerado uma única vez por
+    termo e reaproveitado por todas as sessões.
+    """
+    return _fragmento_termo(termo["coreano"], termo["portugues"], termo["descricao"])
+
+
+@lru_cache(maxsize=4096)
+def fragmento_tecnica_faixa(
+    nome: str,
+    indice: IndiceGlossario,
+    max_distance: int = 2,
+    cache: Optional[CachePersistente] = None,
+    idioma: Optional[str] = None,
+) -> Fragmento:
+    """Corpo do expander de uma técnica na aba Faixas.
+
+    A chave inclui o índice de glossário (imutável), então uma mudança no glossário gera
+    fragmentos novos; enquanto ele não muda, a técnica é analisada e renderizada uma vez.
+    A análise é a mesma em todos os idiomas; só as traduções exibidas mudam.
+    """
+    termos_ordenados = analisar_tecnica(nome, max_distance, indice=indice, cache=cache).get_termos_ordenados()
+    traduzir = _traducao(indice, idioma)
+    return Fragmento(
+        com_descricao=_lista_termos(termos_ordenados, True, traduzir),
+        sem_descricao=_lista_termos(termos_ordenados, False, traduzir),
+    )
+
+
+@lru_cache(maxsize=1024)
+def fragmento_analise(
+    nome: str,
+    indice: IndiceGlossario,
+    max_distance: int = 2,
+    cache: Optional[CachePersistente] = None,
+    distancia_segura: bool = False,
+    idioma: Optional[str] = None,
+) -> Tuple[bool, Fragmento]:
+    """Resultado da aba Técnica, com os termos agrupados por categoria.
+
+    Returns:
+        Tupla (se algum termo foi encontrado, fragmento).
+    """
+    tecnica = analisar_tecnica(nome, max_distance, indice=indice, cache=cache, distancia_segura=distancia_segura)
+    traduzir = _traducao(indice, idioma)
+    return bool(tecnica.get_termos_encontrados()), Fragmento(
+        com_descricao=_analise_por_categoria(tecnica, True, traduzir),
+        sem_descricao=_analise_por_categoria(tecnica, False, traduzir),
+    )
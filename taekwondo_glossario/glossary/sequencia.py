@@ -0,0 +1,207 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import CachePersistente
+from .confusao import get_matriz_confusao
+from .distancias import get_distancia
+from .registro import IndiceGlossario, get_registro
+from .tecnica import TAMANHOS_COMPOSTOS, Tecnica, TermoEncontrado, analisar_tecnica, termo_encontrado
+from .termos import Acoes, Bases
+
+# Categorias que delimitam os movimentos: uma base começa um movimento e uma ação o termina
+CATEGORIA_BASE = Bases.__name__
+CATEGORIA_ACAO = Acoes.__name__
+
+# Um movimento sem ação é encerrado ao chegar a este número de palavras (limita a memória)
+MAX_PALAVRAS_MOVIMENTO = 32
+
+# Palavras lidas à frente: o suficiente para o maior termo composto
+JANELA = max(TAMANHOS_COMPOSTOS)
+
+# Pontuação removida das bordas das palavras; as marcadas como fim também encerram o movimento
+_PONTUACAO = ".,;:!?()[]\"'"
+_FIM_MOVIMENTO = ".,;!?"
+
+
+@dataclass(frozen=True)
+class _Palavra:
+    original: str
+    fim: bool  # seguida de pontuação ou quebra de linha, que encerram o movimento
+
+
+@dataclass(frozen=True)
+class Movimento:
+    """Um movimento de uma sequência: as palavras e os termos encontrados nelas.
+
+    ``posicao`` é a ordem do movimento na sequência (a partir de 0).
+    """
+
+    posicao: int
+    nome: str
+    termos: Tuple[TermoEncontrado, ...]
+
+    @property
+    def base(self) -> Optional[TermoEncontrado]:
+        """Base (posição) do movimento, se houver."""
+        return next((t for t in self.termos if t.categoria == CATEGORIA_BASE), None)
+
+    @property
+    def acao(self) -> Optional[TermoEncontrado]:
+        """Ação que encerra o movimento; None se a sequência terminou (ou foi cortada) antes dela."""
+        return self.termos[-1] if self.termos and self.termos[-1].categoria == CATEGORIA_ACAO else None
+
+    def tecnica(self, indice: Optional[IndiceGlossario] = None, max_distance: int = 2) -> Tecnica:
+        """Retorna o movimento como uma ``Tecnica``, sem refazer a análise."""
+        return Tecnica.de_termos_ordenados(self.nome, self.termos, max_distance, indice)
+
+
+def _palavras(partes: Iterable[str]) -> Iterator[_Palavra]:
+    """Separa as palavras de um texto recebido em partes, sem juntar as partes.
+
+    Números soltos (como a numeração dos passos de um poomsae) são ignorados.
+    """
+    resto = ""
+    for parte in partes:
+        texto = resto + parte
+        # A última palavra pode continuar na próxima parte
+        corte = len(texto)
+        while corte and not texto[corte - 1].isspace():
+            corte -= 1
+        resto = texto[corte:]
+        yield from _palavras_completas(texto[:corte], texto[:corte].endswith(("\n", "\r")))
+    yield from _palavras_completas(resto, True)
+
+
+def _palavras_completas(texto: str, termina_linha: bool) -> Iterator[_Palavra]:
+    """Palavras de um trecho; a última só encerra a linha se o trecho terminar em quebra de linha."""
+    linhas = texto.splitlines()
+    for numero, linha in enumerate(linhas):
+        palavras = linha.split()
+        fim_linha = termina_linha or numero < len(linhas) - 1
+        for i, original in enumerate(palavras):
+            limpa = original.strip(_PONTUACAO)
+            fim = (fim_linha and i == len(palavras) - 1) or original.rstrip(")]\"'")[-1:] in _FIM_MOVIMENTO
+            if limpa and not limpa.isdigit():
+                yield _Palavra(limpa, fim)
+            elif fim:
+                yield _Palavra("", True)
+
+
+class _DivisorMovimentos:
+    """Estado da divisão de um texto: a janela de palavras e o movimento em andamento."""
+
+    def __init__(
+        self,
+        indice: IndiceGlossario,
+        max_distance: int = 2,
+        cache: Optional[CachePersistente] = None,
+        distancia: Optional[str] = None,
+        distancia_segura: bool = False,
+    ):
+        self.indice = indice
+        self.max_distance = max_distance
+        self.cache = cache
+        self.distancia = distancia
+        self.distancia_segura = distancia_segura
+        self.matriz = get_matriz_confusao(indice, get_distancia(distancia).nome)
+        self._janela: Deque[_Palavra] = deque()
+        self._palavras: Iterator[_Palavra] = iter(())
+        self._nomes: List[str] = []
+        self._termos: List[TermoEncontrado] = []
+        self._posicao = 0
+
+    def _termo_da_palavra(self, original: str) -> Optional[TermoEncontrado]:
+        # A análise de uma palavra é compartilhada (e memorizada) com as análises de técnicas
+        tecnica = analisar_tecnica(
+            original, self.max_distance, self.indice, self.cache, self.distancia, self.distancia_segura
+        )
+        encontrados = tecnica.get_termos_ordenados()
+        return encontrados[0] if encontrados else None
+
+    def _preencher(self):
+        while len(self._janela) < JANELA:
+            palavra = next(self._palavras, None)
+            if palavra is None:
+                return
+            self._janela.append(palavra)
+
+    def _encerrar(self) -> Iterator[Movimento]:
+        """Gera o movimento em andamento, se tiver alguma palavra, e começa um novo."""
+        if self._nomes:
+            yield Movimento(self._posicao, " ".join(self._nomes), tuple(self._termos))
+            self._posicao += 1
+        self._nomes.clear()
+        self._termos.clear()
+
+    def _proximo_termo(self) -> Tuple[Optional[TermoEncontrado], int]:
+        """Termo que começa na primeira palavra da janela e quantas palavras ele ocupa."""
+        janela = self._janela
+        # Compostos, do maior para o menor, sem atravessar o fim de um movimento
+        for n in TAMANHOS_COMPOSTOS:
+            if n <= len(janela) and not any(janela[k].fim for k in range(n - 1)):
+                chave = " ".join(janela[k].original.lower().replace("-", " ") for k in range(n))
+                entrada = self.indice.buscar_composto(chave)
+                if entrada:
+                    return termo_encontrado(entrada, 0, self.indice, self.matriz), n
+        if janela[0].original:
+            return self._termo_da_palavra(janela[0].original.lower()), 1
+        return None, 1
+
+    def dividir(self, partes: Iterable[str]) -> Iterator[Movimento]:
+        """Gera os movimentos de partes consecutivas de um texto, cada um assim que termina."""
+        self._palavras = _palavras(partes)
+        self._preencher()
+        while self._janela:
+            encontrado, tamanho = self._proximo_termo()
+            consumidas = [self._janela.popleft() for _ in range(tamanho)]
+            self._preencher()
+
+            categoria = encontrado.categoria if encontrado is not None else None
+            if categoria == CATEGORIA_BASE and any(t.categoria == CATEGORIA_BASE for t in self._termos):
+                yield from self._encerrar()
+
+            self._nomes.extend(palavra.original for palavra in consumidas if palavra.original)
+            if encontrado is not None:
+                self._termos.append(encontrado)
+
+            if consumidas[-1].fim or categoria == CATEGORIA_ACAO or len(self._nomes) >= MAX_PALAVRAS_MOVIMENTO:
+                yield from self._encerrar()
+        yield from self._encerrar()
+
+
+def dividir_movimentos(
+    texto: Union[str, Iterable[str]],
+    max_distance: int = 2,
+    indice: Optional[IndiceGlossario] = None,
+    cache: Optional[CachePersistente] = None,
+    **opcoes,
+) -> Iterator[Movimento]:
+    """Divide uma sequência de movimentos (ou um roteiro de poomsae) em movimentos.
+
+    Os termos são encontrados como em ``Tecnica`` (compostos de até 3 palavras e, senão,
+    o termo mais próximo de cada palavra), mas em uma única passagem com no máximo 3
+    palavras de antecedência, e cada movimento é gerado assim que termina: ao encontrar
+    uma ação (``Acoes``), ao encontrar uma nova base (``Bases``) quando o movimento já tem
+    uma, ou em pontuação e quebras de linha. Roteiros de qualquer tamanho usam a mesma
+    memória, e o primeiro movimento sai antes de ler o restante do texto.
+
+    Args:
+        texto: Texto inteiro ou partes consecutivas dele (ex: blocos lidos de um arquivo)
+        max_distance: Distância máxima permitida para cada palavra
+        indice: Índice de glossário. Se None, usa o índice do registro global.
+        cache: Cache persistente opcional para as análises de palavras
+        **opcoes: ``distancia`` (nome do backend de distância; se None, usa o configurado)
+            e ``distancia_segura`` (se True, limita cada termo à sua distância segura)
+    """
+    indice = indice if indice is not None else get_registro().indice
+    partes = [texto] if isinstance(texto, str) else texto
+    yield from _DivisorMovimentos(indice, max_distance, cache, **opcoes).dividir(partes)
+
+
+def dividir_arquivo(
+    caminho: str, tamanho_bloco: int = 1 << 16, encoding: str = "utf-8", **opcoes
+) -> Iterator[Movimento]:
+    """Gera os movimentos de um arquivo de texto, lido em blocos (veja ``dividir_movimentos``)."""
+    with open(caminho, encoding=encoding) as arquivo:
+        yield from dividir_movimentos(iter(lambda: arquivo.read(tamanho_bloco), ""), **opcoes)
@@ -1,157 +1,219 @@
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
-import Levenshtein
+from taekwondo_glossario.glossary.cache import TIPO_TECNICA, CachePersistente, normalizar_entrada
+from taekwondo_glossario.glossary.confusao import MatrizConfusao, get_matriz_confusao
+from taekwondo_glossario.glossary.distancias import Distancia, Numero, get_distancia
+from taekwondo_glossario.glossary.registro import EntradaIndice, IndiceGlossario, get_registro
 
-from taekwondo_glossario.glossary import TERMOS_ENUMS
+# Tamanhos (em palavras) dos termos compostos procurados, do maior para o menor
+TAMANHOS_COMPOSTOS = (3, 2)
+
+
+@dataclass(frozen=True)
+class TermoEncontrado:
+    """Termo do glossário encontrado em uma técnica.
+
+    ``termo`` é o próprio termo (somente leitura) do índice, compartilhado por todas as
+    análises; a distância da palavra digitada fica neste registro, não no termo.
+    ``ambiguo_com`` lista os termos (grafia original) que, pela matriz de confusão, podem
+    estar tão perto da palavra digitada quanto o termo escolhido.
+    """
+
+    categoria: str
+    termo: Mapping[str, str]
+    distancia: Numero = 0
+    ambiguo_com: Tuple[str, ...] = ()
+
+
+def termo_encontrado(
+    entrada: EntradaIndice, distancia: Numero, indice: IndiceGlossario, matriz: Optional[MatrizConfusao]
+):
+    """Cria o registro de um termo encontrado, marcando se a correspondência é ambígua.
+
+    Sem ``matriz``, as ambiguidades não são calculadas (``ambiguo_com`` fica vazio).
+    """
+    if matriz is None:
+        return TermoEncontrado(entrada.categoria, entrada.termo, distancia)
+    ambiguos = []
+    for chave in matriz.ambiguos(entrada.chave, distancia):
+        vizinho = indice.buscar(chave)
+        if vizinho is not None:
+            ambiguos.append(vizinho.termo["coreano"])
+    return TermoEncontrado(entrada.categoria, entrada.termo, distancia, tuple(ambiguos))
+
+
+@lru_cache(maxsize=8)
+def _indice_de_categorias(categorias: Tuple) -> IndiceGlossario:
+    """Índice avulso de categorias, montado uma vez para que a sua matriz de confusão seja reaproveitada."""
+    return IndiceGlossario.de_categorias(categorias)
 
 
 class Tecnica:
-    """Classe que representa uma técnica de Taekwondo e identifica os termos presentes nela."""
+    """Classe que representa uma técnica de Taekwondo e identifica os termos presentes nela.
+
+    Os resultados (``termos_encontrados`` e ``ordem_termos``) são tuplas de registros
+    imutáveis, para que a mesma análise possa ser compartilhada entre sessões e threads.
+    """
 
-    def __init__(self, nome: str, max_distance: int = 2):
+    def __init__(
+        self,
+        nome: str,
+        max_distance: int = 2,
+        categorias=None,
+        indice: Optional[IndiceGlossario] = None,
+        distancia: Optional[str] = None,
+        distancia_segura: bool = False,
+        *,
+        ambiguidades: bool = True,
+    ):
         """Inicializa uma técnica com o nome fornecido.
 
         Args:
             nome: Nome da técnica
-            max_distance: Distância máxima de Levenshtein permitida (padrão: 2)
+            max_distance: Distância máxima permitida (padrão: 2)
+            categorias: Enumerações ou categorias de arquivo usadas na busca, no lugar do registro global.
+            indice: Índice de glossário usado na busca. Se None, usa o índice do registro global.
+            distancia: Nome do backend de distância (ver ``distancias.DISTANCIAS``). Se None, usa o configurado.
+            distancia_segura: Se True, cada termo só é aceito até a sua distância segura (ver
+                ``MatrizConfusao.distancia_segura``), além de ``max_distance``.
+            ambiguidades: Se False, ``ambiguo_com`` fica vazio e, sem ``distancia_segura``, a
+                matriz de confusão do índice não é montada
         """
         self.nome = nome
         self.max_distance = max_distance
+        self.distancia: Distancia = get_distancia(distancia)
+        self.distancia_segura = distancia_segura
+        self.ambiguidades = ambiguidades
+        if categorias is not None:
+            indice = _indice_de_categorias(tuple(categorias))
+        self.indice = indice if indice is not None else get_registro().indice
+        self.matriz: Optional[MatrizConfusao] = None
+        if ambiguidades or distancia_segura:
+            self.matriz = get_matriz_confusao(self.indice, self.distancia.nome)
         self.termos_encontrados = self._encontrar_termos()
 
-    def _calcular_similaridade(self, termo: str, palavra: str) -> Tuple[bool, int]:
-        """Calcula a similaridade entre um termo e uma palavra usando a distância de Levenshtein.
+    def _calcular_similaridade(self, termo: str, palavra: str, limite: Optional[int] = None) -> Tuple[bool, Numero]:
+        """Calcula a similaridade entre um termo e uma palavra usando o backend de distância.
 
         Args:
             termo: Termo a ser comparado
             palavra: Palavra onde procurar o termo
+            limite: Distância máxima aceita. Se None, usa ``max_distance``.
 
         Returns:
             Tuple contendo (se encontrou, distância)
         """
-        # Calcula a distância de Levenshtein
-        distancia = Levenshtein.distance(palavra.lower(), termo.lower())
+        limite = self.max_distance if limite is None else limite
+
+        # Calcula a distância, que pode parar cedo ao passar do máximo permitido
+        distancia = self.distancia(palavra.lower(), termo.lower(), limite)
 
         # Se a distância for menor ou igual ao máximo permitido, encontrou
-        if distancia <= self.max_distance:
+        if distancia <= limite:
             return True, distancia
 
         return False, 0
 
-    def _encontrar_termos(self) -> Dict[str, List[Dict[str, str]]]:
+    def _termo_mais_proximo(self, palavra: str) -> Tuple[Optional[EntradaIndice], Numero]:
+        """Retorna a entrada do índice mais próxima da palavra e a sua distância."""
+        menor_distancia = float("inf")
+        mais_proxima = None
+        for entrada in self.indice.entradas:
+            limite = None
+            if self.distancia_segura:
+                limite = min(self.max_distance, self.matriz.distancia_segura(entrada.chave))
+            encontrou, distancia = self._calcular_similaridade(entrada.chave, palavra, limite)
+            # Em caso de empate, mantém a primeira entrada na ordem de precedência do índice
+            if encontrou and distancia < menor_distancia:
+                menor_distancia = distancia
+                mais_proxima = entrada
+        return mais_proxima, menor_distancia if mais_proxima else 0
+
+    def _encontrar_termos(self) -> Mapping[str, Tuple[TermoEncontrado, ...]]:
         """Encontra todos os termos presentes no nome da técnica."""
         # Divide o nome da técnica em palavras e remove hífens
         palavras = [p.replace("-", " ") for p in self.nome.lower().split()]
 
-        # Dicionário para armazenar os termos encontrados por categoria
-        termos_por_categoria = {}
         # Lista para manter a ordem dos termos encontrados
         ordem_termos = []
-        # Conjunto para rastrear palavras já processadas
-        palavras_processadas = set()
 
-        # Para cada palavra na técnica
         i = 0
         while i < len(palavras):
-            palavra_atual = palavras[i]
-            termo_encontrado = False
-
-            # Tenta encontrar termos compostos (3 palavras)
-            if i + 2 < len(palavras):
-                termo_composto = " ".join(palavras[i : i + 3])
-                for enum in TERMOS_ENUMS:
-                    for termo in enum.listar_todos():
-                        # Remove hífens do termo coreano antes de comparar
-                        termo_coreano = termo["coreano"].lower().replace("-", "")
-                        if termo_coreano == termo_composto:
-                            categoria = enum.__name__
-                            if categoria not in termos_por_categoria:
-                                termos_por_categoria[categoria] = []
-                            termo_copy = termo.copy()
-                            termo_copy["distancia"] = 0
-                            termos_por_categoria[categoria].append(termo_copy)
-                            ordem_termos.append((categoria, termo_copy))
-                            palavras_processadas.update(palavras[i : i + 3])
-                            i += 3
-                            termo_encontrado = True
-                            break
-                    if termo_encontrado:
-                        break
+            entrada = None
+            distancia = 0
+            tamanho = 1
 
-            # Se não encontrou termo de 3 palavras, tenta de 2
-            if not termo_encontrado and i + 1 < len(palavras):
-                termo_composto = " ".join(palavras[i : i + 2])
-                for enum in TERMOS_ENUMS:
-                    for termo in enum.listar_todos():
-                        # Remove hífens do termo coreano antes de comparar
-                        termo_coreano = termo["coreano"].lower().replace("-", "")
-                        if termo_coreano == termo_composto:
-                            categoria = enum.__name__
-                            if categoria not in termos_por_categoria:
-                                termos_por_categoria[categoria] = []
-                            termo_copy = termo.copy()
-                            termo_copy["distancia"] = 0
-                            termos_por_categoria[categoria].append(termo_copy)
-                            ordem_termos.append((categoria, termo_copy))
-                            palavras_processadas.update(palavras[i : i + 2])
-                            i += 2
-                            termo_encontrado = True
-                            break
-                    if termo_encontrado:
+            # Tenta encontrar termos compostos, do maior para o menor
+            for n in TAMANHOS_COMPOSTOS:
+                if i + n <= len(palavras):
+                    entrada = self.indice.buscar_composto(" ".join(palavras[i : i + n]))
+                    if entrada:
+                        tamanho = n
                         break
 
             # Se não encontrou termo composto, tenta termo simples
-            if not termo_encontrado:
-                # Inicializa a menor distância encontrada para esta palavra
-                menor_distancia = float("inf")
-                termo_mais_proximo = None
-                categoria_termo = None
-
-                # Para cada enumeração, verifica se algum termo está próximo da palavra
-                for enum in TERMOS_ENUMS:
-                    for termo in enum.listar_todos():
-                        # Remove hífens do termo coreano antes de comparar
-                        termo_coreano = termo["coreano"].lower().replace("-", " ")
-                        # Verifica se o termo está próximo da palavra
-                        encontrou, distancia = self._calcular_similaridade(termo_coreano, palavra_atual)
-
-                        # Se encontrou e a distância é menor que a menor distância encontrada até agora
-                        if encontrou and distancia < menor_distancia:
-                            menor_distancia = distancia
-                            termo_mais_proximo = termo.copy()
-                            termo_mais_proximo["distancia"] = distancia
-                            categoria_termo = enum.__name__
-
-                # Se encontrou um termo para esta palavra, armazena
-                if termo_mais_proximo:
-                    if categoria_termo not in termos_por_categoria:
-                        termos_por_categoria[categoria_termo] = []
-                    termos_por_categoria[categoria_termo].append(termo_mais_proximo)
-                    ordem_termos.append((categoria_termo, termo_mais_proximo))
-                    palavras_processadas.add(palavra_atual)
-
-                i += 1
-
-        # Adiciona a ordem aos termos encontrados
-        self.ordem_termos = ordem_termos
-        return termos_por_categoria
-
-    def get_termos_encontrados(self) -> Dict[str, List[Dict[str, str]]]:
-        """Retorna os termos encontrados na técnica."""
+            if entrada is None:
+                entrada, distancia = self._termo_mais_proximo(palavras[i])
+
+            # Se encontrou um termo para esta palavra, armazena
+            if entrada:
+                ordem_termos.append(
+                    termo_encontrado(entrada, distancia, self.indice, self.matriz if self.ambiguidades else None)
+                )
+
+            i += tamanho
+
+        return self._definir_resultado(ordem_termos)
+
+    def _definir_resultado(self, termos_ordenados: Sequence[TermoEncontrado]):
+        """Guarda a ordem dos termos e retorna o agrupamento por categoria, ambos somente leitura."""
+        self.ordem_termos: Tuple[TermoEncontrado, ...] = tuple(termos_ordenados)
+        termos_por_categoria: Dict[str, List[TermoEncontrado]] = {}
+        for encontrado in self.ordem_termos:
+            termos_por_categoria.setdefault(encontrado.categoria, []).append(encontrado)
+        return MappingProxyType({categoria: tuple(termos) for categoria, termos in termos_por_categoria.items()})
+
+    @classmethod
+    def de_termos_ordenados(
+        cls,
+        nome: str,
+        termos_ordenados: Sequence[TermoEncontrado],
+        max_distance: int = 2,
+        indice: Optional[IndiceGlossario] = None,
+        distancia: Optional[str] = None,
+        distancia_segura: bool = False,
+    ) -> "Tecnica":
+        """Reconstrói uma técnica a partir de um resultado já calculado, sem refazer a análise."""
+        tecnica = cls.__new__(cls)
+        tecnica.nome = nome
+        tecnica.max_distance = max_distance
+        tecnica.distancia = get_distancia(distancia)
+        tecnica.distancia_segura = distancia_segura
+        tecnica.ambiguidades = True
+        tecnica.indice = indice if indice is not None else get_registro().indice
+        tecnica.matriz = get_matriz_confusao(tecnica.indice, tecnica.distancia.nome)
+        tecnica.termos_encontrados = tecnica._definir_resultado(termos_ordenados)
+        return tecnica
+
+    def get_termos_encontrados(self) -> Mapping[str, Tuple[TermoEncontrado, ...]]:
+        """Retorna os termos encontrados na técnica, agrupados por categoria."""
         return self.termos_encontrados
 
     def get_categorias_encontradas(self) -> List[str]:
         """Retorna as categorias de termos encontradas na técnica."""
         return list(self.termos_encontrados.keys())
 
-    def get_todos_termos(self) -> List[Dict[str, str]]:
+    def get_todos_termos(self) -> List[TermoEncontrado]:
         """Retorna todos os termos encontrados, independente da categoria."""
         todos_termos = []
         for termos in self.termos_encontrados.values():
             todos_termos.extend(termos)
         return todos_termos
 
-    def get_termos_ordenados(self) -> List[Tuple[str, Dict[str, str]]]:
+    def get_termos_ordenados(self) -> Tuple[TermoEncontrado, ...]:
         """Retorna os termos na ordem em que aparecem na técnica."""
         return self.ordem_termos
 
@@ -160,6 +222,77 @@ class Tecnica:
         return f"Técnica: {self.nome}"
 
 
+def analisar_tecnica(
+    nome: str,
+    max_distance: int = 2,
+    indice: Optional[IndiceGlossario] = None,
+    cache: Optional[CachePersistente] = None,
+    distancia: Optional[str] = None,
+    distancia_segura: bool = False,
+) -> Tecnica:
+    """Analisa uma técnica, reaproveitando resultados já calculados.
+
+    A mesma técnica analisada com o mesmo índice retorna o mesmo objeto (somente leitura),
+    compartilhado por todas as sessões do processo. Se houver cache persistente, ele é
+    consultado antes de refazer a análise.
+
+    Args:
+        nome: Nome da técnica
+        max_distance: Distância máxima permitida (padrão: 2)
+        indice: Índice de glossário usado na busca. Se None, usa o índice do registro global.
+        cache: Cache persistente opcional. A chave inclui a versão do índice.
+        distancia: Nome do backend de distância. Se None, usa o configurado.
+        distancia_segura: Se True, limita cada termo à sua distância segura.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    return _analisar_compartilhado(nome, max_distance, indice, cache, get_distancia(distancia).nome, distancia_segura)
+
+
+def entrada_cache(nome: str, distancia: str, distancia_segura: bool = False) -> str:
+    """Chave de uma análise de técnica no cache persistente (sem a distância máxima e a versão)."""
+    return f"{distancia}{':segura' if distancia_segura else ''}\x1f{normalizar_entrada(nome)}"
+
+
+def valor_cache(termos_ordenados: Sequence[TermoEncontrado]) -> List[list]:
+    """Valor guardado no cache persistente para uma análise: categoria, romanização e distância de cada termo."""
+    return [[t.categoria, t.termo["coreano"], t.distancia] for t in termos_ordenados]
+
+
+@lru_cache(maxsize=4096)
+def _analisar_compartilhado(
+    nome: str,
+    max_distance: int,
+    indice: IndiceGlossario,
+    cache: Optional[CachePersistente],
+    distancia: str,
+    distancia_segura: bool = False,
+) -> Tecnica:
+    """Memoriza as análises no processo; o índice (imutável) faz parte da chave."""
+    if cache is None:
+        return Tecnica(nome, max_distance, indice=indice, distancia=distancia, distancia_segura=distancia_segura)
+
+    # O cache guarda só a categoria, a romanização e a distância; os termos e as
+    # ambiguidades vêm do índice e da sua matriz de confusão
+    entrada = entrada_cache(nome, distancia, distancia_segura)
+    guardados = cache.obter(TIPO_TECNICA, entrada, max_distance, indice.versao)
+    if guardados is not None:
+        matriz = get_matriz_confusao(indice, distancia)
+        termos_ordenados = []
+        for _, coreano, distancia_termo in guardados:
+            termo = indice.buscar(coreano)
+            if termo is None:
+                break
+            termos_ordenados.append(termo_encontrado(termo, distancia_termo, indice, matriz))
+        else:
+            return Tecnica.de_termos_ordenados(
+                nome, termos_ordenados, max_distance, indice, distancia, distancia_segura
+            )
+
+    tecnica = Tecnica(nome, max_distance, indice=indice, distancia=distancia, distancia_segura=distancia_segura)
+    cache.guardar(TIPO_TECNICA, entrada, max_distance, indice.versao, valor_cache(tecnica.get_termos_ordenados()))
+    return tecnica
+
+
 # Exemplo de uso
 if __name__ == "__main__":
     # Exemplo de uma técnica com erro de digitação
@@ -171,6 +304,6 @@ if __name__ == "__main__":
 
     for categoria, termos in tecnica.get_termos_encontrados().items():
         print(f"\n{categoria}:")
-        for termo in termos:
-            distancia = termo.get("distancia", 0)
-            print(f"  - {termo['coreano']} ({termo['portugues']}) - Distância: {distancia}")
+        for encontrado in termos:
+            termo = encontrado.termo
+            print(f"  - {termo['coreano']} ({termo['portugues']}) - Distância: {encontrado.distancia}")
@@ -462,3 +462,18 @@ class TecnicasDeBloqueio(TermoEnumMixin, Enum):
         "Cruzado",
         "Movimento onde os braços se cruzam para bloquear ataques, aumentando a força e a cobertura da defesa.",
     )
+
+
+# Lista de todas as enumerações de termos disponíveis
+TERMOS_ENUMS = [
+    Bases,
+    Acoes,
+    Direcoes,
+    PartesCorpo,
+    PartesMao,
+    PartesPe,
+    TecnicasDeBloqueio,
+    TiposChute,
+    TiposMovimento,
+    ModificadoresDirecao,
+]
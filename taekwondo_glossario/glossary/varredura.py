@@ -0,0 +1,285 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .distancias import Numero, get_distancia
+from .registro import IndiceGlossario, get_registro
+from .tecnica import analisar_tecnica
+
+# Categoria das menções de nomes completos de técnicas (ex: das faixas)
+CATEGORIA_TECNICA = "Técnica"
+
+# Palavras menores que isto não passam pela verificação aproximada
+TAMANHO_MINIMO_APROXIMADO = 4
+
+# Palavras maiores que isto não são guardadas para a verificação aproximada
+TAMANHO_MAXIMO_PALAVRA = 64
+
+
+@dataclass(frozen=True)
+class Mencao:
+    """Menção a um termo ou técnica encontrada em um texto.
+
+    ``inicio`` e ``fim`` são as posições (de caractere) no texto original, como em uma
+    fatia ``texto[inicio:fim]``. ``termo`` é None nas menções de técnicas.
+    """
+
+    inicio: int
+    fim: int
+    categoria: str
+    nome: str
+    termo: Optional[Mapping[str, str]] = None
+    distancia: Numero = 0
+
+
+def _normalizar_caractere(caractere: str) -> str:
+    """Minúsculas, com espaços e hífens tratados como um separador único."""
+    if caractere.isspace() or caractere == "-":
+        return " "
+    return caractere.lower()
+
+
+def _normalizar_padrao(texto: str) -> str:
+    return " ".join("".join(_normalizar_caractere(c) for c in texto).split())
+
+
+class VarredorTexto:
+    """Extrai menções de termos e técnicas de textos longos com um autômato de Aho-Corasick.
+
+    O autômato é construído uma vez sobre as romanizações normalizadas dos termos do
+    índice (com e sem hífens) e, opcionalmente, sobre nomes de técnicas. O texto é lido em
+    partes, em uma única passagem linear: o estado guardado entre as partes é limitado
+    pelo tamanho do maior padrão, não pelo tamanho do texto. Só contam menções entre
+    limites de palavra, e uma menção contida em outra maior (ex: "chagi" dentro de
+    "ap chagi" de uma técnica) é descartada.
+
+    Com ``max_distance`` maior que zero, as palavras não cobertas por nenhuma menção exata
+    passam por uma verificação aproximada (a mesma análise de ``Tecnica``, limitada à
+    distância segura de cada termo), que recupera erros de digitação.
+    """
+
+    def __init__(
+        self,
+        indice: Optional[IndiceGlossario] = None,
+        tecnicas: Sequence[str] = (),
+        max_distance: int = 0,
+        distancia: Optional[str] = None,
+        distancia_segura: bool = True,
+    ):
+        """Constrói o autômato.
+
+        Args:
+            indice: Índice de glossário. Se None, usa o índice do registro global.
+            tecnicas: Nomes de técnicas reconhecidos como menções de categoria ``CATEGORIA_TECNICA``
+            max_distance: Distância máxima da verificação aproximada (0 desliga a verificação)
+            distancia: Nome do backend de distância da verificação aproximada
+            distancia_segura: Se True, a verificação aproximada respeita a distância segura de cada termo
+        """
+        self.indice = indice if indice is not None else get_registro().indice
+        self.max_distance = max_distance
+        self.distancia = get_distancia(distancia).nome
+        self.distancia_segura = distancia_segura
+
+        # Padrões: texto normalizado -> (categoria, nome, termo); o primeiro registrado vence
+        padroes: Dict[str, Tuple[str, str, Optional[Mapping[str, str]]]] = {}
+        for entrada in self.indice.entradas:
+            valor = (entrada.categoria, entrada.termo["coreano"], entrada.termo)
+            for chave in (entrada.chave, entrada.chave_composta):
+                normalizado = _normalizar_padrao(chave)
+                if normalizado:
+                    padroes.setdefault(normalizado, valor)
+        for nome in tecnicas:
+            padrao = _normalizar_padrao(nome)
+            if padrao:
+                padroes.setdefault(padrao, (CATEGORIA_TECNICA, nome, None))
+
+        self._padroes: List[Tuple[int, Tuple[str, str, Optional[Mapping[str, str]]]]] = []
+        self._transicoes: List[Dict[str, int]] = [{}]
+        self._saidas: List[Tuple[int, ...]] = [()]
+        for padrao, valor in padroes.items():
+            estado = 0
+            for caractere in padrao:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes[estado][caractere] = proximo
+                    self._transicoes.append({})
+                    self._saidas.append(())
+                estado = proximo
+            self._saidas[estado] += (len(self._padroes),)
+            self._padroes.append((len(padrao), valor))
+        self.maior_padrao = max((tamanho for tamanho, _ in self._padroes), default=0)
+
+        # Ligações de falha em largura; cada estado herda as saídas do seu sufixo
+        self._falhas = [0] * len(self._transicoes)
+        fila = deque(self._transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, proximo in self._transicoes[estado].items():
+                fila.append(proximo)
+                falha = self._falhas[estado]
+                while falha and caractere not in self._transicoes[falha]:
+                    falha = self._falhas[falha]
+                destino = self._transicoes[falha].get(caractere, 0)
+                self._falhas[proximo] = destino if destino != proximo else 0
+                self._saidas[proximo] += self._saidas[self._falhas[proximo]]
+
+    def _avancar(self, estado: int, caractere: str) -> int:
+        while estado and caractere not in self._transicoes[estado]:
+            estado = self._falhas[estado]
+        return self._transicoes[estado].get(caractere, 0)
+
+    def _verificar_palavra(self, palavra: str, inicio: int, fim: int) -> Optional[Mencao]:
+        """Verificação aproximada de uma palavra não coberta por nenhuma menção exata."""
+        termos = analisar_tecnica(
+            palavra,
+            self.max_distance,
+            indice=self.indice,
+            distancia=self.distancia,
+            distancia_segura=self.distancia_segura,
+        ).get_termos_ordenados()
+        if len(termos) != 1:
+            return None
+        encontrado = termos[0]
+        return Mencao(
+            inicio, fim, encontrado.categoria, encontrado.termo["coreano"], encontrado.termo, encontrado.distancia
+        )
+
+    def _terminadas(
+        self, estado: int, recentes: Deque[Tuple[int, str]], indice: int, posicao: int
+    ) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Menções que terminam no caractere atual e começam em um limite de palavra."""
+        for padrao in self._saidas[estado]:
+            tamanho = self._padroes[padrao][0]
+            # Limite de palavra à esquerda (no início do texto não há caractere anterior)
+            if tamanho < len(recentes):
+                antes, primeiro = recentes[-tamanho - 1][1], recentes[-tamanho][1]
+                if antes.isalnum() and primeiro.isalnum():
+                    continue
+            yield (indice - tamanho + 1, indice + 1, recentes[-tamanho][0], posicao + 1, padrao)
+
+    @staticmethod
+    def _guardar_palavra(
+        palavras: List[Tuple[int, str, int, int]],
+        palavra: List[str],
+        inicio_palavra: Tuple[int, int],
+        fim: int,
+        maior_palavra: int,
+    ):
+        """Guarda a palavra que terminou em ``fim`` para a verificação aproximada e a esvazia."""
+        if TAMANHO_MINIMO_APROXIMADO <= len(palavra) <= maior_palavra:
+            palavras.append((inicio_palavra[0], "".join(palavra), inicio_palavra[1], fim))
+        palavra.clear()
+
+    def _finalizar(
+        self,
+        candidatas: List[Tuple[int, int, int, int, int]],
+        cobertura: List[Tuple[int, int]],
+        palavras: List[Tuple[int, str, int, int]],
+        limite: Optional[int],
+    ) -> List[Mencao]:
+        """Emite as menções e palavras que começam antes de ``limite`` (ou todas, se None).
+
+        Retira de ``candidatas`` e ``palavras`` o que foi emitido ou descartado e atualiza
+        ``cobertura``, que são listas do estado da varredura.
+        """
+        saida = []
+        prontas = [c for c in candidatas if limite is None or c[0] < limite]
+        candidatas[:] = [c for c in candidatas if c not in prontas]
+        for inicio_n, fim_n, inicio, fim, padrao in prontas:
+            contida = any(
+                outra[0] <= inicio_n and outra[1] >= fim_n and outra[1] - outra[0] > fim_n - inicio_n
+                for outra in (*cobertura, *prontas, *candidatas)
+            )
+            if not contida:
+                cobertura.append((inicio_n, fim_n))
+                categoria, nome, termo = self._padroes[padrao][1]
+                saida.append(Mencao(inicio, fim, categoria, nome, termo))
+
+        prontas_palavras = [p for p in palavras if limite is None or p[0] < limite]
+        palavras[:] = palavras[len(prontas_palavras) :]
+        for inicio_n, texto, inicio, fim in prontas_palavras:
+            fim_n = inicio_n + len(texto)
+            if any(c_inicio < fim_n and c_fim > inicio_n for c_inicio, c_fim in cobertura):
+                continue
+            mencao = self._verificar_palavra(texto, inicio, fim)
+            if mencao is not None:
+                saida.append(mencao)
+
+        if limite is not None:
+            # O que ainda vai ser emitido começa depois de ``limite``
+            cobertura[:] = [c for c in cobertura if c[1] > limite]
+        saida.sort(key=lambda m: (m.inicio, -m.fim))
+        return saida
+
+    def varrer(self, partes: Iterable[str]) -> Iterator[Mencao]:
+        """Gera as menções de um texto recebido em partes, em ordem de posição.
+
+        Args:
+            partes: Partes consecutivas do texto (ex: blocos lidos de um arquivo)
+        """
+        # Uma menção (ou palavra) só é emitida quando nenhuma menção que a contenha pode mais aparecer
+        atraso = self.maior_padrao + self.max_distance + 2
+        maior_palavra = self.maior_padrao + self.max_distance
+        estado = 0
+        posicao = 0  # posição no texto original
+        indice = -1  # posição no texto normalizado
+        anterior = " "  # último caractere normalizado (o início conta como separador)
+        # Posição original e caractere dos últimos caracteres normalizados
+        recentes: Deque[Tuple[int, str]] = deque(maxlen=self.maior_padrao + 1)
+        # Menções (início e fim normalizados, início e fim originais, padrão)
+        pendentes: List[Tuple[int, int, int, int, int]] = []  # aguardam o limite de palavra à direita
+        candidatas: List[Tuple[int, int, int, int, int]] = []  # aguardam saber se estão contidas em outra
+        cobertura: List[Tuple[int, int]] = []  # trechos normalizados das menções já emitidas
+        # Palavras para a verificação aproximada (início normalizado, texto, início e fim originais)
+        palavras: List[Tuple[int, str, int, int]] = []
+        palavra: List[str] = []
+        inicio_palavra = (0, 0)
+
+        for parte in partes:
+            for original in parte:
+                caractere = _normalizar_caractere(original)
+                if caractere == " " and anterior == " ":
+                    posicao += 1
+                    continue
+                indice += 1
+                recentes.append((posicao, caractere))
+                alfanumerico = caractere.isalnum()
+
+                # Limite de palavra à direita das menções que terminaram no caractere anterior
+                if pendentes:
+                    if not (alfanumerico and anterior.isalnum()):
+                        candidatas.extend(pendentes)
+                    pendentes.clear()
+
+                if self.max_distance:
+                    if alfanumerico:
+                        if not palavra:
+                            inicio_palavra = (indice, posicao)
+                        if len(palavra) <= maior_palavra:
+                            palavra.append(caractere)
+                    elif palavra:
+                        self._guardar_palavra(palavras, palavra, inicio_palavra, posicao, maior_palavra)
+
+                estado = self._avancar(estado, caractere)
+                pendentes.extend(self._terminadas(estado, recentes, indice, posicao))
+
+                anterior = caractere
+                posicao += 1
+                if indice % 256 == 0:
+                    yield from self._finalizar(candidatas, cobertura, palavras, indice - atraso)
+
+        # O fim do texto conta como limite de palavra
+        candidatas.extend(pendentes)
+        if palavra:
+            self._guardar_palavra(palavras, palavra, inicio_palavra, posicao, maior_palavra)
+        yield from self._finalizar(candidatas, cobertura, palavras, None)
+
+    def varrer_texto(self, texto: str) -> List[Mencao]:
+        """Retorna todas as menções de um texto já carregado."""
+        return list(self.varrer([texto]))
+
+    def varrer_arquivo(self, caminho: str, tamanho_bloco: int = 1 << 16, encoding: str = "utf-8") -> Iterator[Mencao]:
+        """Gera as menções de um arquivo de texto, lido em blocos de ``tamanho_bloco`` caracteres."""
+        with open(caminho, encoding=encoding) as arquivo:
+            yield from self.varrer(iter(lambda: arquivo.read(tamanho_bloco), ""))
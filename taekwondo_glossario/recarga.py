@@ -0,0 +1,229 @@
+"""Recarga a quente dos arquivos de glossário e de faixas.
+
+Um ``Recarregador`` mantém um ``Snapshot`` imutável com o índice de glossário e o
+catálogo de faixas. Quando um arquivo observado muda, apenas aquele arquivo é relido,
+apenas a parte afetada do índice (a fonte do arquivo) ou do catálogo (a faixa do
+arquivo) é reconstruída, e o novo snapshot substitui o anterior com uma única
+atribuição. Leitores nunca esperam por uma recarga: quem já obteve um snapshot
+continua usando-o até terminar.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .faixas.faixa import GerenciadorFaixas
+from .glossary.fontes import EXTENSAO_CATEGORIA, CategoriaArquivo, carregar_categorias
+from .glossary.registro import FonteGlossario, IndiceGlossario, RegistroGlossarios, get_registro
+
+try:
+    from watchdog import events as eventos_watchdog
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - watchdog é opcional
+    eventos_watchdog = None
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Estado consistente do glossário e das faixas em um dado momento."""
+
+    indice: IndiceGlossario
+    gerenciador: GerenciadorFaixas
+    versao: int = 0
+
+
+class ObservadorPolling:
+    """Observa diretórios comparando periodicamente data de modificação e tamanho dos arquivos."""
+
+    def __init__(self, diretorios: Iterable[str], callback: Callable[[str], None], intervalo: float = 1.0):
+        self.diretorios = list(diretorios)
+        self.callback = callback
+        self.intervalo = intervalo
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._estado = self._varrer()
+
+    def _varrer(self) -> Dict[str, Tuple[int, int]]:
+        """Retorna (mtime, tamanho) de cada arquivo JSON dos diretórios observados."""
+        estado = {}
+        for diretorio in self.diretorios:
+            try:
+                nomes = os.listdir(diretorio)
+            except FileNotFoundError:
+                continue
+            for nome in nomes:
+                if not nome.endswith(".json"):
+                    continue
+                caminho = os.path.join(diretorio, nome)
+                try:
+                    info = os.stat(caminho)
+                except FileNotFoundError:
+                    continue
+                estado[caminho] = (info.st_mtime_ns, info.st_size)
+        return estado
+
+    def verificar(self):
+        """Executa uma varredura e notifica os arquivos criados, alterados ou removidos."""
+        novo = self._varrer()
+        alterados = {c for c in novo.keys() | self._estado.keys() if novo.get(c) != self._estado.get(c)}
+        self._estado = novo
+        for caminho in sorted(alterados):
+            self.callback(caminho)
+
+    def _executar(self):
+        while not self._parar.wait(self.intervalo):
+            self.verificar()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._executar, name="observador-polling", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def criar_observador(diretorios: Iterable[str], callback: Callable[[str], None], intervalo: float = 1.0):
+    """Cria um observador de arquivos para os diretórios.
+
+    Usa o ``watchdog`` (inotify no Linux) quando instalado e, caso contrário, polling.
+    O observador retornado expõe ``start()`` e ``stop()``.
+    """
+    diretorios = list(diretorios)
+    if Observer is None:
+        return ObservadorPolling(diretorios, callback, intervalo)
+
+    # Só eventos que mudam o conteúdo: abrir e fechar sem escrita (inclusive a própria
+    # leitura da recarga) não podem disparar outra recarga
+    tipos_alteracao = {
+        eventos_watchdog.EVENT_TYPE_CREATED,
+        eventos_watchdog.EVENT_TYPE_DELETED,
+        eventos_watchdog.EVENT_TYPE_MODIFIED,
+        eventos_watchdog.EVENT_TYPE_MOVED,
+    }
+
+    class _Manipulador(eventos_watchdog.FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in tipos_alteracao:
+                return
+            for caminho in (event.src_path, getattr(event, "dest_path", "")):
+                if caminho and caminho.endswith(".json"):
+                    callback(caminho)
+
+    observador = Observer()
+    manipulador = _Manipulador()
+    for diretorio in diretorios:
+        observador.schedule(manipulador, diretorio, recursive=False)
+    return observador
+
+
+class Recarregador:
+    """Mantém o snapshot atual e o atualiza incrementalmente quando arquivos mudam."""
+
+    def __init__(
+        self,
+        registro: Optional[RegistroGlossarios] = None,
+        gerenciador: Optional[GerenciadorFaixas] = None,
+        intervalo: float = 1.0,
+    ):
+        """Inicializa o recarregador.
+
+        Args:
+            registro: Registro de fontes de glossário. Se None, usa o registro global.
+            gerenciador: Catálogo de faixas inicial. Se None, carrega o diretório padrão.
+            intervalo: Intervalo em segundos entre varreduras, quando não há inotify.
+        """
+        self.registro = registro if registro is not None else get_registro()
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._fontes: Dict[str, str] = {}
+        self._observador = None
+        self._snapshot = Snapshot(
+            indice=self.registro.indice,
+            gerenciador=gerenciador if gerenciador is not None else GerenciadorFaixas(),
+        )
+
+    @property
+    def atual(self) -> Snapshot:
+        """Retorna o snapshot atual. Uma requisição deve obtê-lo uma vez e usá-lo até o fim."""
+        return self._snapshot
+
+    def observar_fonte(self, namespace: str, diretorio: str, prioridade: int = 0) -> Snapshot:
+        """Registra um diretório de categorias (um JSON por categoria) como fonte observada."""
+        diretorio = os.path.abspath(diretorio)
+        with self._lock:
+            self.registro.registrar(FonteGlossario(namespace, carregar_categorias(diretorio), prioridade))
+            self._fontes[diretorio] = namespace
+            self._publicar(indice=self.registro.indice)
+        if self._observador is not None:
+            # Reinicia o observador para incluir o novo diretório
+            self.parar()
+            self.iniciar()
+        return self._snapshot
+
+    def diretorios_observados(self) -> List[str]:
+        """Retorna os diretórios de faixas e de fontes de glossário observados."""
+        return [os.path.abspath(self._snapshot.gerenciador.diretorio_faixas), *self._fontes]
+
+    def arquivo_alterado(self, caminho: str):
+        """Recarrega um arquivo que foi criado, alterado ou removido.
+
+        Erros de leitura (por exemplo, um arquivo salvo pela metade) mantêm o snapshot atual.
+        Nenhum erro sai deste método: ele roda na thread do observador, que pararia de
+        recarregar sem aviso.
+        """
+        caminho = os.path.abspath(caminho)
+        diretorio = os.path.dirname(caminho)
+        try:
+            with self._lock:
+                if diretorio in self._fontes and caminho.endswith(EXTENSAO_CATEGORIA):
+                    self._recarregar_categoria(self._fontes[diretorio], caminho)
+                elif GerenciadorFaixas.eh_arquivo_faixa(caminho) and diretorio == os.path.abspath(
+                    self._snapshot.gerenciador.diretorio_faixas
+                ):
+                    self._publicar(gerenciador=self._snapshot.gerenciador.recarregar_arquivo(caminho))
+        except (OSError, ValueError, KeyError) as erro:
+            logger.warning("Não foi possível recarregar %s: %s", caminho, erro)
+        except Exception:
+            logger.exception("Erro inesperado ao recarregar %s", caminho)
+
+    def _recarregar_categoria(self, namespace: str, caminho: str):
+        """Substitui uma categoria da fonte e reindexa apenas essa fonte."""
+        fonte = self.registro.get_fonte(namespace)
+        categorias = [c for c in fonte.categorias if os.path.abspath(c.caminho) != caminho]
+        if os.path.exists(caminho):
+            categoria = CategoriaArquivo(caminho)
+            # Lê já na thread de recarga, para que erros não cheguem aos leitores
+            categoria.listar_todos()
+            categorias.append(categoria)
+        categorias.sort(key=lambda c: os.path.basename(c.caminho))
+        self.registro.registrar(FonteGlossario(namespace, categorias, fonte.prioridade))
+        self._publicar(indice=self.registro.indice)
+
+    def _publicar(self, indice: Optional[IndiceGlossario] = None, gerenciador: Optional[GerenciadorFaixas] = None):
+        """Troca o snapshot atual por um novo, reaproveitando o que não mudou."""
+        atual = self._snapshot
+        self._snapshot = Snapshot(
+            indice=indice if indice is not None else atual.indice,
+            gerenciador=gerenciador if gerenciador is not None else atual.gerenciador,
+            versao=atual.versao + 1,
+        )
+
+    def iniciar(self) -> "Recarregador":
+        """Começa a observar os diretórios em segundo plano."""
+        if self._observador is None:
+            self._observador = criar_observador(self.diretorios_observados(), self.arquivo_alterado, self.intervalo)
+            self._observador.start()
+        return self
+
+    def parar(self):
+        """Para de observar os diretórios."""
+        if self._observador is not None:
+            self._observador.stop()
+            self._observador = None
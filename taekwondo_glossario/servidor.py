@@ -0,0 +1,275 @@
+"""API HTTP local do glossário, em JSON, com modo pré-fork para usar vários núcleos.
+
+Rotas (todas GET):
+
+- ``/termos?q=apchagi&max_distance=2&categoria=Acoes&idioma=en``: pesquisa de termos
+- ``/tecnica?nome=Apkubi+momtong+jireugi&max_distance=2&segura=1&idioma=en``: análise de técnica
+- ``/sugestoes?texto=Apkubi+mom``: preenchimento do nome de técnica
+- ``/faixas`` e ``/faixas/<cor>?idioma=en``: faixas e técnicas analisadas de cada uma
+- ``/saude``: pid do processo e versão do índice
+
+Com ``--processos N`` (N > 1), o processo principal carrega e monta tudo o que as
+respostas usam (enumerações, índice, faixas, currículo, pacotes de idioma, análises das
+técnicas das faixas), chama ``gc.freeze()`` e só então cria os processos com ``fork``,
+que atendem o mesmo socket. As páginas desses objetos ficam compartilhadas entre os
+processos (copy-on-write) em vez de cada um montar a sua cópia, e o coletor de lixo dos
+processos filhos não as percorre (nem as suja). Os dados não são recarregados: reinicie o
+servidor para publicar mudanças. ``ferramentas.memoria_processos`` mede a memória
+exclusiva e a compartilhada de cada processo. Uso:
+
+    python -m taekwondo_glossario.servidor --porta 8502 --processos 4
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import signal
+import sys
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .faixas.curriculo import Curriculo, get_curriculo
+from .faixas.faixa import Faixa, GerenciadorFaixas
+from .glossary.autocompletar import get_autocompletar
+from .glossary.busca import buscar_termos
+from .glossary.idiomas import get_indice_idioma, idiomas_disponiveis
+from .glossary.registro import IndiceGlossario, get_registro
+from .glossary.tecnica import TermoEncontrado, analisar_tecnica
+
+logger = logging.getLogger(__name__)
+
+# Número de partes do caminho ``/faixas/<cor>``
+PARTES_ROTA_FAIXA = 2
+
+
+@dataclass(frozen=True)
+class DadosServidor:
+    """Estruturas montadas antes de atender, compartilhadas por todas as requisições."""
+
+    indice: IndiceGlossario
+    gerenciador: GerenciadorFaixas
+    curriculo: Curriculo
+    idiomas: Tuple[str, ...]
+
+
+def preparar(
+    indice: Optional[IndiceGlossario] = None, gerenciador: Optional[GerenciadorFaixas] = None, max_distance: int = 2
+) -> DadosServidor:
+    """Carrega e monta tudo o que as respostas usam, preenchendo os caches do processo.
+
+    Além dos dados, lê todos os pacotes de idioma, monta as listagens de cada categoria em
+    cada idioma, o autocompletar e as análises (com e sem distância segura) das técnicas
+    das faixas, para que nada disso seja montado depois, em cada processo.
+    """
+    indice = indice if indice is not None else get_registro().indice
+    gerenciador = gerenciador if gerenciador is not None else GerenciadorFaixas()
+    idiomas = tuple(idiomas_disponiveis())
+    for idioma in idiomas:
+        get_indice_idioma(indice, idioma)
+        for categoria in (None, *indice.categorias):
+            buscar_termos("", categoria=categoria, indice=indice, idioma=idioma)
+    for nome in gerenciador.tecnicas:
+        for distancia_segura in (False, True):
+            analisar_tecnica(nome, max_distance, indice=indice, distancia_segura=distancia_segura)
+    get_autocompletar(indice, gerenciador.tecnicas)
+    return DadosServidor(indice, gerenciador, get_curriculo(gerenciador, indice), idiomas)
+
+
+def _termo_encontrado(encontrado: TermoEncontrado, traduzir: Callable) -> Dict[str, Any]:
+    termo = traduzir(encontrado.termo)
+    return {
+        "categoria": encontrado.categoria,
+        "coreano": termo["coreano"],
+        "portugues": termo["portugues"],
+        "descricao": termo["descricao"],
+        "distancia": encontrado.distancia,
+        "ambiguo_com": list(encontrado.ambiguo_com),
+    }
+
+
+class API:
+    """Respostas da API para um ``DadosServidor``; cada método recebe os parâmetros da consulta."""
+
+    def __init__(self, dados: DadosServidor):
+        self.dados = dados
+
+    def _traducao(self, idioma: Optional[str]) -> Callable[[Mapping[str, str]], Mapping[str, str]]:
+        indice_idioma = get_indice_idioma(self.dados.indice, idioma)
+        return indice_idioma.localizar if indice_idioma is not None else (lambda termo: termo)
+
+    def _tecnica(self, nome: str, max_distance: int, distancia_segura: bool, idioma: Optional[str]) -> Dict:
+        tecnica = analisar_tecnica(nome, max_distance, indice=self.dados.indice, distancia_segura=distancia_segura)
+        traduzir = self._traducao(idioma)
+        return {"nome": nome, "termos": [_termo_encontrado(t, traduzir) for t in tecnica.get_termos_ordenados()]}
+
+    def termos(self, parametros: Mapping[str, str]) -> List[Dict]:
+        resultados = buscar_termos(
+            parametros.get("q", ""),
+            int(parametros.get("max_distance", 2)),
+            categoria=parametros.get("categoria"),
+            indice=self.dados.indice,
+            idioma=parametros.get("idioma"),
+        )
+        return [{**resultado.termo, "distancia": resultado.distancia} for resultado in resultados]
+
+    def tecnica(self, parametros: Mapping[str, str]) -> Dict:
+        if not parametros.get("nome"):
+            raise ValueError("Parâmetro nome é obrigatório")
+        return self._tecnica(
+            parametros["nome"],
+            int(parametros.get("max_distance", 2)),
+            parametros.get("segura", "0") not in ("", "0"),
+            parametros.get("idioma"),
+        )
+
+    def sugestoes(self, parametros: Mapping[str, str]) -> List[Dict]:
+        autocompletar = get_autocompletar(self.dados.indice, self.dados.gerenciador.tecnicas)
+        return [sugestao._asdict() for sugestao in autocompletar.sugerir(parametros.get("texto", ""))]
+
+    def faixas(self, parametros: Mapping[str, str]) -> List[Dict]:
+        return [
+            {"cor": f.cor, "nome": f.nome, "grau": str(f.grau)} for f in self.dados.gerenciador.get_faixas_ordenadas()
+        ]
+
+    def faixa(self, faixa: Faixa, parametros: Mapping[str, str]) -> Dict:
+        idioma = parametros.get("idioma")
+        return {
+            "cor": faixa.cor,
+            "nome": faixa.nome,
+            "grau": str(faixa.grau),
+            "tecnicas_braco": [self._tecnica(nome, 2, False, idioma) for nome in faixa.tecnicas_braco],
+            "tecnicas_chute": [self._tecnica(nome, 2, False, idioma) for nome in faixa.tecnicas_chute],
+            "programa_acumulado": self.dados.curriculo.programa_acumulado(faixa.cor),
+        }
+
+    def saude(self, parametros: Mapping[str, str]) -> Dict:
+        return {"pid": os.getpid(), "versao": self.dados.indice.versao}
+
+    def responder(self, caminho: str, parametros: Mapping[str, str]) -> Tuple[int, Any]:
+        """Retorna (status HTTP, corpo) de uma requisição.
+
+        Rotas e faixas inexistentes viram 404; erros de parâmetro viram 400.
+        """
+        partes = [unquote(parte) for parte in caminho.strip("/").split("/") if parte]
+        try:
+            if partes == ["faixas"]:
+                return 200, self.faixas(parametros)
+            if len(partes) == PARTES_ROTA_FAIXA and partes[0] == "faixas":
+                try:
+                    faixa = self.dados.gerenciador.get_faixa(partes[1])
+                except ValueError as erro:
+                    return 404, {"erro": str(erro)}
+                return 200, self.faixa(faixa, parametros)
+            if len(partes) == 1 and partes[0] in ("termos", "tecnica", "sugestoes", "saude"):
+                return 200, getattr(self, partes[0])(parametros)
+        except ValueError as erro:
+            return 400, {"erro": str(erro)}
+        return 404, {"erro": f"Rota {caminho} não encontrada"}
+
+
+def criar_handler(api: API) -> type:
+    """Classe de handler HTTP que responde com a ``api`` informada."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            parametros = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+            status, corpo = api.responder(url.path, parametros)
+            dados = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def log_message(self, formato, *args):
+            logger.debug("%s " + formato, self.address_string(), *args)
+
+    return Handler
+
+
+def _atender(servidor: ThreadingHTTPServer):
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+def servir(
+    host: str = "127.0.0.1", porta: int = 8502, processos: int = 1, congelar: bool = True, pre_fork: bool = True
+):
+    """Atende a API até ser interrompido.
+
+    Args:
+        host: Endereço de escuta
+        porta: Porta de escuta
+        processos: Número de processos que atendem o mesmo socket
+        congelar: Se True, chama ``gc.freeze()`` antes do fork (só com mais de um processo)
+        pre_fork: Se True, monta os dados antes do fork, uma única vez; se False, cada
+            processo monta os seus (só para comparação de memória)
+    """
+    if processos > 1 and not hasattr(os, "fork"):
+        raise ValueError("Mais de um processo exige os.fork (Linux ou macOS)")
+
+    # Sem coletas durante a montagem, para não deixar buracos nas páginas que serão compartilhadas
+    gc.disable()
+    dados = preparar() if pre_fork or processos == 1 else None
+    # Sem pré-fork, o handler só é criado em cada processo, depois que ele monta os seus dados
+    servidor = ThreadingHTTPServer((host, porta), criar_handler(API(dados)) if dados is not None else None)
+    if processos == 1:
+        gc.enable()
+        _atender(servidor)
+        return
+
+    if congelar:
+        gc.freeze()
+    filhos = []
+    for _ in range(processos):
+        pid = os.fork()
+        if pid == 0:
+            gc.enable()
+            if dados is None:
+                servidor.RequestHandlerClass = criar_handler(API(preparar()))
+            _atender(servidor)
+            os._exit(0)
+        filhos.append(pid)
+
+    # O processo principal só espera; ao ser encerrado, encerra os filhos
+    servidor.socket.close()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    logger.info("Servidor em http://%s:%d com %d processos: %s", host, porta, processos, filhos)
+    try:
+        for pid in filhos:
+            os.waitpid(pid, 0)
+    except (KeyboardInterrupt, SystemExit):
+        for pid in filhos:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta")
+    parser.add_argument("--porta", type=int, default=8502, help="Porta de escuta")
+    parser.add_argument("--processos", type=int, default=1, help="Processos que atendem o mesmo socket")
+    parser.add_argument("--sem-congelar", action="store_true", help="Não chama gc.freeze() antes do fork")
+    parser.add_argument("--sem-pre-fork", action="store_true", help="Cada processo monta os seus dados")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    servir(args.host, args.porta, args.processos, not args.sem_congelar, not args.sem_pre_fork)
+
+
+if __name__ == "__main__":
+    main()